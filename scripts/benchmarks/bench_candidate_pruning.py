@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+'''
+Shows how pruning flights to the nearest in-band candidates before the
+routeset call shrinks the routeset payload and the request latency.
+
+"before" sends every validated flight (chunked, up to ROUTESET_MAX_CHUNKS);
+"after" sends FlightLogic.nearest_candidates. Latency is modeled as one
+round trip per wave of ROUTESET_MAX_WORKERS concurrent requests, plus the
+measured CPU time to rank the flights and serialize the payloads.
+
+Run from the repository root: python scripts/benchmarks/bench_candidate_pruning.py [--rtt-ms 250]
+'''
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import config
+from models.aircraftModel import AircraftModel
+from services.flightLogic import FlightLogic
+
+SIZES = [50, 300, 1000]
+HOME = config.LOCATION_COORDINATES_DEFAULT
+
+
+def make_flights(count):
+  rng = random.Random(count)
+  return [AircraftModel(
+    hex=f'{i:06x}',
+    flight=f'AAL{i}',
+    lat=HOME[0] + rng.uniform(-4, 4),
+    lon=HOME[1] + rng.uniform(-5, 5),
+    alt_baro=rng.choice([rng.randint(100, 45000), rng.randint(100, 1000)]),
+    t='A320',
+  ) for i in range(count)]
+
+
+def payloads(flights):
+  chunks = [flights[i:i + config.ROUTESET_CHUNK_SIZE] for i in range(0, len(flights), config.ROUTESET_CHUNK_SIZE)]
+  chunks = chunks[:config.ROUTESET_MAX_CHUNKS]
+  return [json.dumps({'planes': [{'callsign': f.flight, 'lat': f.lat, 'lng': f.lon} for f in chunk]})
+          for chunk in chunks]
+
+
+def measure(select, flights, rtt_ms):
+  start = time.perf_counter()
+  bodies = payloads(select(flights))
+  cpu_ms = (time.perf_counter() - start) * 1000
+  waves = math.ceil(len(bodies) / config.ROUTESET_MAX_WORKERS)
+  return sum(len(b) for b in bodies), len(bodies), cpu_ms + waves * rtt_ms
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--rtt-ms', type=float, default=250)
+  args = parser.parse_args()
+
+  unpruned = lambda flights: flights
+  pruned = lambda flights: FlightLogic.nearest_candidates(flights, HOME, config.ROUTESET_CANDIDATE_LIMIT)
+
+  print(f'{"aircraft":>8} | {"before bytes":>12} {"reqs":>4} {"latency":>10} | {"after bytes":>11} {"reqs":>4} {"latency":>10}')
+  for size in SIZES:
+    flights = make_flights(size)
+    before = measure(unpruned, flights, args.rtt_ms)
+    after = measure(pruned, flights, args.rtt_ms)
+    print(f'{size:>8} | {before[0]:>12} {before[1]:>4} {before[2]:>7.1f} ms | {after[0]:>11} {after[1]:>4} {after[2]:>7.1f} ms')
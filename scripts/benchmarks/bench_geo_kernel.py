@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+'''
+Compares per-aircraft scalar distance/bearing calls against the batched
+GeoUtils kernels for 1k and 10k aircraft.
+
+Run from the repository root: python scripts/benchmarks/bench_geo_kernel.py
+'''
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import utils.geoUtils as geoUtils
+from utils.geoUtils import GeoUtils
+
+SIZES = [1000, 10000]
+HOME = [41.8755616, -87.6244212]
+
+
+def scalar(lats, lons):
+  distances = [GeoUtils.distance_miles(lat, lon, HOME) for lat, lon in zip(lats, lons)]
+  bearings = [GeoUtils.bearing(lat, lon, HOME) for lat, lon in zip(lats, lons)]
+  return distances, bearings
+
+
+def batched(lats, lons):
+  return GeoUtils.distances_miles(lats, lons, HOME), GeoUtils.bearings(lats, lons, HOME)
+
+
+def bench(func, lats, lons):
+  timer = timeit.Timer(lambda: func(lats, lons))
+  loops, _ = timer.autorange()
+  return min(timer.repeat(repeat=3, number=loops)) / loops
+
+
+if __name__ == '__main__':
+  if geoUtils.np is None:
+    print('NumPy is not installed; the batched kernels fall back to the scalar loop.')
+
+  print(f'{"aircraft":>8} {"scalar":>12} {"batched":>12} {"speedup":>9}')
+  for size in SIZES:
+    rng = random.Random(size)
+    lats = [HOME[0] + rng.uniform(-4, 4) for _ in range(size)]
+    lons = [HOME[1] + rng.uniform(-5, 5) for _ in range(size)]
+    scalar_s = bench(scalar, lats, lons)
+    batched_s = bench(batched, lats, lons)
+    print(f'{size:>8} {scalar_s * 1000:>9.3f} ms {batched_s * 1000:>9.3f} ms {scalar_s / batched_s:>8.1f}x')
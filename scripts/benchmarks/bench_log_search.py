@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+'''
+Times tracker log searches over a simulated three-week log (2 million
+entries by default) in both formats search_log.py reads: the SQLite log and
+a JSON Lines file. For comparison it also loads the first LOAD_ALL_ROWS
+lines into a list, the way the old search script json.load-ed log.json
+(loading millions that way would take several GB).
+
+Times are measured untraced. "peak" is the most memory Python allocated
+during a second, traced run (tracemalloc); it stays flat for a streaming
+search however large the log is. Tracing slows the JSON Lines scans down a
+lot, so their peak is measured on one query.
+
+Run from the repository root: python scripts/benchmarks/bench_log_search.py [--rows N]
+'''
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from services.logSearch import LogQuery, search
+from services.sqliteLogBackend import COLUMNS, SqliteLogBackend
+
+START_MS = 1_700_000_000_000
+WEEKS = 3
+LOAD_ALL_ROWS = 250_000
+AIRLINES = ['UAL', 'AAL', 'DAL', 'SWA', 'SKW', 'ENY', 'RPA', 'JBU', 'ASA', 'FFT']
+TYPES = ['B738', 'B739', 'A320', 'A321', 'E75L', 'CRJ9', 'B77W', 'B789', 'A20N', 'C172']
+
+QUERIES = [
+  ('callsign UAL123', LogQuery(callsign='UAL123')),
+  ('callsign prefix SWA', LogQuery(callsign='SWA')),
+  ('registration', LogQuery(registration='N00042')),
+  ('one hour', LogQuery(since_ms=START_MS + 86_400_000, until_ms=START_MS + 90_000_000)),
+  ('type + one day', LogQuery(aircraft_type='B789', since_ms=START_MS, until_ms=START_MS + 86_400_000)),
+  ('altitude band', LogQuery(min_altitude=40000, max_altitude=41000)),
+]
+
+
+def generate(rows):
+  rng = random.Random(rows)
+  step_ms = WEEKS * 7 * 86_400_000 // rows
+  for i in range(rows):
+    airline = rng.choice(AIRLINES)
+    yield {
+      'callsign': f'{airline}{rng.randint(1, 2999)}', 'timestamp': START_MS + i * step_ms,
+      'expires_at': START_MS // 1000 + WEEKS * 7 * 86_400 + 604_800,
+      'hex': f'{rng.randint(0, 0xffffff):06x}', 'r': f'N{rng.randint(0, 9999):05d}', 't': rng.choice(TYPES),
+      'lat': round(41.9 + rng.uniform(-1, 1), 4), 'lon': round(-87.6 + rng.uniform(-1, 1), 4),
+      'alt_baro': rng.randint(1000, 41000), 'gs': float(rng.randint(150, 520)), 'track': float(rng.randint(0, 359)),
+    }
+
+
+def build(directory, rows):
+  db_path = os.path.join(directory, 'log.db')
+  jsonl_path = os.path.join(directory, 'log.jsonl')
+  SqliteLogBackend(db_path).close()
+  connection = sqlite3.connect(db_path)
+  insert = f'INSERT INTO tracker_log ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})'
+  with open(jsonl_path, 'w') as jsonl, connection:
+    batch = []
+    for item in generate(rows):
+      jsonl.write(json.dumps(item) + '\n')
+      batch.append(tuple(item.get(column) for column in COLUMNS))
+      if len(batch) == 10_000:
+        connection.executemany(insert, batch)
+        batch.clear()
+    connection.executemany(insert, batch)
+  connection.close()
+  return db_path, jsonl_path
+
+
+def timed(run):
+  start = time.perf_counter()
+  count = run()
+  return count, time.perf_counter() - start
+
+
+def peak_memory(run):
+  tracemalloc.start()
+  run()
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return peak
+
+
+def load_all(path, query):
+  with open(path, 'r') as file:
+    entries = [json.loads(line) for line, _ in zip(file, range(LOAD_ALL_ROWS))]
+  return sum(1 for item in entries if item['callsign'].startswith(query.callsign))
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--rows', type=int, default=2_000_000)
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as directory:
+    start = time.perf_counter()
+    db_path, jsonl_path = build(directory, args.rows)
+    print(f'Built {args.rows:,} entries over {WEEKS} weeks in {time.perf_counter() - start:.0f} s: '
+          f'log.db {os.path.getsize(db_path) / 2**20:.0f} MB, log.jsonl {os.path.getsize(jsonl_path) / 2**20:.0f} MB')
+    print()
+    print(f'{"query":<20} {"matches":>8} {"sqlite":>9} {"peak":>8} {"jsonl":>8}')
+    for name, query in QUERIES:
+      count, sqlite_s = timed(lambda: sum(1 for _ in search(db_path, query)))
+      sqlite_peak = peak_memory(lambda: sum(1 for _ in search(db_path, query)))
+      _, jsonl_s = timed(lambda: sum(1 for _ in search(jsonl_path, query)))
+      print(f'{name:<20} {count:>8} {sqlite_s * 1e3:>7.1f}ms {sqlite_peak / 2**10:>6.0f}KB {jsonl_s:>7.2f}s')
+
+    query = QUERIES[0][1]
+    print()
+    print(f'jsonl stream, {QUERIES[0][0]}: peak {peak_memory(lambda: sum(1 for _ in search(jsonl_path, query))) / 2**20:.2f} MB')
+    count, load_s = timed(lambda: load_all(jsonl_path, query))
+    load_peak = peak_memory(lambda: load_all(jsonl_path, query))
+    print(f'jsonl load first {LOAD_ALL_ROWS:,}, {QUERIES[0][0]}: {load_s:.2f} s, peak {load_peak / 2**20:.0f} MB')
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+'''
+Times loading every logo at the display's scale, the work the logo cache's
+loader thread does on a miss: opening and inflating each PNG in the logo
+directory versus slicing it out of the memory-mapped atlas. The atlas is
+built into a temporary directory first, from the same sources as
+scripts/build_logo_atlas.py.
+
+Run from the repository root: python scripts/benchmarks/bench_logo_atlas.py
+'''
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from build_logo_atlas import DEFAULT_SOURCES, read_logos
+from PIL import Image
+from services.logoAtlas import LogoAtlas, compile_logo_atlas
+from services.logoCache import LOGO_DIR
+from setup import screen
+
+
+def from_png(name):
+  with Image.open(os.path.join(LOGO_DIR, f'{name}.png')) as image:
+    return image.convert('RGB')
+
+
+def timed(load, names):
+  start = time.perf_counter()
+  for name in names:
+    load(name)
+  return (time.perf_counter() - start) / len(names)
+
+
+if __name__ == '__main__':
+  names = sorted(name[:-4] for name in os.listdir(LOGO_DIR) if name.endswith('.png'))
+  sources = {scale: read_logos(next(p for p in paths if os.path.exists(p)))
+             for scale, paths in DEFAULT_SOURCES.items() if any(os.path.exists(p) for p in paths)}
+
+  with tempfile.TemporaryDirectory() as directory:
+    target = os.path.join(directory, 'logos.atlas')
+    start = time.perf_counter()
+    count = compile_logo_atlas(sources, target)
+    build_s = time.perf_counter() - start
+    print(f'atlas: {count} logos, {os.path.getsize(target) / 1e6:.1f} MB, built in {build_s:.2f} s')
+
+    start = time.perf_counter()
+    atlas = LogoAtlas(target)
+    open_s = time.perf_counter() - start
+
+    png = min(timed(from_png, names) for _ in range(3))
+    mapped = min(timed(lambda name: atlas.get(name, screen.SCALE_FACTOR), names) for _ in range(3))
+    del atlas
+
+  print(f'{len(names)} logos at scale {screen.SCALE_FACTOR} ({LOGO_DIR})')
+  print(f'{"png":<6} {png * 1e6:>7.1f} us per logo')
+  print(f'{"atlas":<6} {mapped * 1e6:>7.1f} us per logo ({png / mapped:.0f}x), {open_s * 1e3:.2f} ms to map')
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+'''
+Times what the logo scene does on a reset for a day's worth of airlines:
+opening and decoding the PNG from the logo directory, as it used to, versus
+looking up the decoded logo in LogoCache. Also reports how many bytes the
+cache holds and how long the startup preload takes on the loader thread.
+
+Run from the repository root: python scripts/benchmarks/bench_logo_cache.py
+'''
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import config
+from PIL import Image
+from services.logoCache import LOGO_DIR, LogoCache
+
+RESETS = 2000
+AIRLINES = 60
+
+
+def from_disk(icao):
+  try:
+    image = Image.open(f'{LOGO_DIR}/{icao}.png')
+  except FileNotFoundError:
+    image = Image.open(f'{LOGO_DIR}/default.png')
+  return image.convert('RGB')
+
+
+if __name__ == '__main__':
+  rng = random.Random(AIRLINES)
+  logos = sorted(name[:-4] for name in os.listdir(LOGO_DIR) if name.endswith('.png'))
+  airlines = config.LOGO_PRELOAD + rng.sample(logos, AIRLINES - len(config.LOGO_PRELOAD))
+  # Busy airlines show up far more often than the rest
+  resets = rng.choices(airlines, weights=[1 / (rank + 1) for rank in range(len(airlines))], k=RESETS)
+
+  start = time.perf_counter()
+  cache = LogoCache()
+  cache.join()
+  preload_s = time.perf_counter() - start
+  for icao in airlines:
+    cache.prefetch(icao)
+  cache.join()
+
+  disk = min(timeit.repeat(lambda: [from_disk(icao) for icao in resets], number=1, repeat=3)) / RESETS
+  cached = min(timeit.repeat(lambda: [cache.get(icao) for icao in resets], number=1, repeat=3)) / RESETS
+
+  print(f'preload of {len(config.LOGO_PRELOAD)} logos: {preload_s * 1000:.1f} ms (loader thread)')
+  print(f'cache: {len(cache)} logos, {cache.size_bytes / 1024:.0f} KB of {config.LOGO_CACHE_MAX_BYTES / 1024:.0f} KB')
+  print(f'{"from disk":<10} {disk * 1e6:>8.1f} us per reset')
+  print(f'{"cached":<10} {cached * 1e6:>8.1f} us per reset ({disk / cached:.0f}x)')
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+'''
+Counts the drawing work Display does for one simulated minute (600 frames)
+in two situations: an idle clock with no flights, and one flight scrolling
+its details. The scenes and keyframes are Display's own, driven the way
+Animator.play drives them but without the sleep. They draw through the
+real graphics module onto a canvas that only counts pixels (a SetImage
+counts the pixels it copies), into a matrix that counts swaps.
+
+Run from the repository root: python scripts/benchmarks/bench_render.py [--src PATH]
+(--src points it at another checkout's src/, e.g. to compare with an older commit)
+'''
+import argparse
+import os
+import sys
+import time
+
+FRAMES = 600
+
+FLIGHT = {
+  'callsign': 'UAL1234', 'registration': 'N12345', 'plane': 'B738', 'ground_speed': 452, 'altitude': 35000,
+  'direction': 'NE', 'distance': 4.21, 'owner_icao': 'UAL', 'airline': 'United', 'origin': 'ORD', 'destination': 'DEN',
+  'distance_origin': 12.3, 'distance_destination': 880.1,
+}
+
+
+class CountingCanvas:
+  def __init__(self, width, height):
+    self.width = width
+    self.height = height
+    self.pixels = 0
+
+  def SetPixel(self, x, y, r, g, b):
+    self.pixels += 1
+
+  def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+    width = min(image.width, self.width - offset_x) - max(0, -offset_x)
+    height = min(image.height, self.height - offset_y) - max(0, -offset_y)
+    self.pixels += max(width, 0) * max(height, 0)
+
+  def Clear(self):
+    pass
+
+
+class CountingMatrix:
+  def __init__(self):
+    self.brightness = 100
+    self.swaps = 0
+
+  def SwapOnVSync(self, canvas):
+    self.swaps += 1
+    return canvas
+
+  def SetImage(self, image):
+    pass
+
+
+class StubOverhead:
+  def __init__(self, snapshot):
+    self.snapshot = snapshot
+
+
+def make_display(display_module, snapshot):
+  display = display_module.Display.__new__(display_module.Display)
+  display.matrix = CountingMatrix()
+  display.canvas = CountingCanvas(display_module.screen.WIDTH, display_module.screen.HEIGHT)
+  if hasattr(display_module, 'DirtyRegions'):
+    display._dirty = display_module.DirtyRegions(display_module.screen.WIDTH, display_module.screen.HEIGHT)
+  if hasattr(display_module, 'TextSpriteCache'):
+    display._text_sprites = display_module.TextSpriteCache(display_module.config.TEXT_SPRITE_CACHE_SIZE)
+  display._data_index = 0
+  display._data = []
+  display._snapshot_sequence = 0
+  display.overhead = StubOverhead(snapshot)
+  super(display_module.Display, display).__init__()
+  return display
+
+
+def play(display, frames):
+  for frame in range(frames):
+    for keyframe in display.keyframes:
+      properties = keyframe.properties
+      if frame == 0:
+        if properties['divisor'] == 0:
+          keyframe()
+      elif properties['divisor'] and not ((frame - properties['offset']) % properties['divisor']):
+        if keyframe(properties['count']):
+          properties['count'] = 0
+        else:
+          properties['count'] += 1
+
+
+def run(display_module, overhead_module, data):
+  snapshot = overhead_module.OverheadSnapshot(sequence=1, data=tuple(data))
+  display = make_display(display_module, snapshot)
+  start = time.process_time()
+  play(display, FRAMES)
+  return time.process_time() - start, display.canvas.pixels, display.matrix.swaps
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--src', type=str, default=os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+  args = parser.parse_args()
+
+  sys.path.insert(0, os.path.abspath(args.src))
+  import display as display_module
+  from workers import overhead as overhead_module
+
+  print(f'{"scene":<16} {"cpu / minute":>13} {"pixels set":>11} {"swaps":>6}')
+  for name, data in [('idle clock', []), ('one flight', [FLIGHT])]:
+    cpu, pixels, swaps = run(display_module, overhead_module, data)
+    print(f'{name:<16} {cpu * 1e3:>11.1f}ms {pixels:>11} {swaps:>6}')
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+'''
+Compares the old nested-loop routeset merge against the dictionary join in
+services.adsbTracker.merge_routes for 50, 500 and 5000 aircraft.
+
+Run from the repository root: python scripts/benchmarks/bench_routeset_merge.py
+'''
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from models.aircraftModel import AircraftModel
+from services.adsbTracker import merge_routes
+
+SIZES = [50, 500, 5000]
+ROUTED_FRACTION = 0.8
+
+
+def nested_loop_merge(flights, routes):
+  merged_data = []
+  for flight in flights:
+    for route in routes:
+      if flight.flight == route['callsign'].strip():
+        merged_data.append({'flight': flight, 'route': route})
+  return merged_data
+
+
+def make_data(count):
+  rng = random.Random(count)
+  flights = [AircraftModel(flight=f'{rng.choice(["AAL", "UAL", "DAL", "SWA"])}{i}', lat=41.9, lon=-87.9)
+             for i in range(count)]
+  routed = rng.sample(flights, int(count * ROUTED_FRACTION))
+  routes = [{'callsign': f.flight, '_airports': ['ORD', 'JFK'], 'plausible': 1} for f in routed]
+  return flights, routes
+
+
+def bench(func, flights, routes):
+  timer = timeit.Timer(lambda: func(flights, routes))
+  loops, _ = timer.autorange()
+  return min(timer.repeat(repeat=3, number=loops)) / loops
+
+
+if __name__ == '__main__':
+  print(f'{"aircraft":>8} {"nested loop":>14} {"dict join":>12} {"speedup":>9}')
+  for size in SIZES:
+    flights, routes = make_data(size)
+    assert nested_loop_merge(flights, routes) == merge_routes(flights, routes)
+    nested = bench(nested_loop_merge, flights, routes)
+    joined = bench(merge_routes, flights, routes)
+    print(f'{size:>8} {nested * 1000:>11.3f} ms {joined * 1000:>9.3f} ms {nested / joined:>8.0f}x')
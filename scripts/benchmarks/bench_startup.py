@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+'''
+Records what the AWS clients cost at startup. Each step runs in a fresh
+interpreter, reporting its wall time and how much it grew peak RSS:
+
+  import boto3           - the module import alone
+  dynamodb resource      - boto3.resource('dynamodb').Table(...), as the tracker log builds it
+  secretsmanager client  - boto3.client('secretsmanager'), as the authentication service builds it
+  TrackerLog + auth      - importing and constructing TrackerLog and AuthenticationService,
+                           which leave boto3 unimported until the first write or token lookup
+
+No requests are sent; dummy credentials are enough to build the clients.
+
+Run from the repository root: python scripts/benchmarks/bench_startup.py
+'''
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src')
+REPEAT = 5
+
+SETUP_BOTO3 = 'import boto3'
+CLIENT_ARGS = "aws_access_key_id='x', aws_secret_access_key='x', region_name='us-east-2'"
+
+STEPS = [
+  ('import boto3', '', 'import boto3'),
+  ('dynamodb resource', SETUP_BOTO3, f"boto3.resource('dynamodb', {CLIENT_ARGS}).Table('tracker_log')"),
+  ('secretsmanager client', SETUP_BOTO3, f"boto3.client('secretsmanager', {CLIENT_ARGS})"),
+  ('TrackerLog + auth', 'import config',
+   'from services.trackerLog import TrackerLog; from services.authentication import AuthenticationService; '
+   'TrackerLog(); AuthenticationService()'),
+]
+
+# Prints the step's time in seconds, its peak RSS growth in KB, and whether boto3 ended up imported
+HARNESS = '''
+import resource, sys, time
+sys.path.insert(0, {src!r})
+{setup}
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{step}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss, 'boto3' in sys.modules)
+'''
+
+
+def run(setup, step):
+  output = subprocess.run([sys.executable, '-c', HARNESS.format(src=SRC, setup=setup, step=step)],
+                          check=True, capture_output=True, text=True).stdout.split()
+  return float(output[0]), int(output[1]), output[2] == 'True'
+
+
+if __name__ == '__main__':
+  print(f'{"step":<22} {"time":>9} {"peak RSS":>10} {"boto3 loaded":>13}')
+  for name, setup, step in STEPS:
+    results = [run(setup, step) for _ in range(REPEAT)]
+    elapsed = min(r[0] for r in results)
+    rss_kb = min(r[1] for r in results)
+    print(f'{name:<22} {elapsed * 1e3:>7.1f}ms {rss_kb / 1024:>8.1f}MB {str(results[0][2]):>13}')
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+'''
+Simulates an hour of traffic and counts tracker log writes with and without
+delta mode. Each entry is under 1 KB, so one write is one DynamoDB WCU.
+
+About 60 aircraft are in range at any time, each for 10-25 minutes. Most
+fly straight and level; a quarter are climbing, descending or turning, as
+they would around an airport.
+
+Run from the repository root: python scripts/benchmarks/bench_tracker_log_delta.py
+'''
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import config
+from models.aircraftModel import AircraftModel
+from services.deltaFilter import DeltaFilter, KNOTS_TO_MPH, MILES_PER_DEGREE_LAT
+
+HOME = config.LOCATION_COORDINATES_DEFAULT
+DURATION_S = 3600
+IN_RANGE = 60
+POLL_INTERVALS = [15, 42]
+
+
+class SimulatedFlight:
+  def __init__(self, rng, index, start_s):
+    self.hex = f'{index:06x}'
+    self.start_s = start_s
+    self.end_s = start_s + rng.uniform(600, 1500)
+    self.lat = HOME[0] + rng.uniform(-1, 1)
+    self.lon = HOME[1] + rng.uniform(-1, 1)
+    self.alt = rng.choice([8000, 24000, 36000])
+    self.gs = rng.uniform(250, 500)
+    self.track = rng.uniform(0, 360)
+    maneuvering = rng.random() < 0.25
+    self.climb_fpm = rng.choice([-1500, 1500, 0]) if maneuvering else 0
+    self.turn_dps = rng.choice([-1.0, 1.0, 0]) if maneuvering else 0
+
+  def advance(self, seconds):
+    miles = self.gs * KNOTS_TO_MPH * seconds / 3600
+    self.lat += miles * math.cos(math.radians(self.track)) / MILES_PER_DEGREE_LAT
+    self.lon += miles * math.sin(math.radians(self.track)) / (MILES_PER_DEGREE_LAT * math.cos(math.radians(self.lat)))
+    self.alt = max(1000, self.alt + self.climb_fpm * seconds / 60)
+    self.track = (self.track + self.turn_dps * seconds) % 360
+
+  def sighting(self):
+    return AircraftModel(hex=self.hex, flight=f'AAL{self.hex}', lat=self.lat, lon=self.lon,
+                         alt_baro=int(self.alt), gs=self.gs, track=self.track,
+                         baro_rate=self.climb_fpm if self.alt > 1000 else 0)
+
+
+def simulate(poll_s, delta):
+  rng = random.Random(poll_s)
+  flights = [SimulatedFlight(rng, i, -rng.uniform(0, 600)) for i in range(IN_RANGE)]
+  next_index = IN_RANGE
+  writes = 0
+
+  for now_s in range(0, DURATION_S, poll_s):
+    for flight in flights:
+      flight.advance(poll_s)
+    # Replace aircraft that left the area
+    for i, flight in enumerate(flights):
+      if now_s >= flight.end_s:
+        flights[i] = SimulatedFlight(rng, next_index, now_s)
+        next_index += 1
+
+    now_ms = now_s * 1000
+    if delta:
+      delta.prune(now_ms)
+    for flight in flights:
+      if delta is None or delta.should_write(flight.sighting(), now_ms):
+        writes += 1
+  return writes
+
+
+if __name__ == '__main__':
+  print(f'{"poll":>6} {"every poll":>11} {"delta mode":>11} {"reduction":>10}')
+  for poll_s in POLL_INTERVALS:
+    baseline = simulate(poll_s, None)
+    delta = DeltaFilter(heartbeat_ms=config.TRACKER_LOG_HEARTBEAT_MINUTES * 60 * 1000,
+                        position_threshold=config.TRACKER_LOG_POSITION_THRESHOLD,
+                        altitude_threshold=config.TRACKER_LOG_ALTITUDE_THRESHOLD,
+                        speed_threshold=config.TRACKER_LOG_SPEED_THRESHOLD)
+    filtered = simulate(poll_s, delta)
+    print(f'{poll_s:>5}s {baseline:>7} WCU {filtered:>7} WCU {baseline / filtered:>9.1f}x')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+'''
+Compares tracker log item size and conversion time for three ways of
+building an item from one adsb.lol aircraft:
+
+  raw dict      - the whole decoded aircraft through the recursive
+                  _floats_to_decimal, as the log used to write it
+  all fields    - every AircraftModel field through _floats_to_decimal
+                  (TRACKER_LOG_FIELDS = None)
+  projected     - the configured TRACKER_LOG_FIELDS through the flat
+                  _to_item converter, with TRACKER_LOG_DECIMALS rounding
+
+Item size follows DynamoDB's rules: attribute name bytes plus value bytes,
+with numbers costing about one byte per two significant digits plus one.
+Each 1 KB (or part of it) of an item is one WCU.
+
+Run from the repository root: python scripts/benchmarks/bench_tracker_log_items.py
+'''
+import math
+import os
+import random
+import sys
+import timeit
+
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import config
+from models.aircraftModel import AircraftModel
+from services.trackerLog import _floats_to_decimal, _to_item
+
+AIRCRAFT = 500
+TIMESTAMP = 1_700_000_000_000
+
+
+def make_raw(rng, i):
+  return {
+    'hex': f'{i:06x}', 'type': 'adsb_icao', 'flight': f'UAL{i:<5}', 'r': f'N{i:05d}', 't': 'B738',
+    'dbFlags': 0, 'alt_baro': rng.randint(1000, 41000), 'alt_geom': rng.randint(1000, 41000),
+    'gs': rng.uniform(150, 520), 'ias': rng.randint(150, 320), 'tas': rng.randint(150, 480), 'mach': rng.uniform(0.3, 0.82),
+    'wd': rng.randint(0, 359), 'ws': rng.randint(0, 120), 'oat': rng.randint(-60, 20), 'tat': rng.randint(-40, 30),
+    'track': rng.uniform(0, 360), 'track_rate': rng.uniform(-2, 2), 'roll': rng.uniform(-25, 25),
+    'mag_heading': rng.uniform(0, 360), 'true_heading': rng.uniform(0, 360),
+    'baro_rate': rng.choice([0, -64, 1408, -1600]), 'geom_rate': rng.choice([0, -32, 1376, -1568]),
+    'squawk': f'{rng.randint(0, 7777):04d}', 'emergency': 'none', 'category': 'A3',
+    'nav_qnh': rng.uniform(990, 1030), 'nav_altitude_mcp': rng.randint(1000, 41000), 'nav_heading': rng.uniform(0, 360),
+    'nav_modes': ['autopilot', 'vnav', 'lnav', 'tcas'],
+    'lat': config.LOCATION_COORDINATES_DEFAULT[0] + rng.uniform(-1, 1),
+    'lon': config.LOCATION_COORDINATES_DEFAULT[1] + rng.uniform(-1, 1),
+    'nic': 8, 'rc': 186, 'seen_pos': rng.uniform(0, 2), 'version': 2, 'nic_baro': 1, 'nac_p': 9, 'nac_v': 1,
+    'sil': 3, 'sil_type': 'perhour', 'gva': 2, 'sda': 2, 'alert': 0, 'spi': 0,
+    'mlat': [], 'tisb': [], 'messages': rng.randint(100, 100000), 'seen': rng.uniform(0, 2),
+    'rssi': rng.uniform(-30, -3), 'dst': rng.uniform(0, 70), 'dir': rng.uniform(0, 360),
+  }
+
+
+def stamp(item, callsign):
+  item['callsign'] = callsign
+  item['timestamp'] = TIMESTAMP
+  item['timestamp_readable'] = '2023-11-14T22:13:20'
+  item['expires_at'] = TIMESTAMP // 1000 + config.TRACKER_LOG_TTL_HOURS * 3600
+  return item
+
+
+def raw_path(raw, aircraft):
+  return stamp(_floats_to_decimal(raw), raw['flight'].strip())
+
+
+def all_fields_path(raw, aircraft):
+  return stamp(_floats_to_decimal(aircraft.to_dict()), aircraft.flight)
+
+
+def projected_path(raw, aircraft):
+  return stamp(_to_item(aircraft, tuple(config.TRACKER_LOG_FIELDS), config.TRACKER_LOG_DECIMALS), aircraft.flight)
+
+
+def value_size(value):
+  if isinstance(value, str):
+    return len(value.encode('utf-8'))
+  if isinstance(value, bool) or value is None:
+    return 1
+  if isinstance(value, (int, Decimal)):
+    digits = len(Decimal(value).normalize().as_tuple().digits)
+    return math.ceil(digits / 2) + 1
+  if isinstance(value, list):
+    return 3 + sum(value_size(v) + 1 for v in value)
+  if isinstance(value, dict):
+    return 3 + sum(len(k) + value_size(v) + 1 for k, v in value.items())
+  raise TypeError(type(value))
+
+
+def item_size(item):
+  return sum(len(name.encode('utf-8')) + value_size(value) for name, value in item.items())
+
+
+if __name__ == '__main__':
+  rng = random.Random(AIRCRAFT)
+  raws = [make_raw(rng, i) for i in range(AIRCRAFT)]
+  aircraft = [AircraftModel.from_json(raw) for raw in raws]
+
+  print(f'{"path":<11} {"avg bytes":>10} {"WCU":>4} {"per item":>10}')
+  for name, path in [('raw dict', raw_path), ('all fields', all_fields_path), ('projected', projected_path)]:
+    sizes = [item_size(path(raw, model)) for raw, model in zip(raws, aircraft)]
+    timer = timeit.Timer(lambda: [path(raw, model) for raw, model in zip(raws, aircraft)])
+    loops, _ = timer.autorange()
+    per_item = min(timer.repeat(repeat=3, number=loops)) / loops / AIRCRAFT
+    avg = sum(sizes) / len(sizes)
+    print(f'{name:<11} {avg:>10.0f} {math.ceil(max(sizes) / 1024):>4} {per_item * 1e6:>7.2f} us')
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+'''
+Times SqliteLogBackend.write for a batch of projected tracker log items
+(TRACKER_LOG_BATCH_SIZE of them, as the write-behind queue hands over), in
+a temporary database. Reports the cost per batch and per entry.
+
+Run from the repository root: python scripts/benchmarks/bench_tracker_log_sqlite.py
+'''
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import config
+from models.aircraftModel import AircraftModel
+from services.sqliteLogBackend import SqliteLogBackend
+from services.trackerLog import _to_item
+
+TIMESTAMP = 1_700_000_000_000
+
+
+def make_batch(rng, offset):
+  items = []
+  for i in range(config.TRACKER_LOG_BATCH_SIZE):
+    aircraft = AircraftModel(hex=f'{i:06x}', flight=f'UAL{i}', r=f'N{i:05d}', t='B738',
+                             lat=config.LOCATION_COORDINATES_DEFAULT[0] + rng.uniform(-1, 1),
+                             lon=config.LOCATION_COORDINATES_DEFAULT[1] + rng.uniform(-1, 1),
+                             alt_baro=rng.randint(1000, 41000), alt_geom=rng.randint(1000, 41000),
+                             gs=rng.uniform(150, 520), track=rng.uniform(0, 360), baro_rate=0)
+    item = _to_item(aircraft, tuple(config.TRACKER_LOG_FIELDS), config.TRACKER_LOG_DECIMALS)
+    item['callsign'] = aircraft.flight
+    item['timestamp'] = TIMESTAMP + offset
+    item['timestamp_readable'] = '2023-11-14T22:13:20'
+    item['expires_at'] = TIMESTAMP // 1000 + config.TRACKER_LOG_TTL_HOURS * 3600
+    items.append(item)
+  return items
+
+
+if __name__ == '__main__':
+  rng = random.Random(0)
+  with tempfile.TemporaryDirectory() as directory:
+    backend = SqliteLogBackend(os.path.join(directory, 'log.db'))
+    batch = make_batch(rng, 0)
+    offset = iter(range(1, 10**9))
+    # A fresh timestamp per call so every write is an insert, not a replace
+    timer = timeit.Timer(lambda: backend.write([dict(item, timestamp=TIMESTAMP + next(offset)) for item in batch]))
+    loops, _ = timer.autorange()
+    per_batch = min(timer.repeat(repeat=3, number=loops)) / loops
+    backend.close()
+
+  print(f'batch of {config.TRACKER_LOG_BATCH_SIZE}: {per_batch * 1e3:.3f} ms')
+  print(f'per entry:   {per_batch / config.TRACKER_LOG_BATCH_SIZE * 1e6:.1f} us')
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+'''
+Compiles src/app_data/airlines.json into the binary table used by the
+airline lookup service. The service recompiles on its own when the JSON
+changes; this is for building the table ahead of time (e.g. on a dev box
+before copying to a read-only Pi image).
+
+Run from the repository root.
+'''
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from services.airlineLookup import COMPILED_FILE, LOOKUP_FILE, compile_airline_db
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--source', type=str, default=LOOKUP_FILE)
+  parser.add_argument('--target', type=str, default=COMPILED_FILE)
+  args = parser.parse_args()
+
+  count = compile_airline_db(args.source, args.target)
+  print(f'Compiled {count} airlines into {args.target} ({os.path.getsize(args.target)} bytes)')
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+'''
+Packs the airline logos into the atlas read by the logo cache (logos.atlas
+by default). Each scale is read from a directory of PNGs or a tar archive of
+them; .tar.zst archives are piped through the zstd command. Logos that are
+missing from a scale, or aren't (16 * scale) pixels square, are resized from
+the largest file there is for them, so no separate resize step is needed.
+
+Run from the repository root:
+  python scripts/build_logo_atlas.py
+  python scripts/build_logo_atlas.py --scale 3=logos_3x.tar.zst --target logos.atlas
+'''
+import argparse
+import os
+import subprocess
+import sys
+import tarfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from services.logoAtlas import ATLAS_FILE, SCALES, compile_logo_atlas
+
+DEFAULT_SOURCES = {1: ['logos'], 2: ['logos_2x'], 3: ['logos_3x', 'logos_3x.tar.zst']}
+
+
+def _read_directory(path):
+  files = {}
+  for entry in os.scandir(path):
+    if entry.is_file() and entry.name.endswith('.png'):
+      with open(entry.path, 'rb') as f:
+        files[entry.name[:-4]] = f.read()
+  return files
+
+
+def _read_tar(archive):
+  files = {}
+  for member in archive:
+    name = os.path.basename(member.name)
+    if member.isfile() and name.endswith('.png'):
+      files[name[:-4]] = archive.extractfile(member).read()
+  return files
+
+
+def read_logos(path):
+  if os.path.isdir(path):
+    return _read_directory(path)
+  if path.endswith('.zst'):
+    with subprocess.Popen(['zstd', '-dc', path], stdout=subprocess.PIPE) as zstd:
+      with tarfile.open(fileobj=zstd.stdout, mode='r|') as archive:
+        files = _read_tar(archive)
+    if zstd.returncode:
+      raise RuntimeError(f'zstd failed to decompress {path}')
+    return files
+  with tarfile.open(path) as archive:
+    return _read_tar(archive)
+
+
+def _scale_source(value):
+  scale, _, path = value.partition('=')
+  if not scale.isdigit() or int(scale) not in SCALES or not path:
+    raise argparse.ArgumentTypeError(f'expected SCALE=PATH with SCALE one of {SCALES}')
+  return int(scale), path
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--scale', type=_scale_source, action='append', default=[], metavar='SCALE=PATH',
+                      help='logo directory or archive for a scale; defaults to logos, logos_2x and logos_3x[.tar.zst]')
+  parser.add_argument('--target', type=str, default=ATLAS_FILE)
+  args = parser.parse_args()
+
+  paths = dict(args.scale)
+  for scale, candidates in DEFAULT_SOURCES.items():
+    if scale not in paths:
+      existing = [path for path in candidates if os.path.exists(path)]
+      if existing:
+        paths[scale] = existing[0]
+
+  sources = {}
+  for scale, path in sorted(paths.items()):
+    sources[scale] = read_logos(path)
+    print(f'Scale {scale}: {len(sources[scale])} logos from {path}')
+
+  # Stamped into the atlas so the tracker can tell when a source has changed since
+  source_mtime_ns = max(os.stat(path).st_mtime_ns for path in paths.values())
+  count = compile_logo_atlas(sources, args.target, source_mtime_ns)
+  print(f'Packed {count} logos into {args.target} ({os.path.getsize(args.target)} bytes)')
@@ -1,32 +1,60 @@
+#!/usr/bin/env python3
+'''
+Searches the tracker log and prints matching entries as JSON lines, oldest
+first. Reads the SQLite log by default (TRACKER_LOG_BACKEND = 'sqlite');
+pass --log with a .jsonl file (e.g. the spill file) to stream that instead.
+
+  python scripts/search_log.py --callsign UAL --since 2024-05-01 --min-alt 30000
+
+Run from the repository root.
+'''
 import argparse
 import json
 import os
+import sqlite3
 import sys
 
-LOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'tracker_log', 'log.json')
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import config
+from services.logSearch import LogQuery, search
 
-def get_data() -> dict:
-  try:
-    with open(LOG_PATH, 'r') as file:
-      data = json.load(file)
-      return data
-  except FileNotFoundError:
-    return None
+
+def epoch_ms(value: str):
+  return int(datetime.fromisoformat(value).timestamp() * 1000)
 
 
 if __name__ == '__main__':
   parser = argparse.ArgumentParser()
-  parser.add_argument('--callsign', type=str)
+  parser.add_argument('--log', type=str, default=config.TRACKER_LOG_DB_FILE)
+  parser.add_argument('--callsign', type=str, help='callsign or callsign prefix')
+  parser.add_argument('--registration', type=str)
+  parser.add_argument('--type', type=str, help='ICAO type code, e.g. B738')
+  parser.add_argument('--since', type=epoch_ms, help='local ISO date/time, inclusive')
+  parser.add_argument('--until', type=epoch_ms, help='local ISO date/time, exclusive')
+  parser.add_argument('--min-alt', type=int)
+  parser.add_argument('--max-alt', type=int)
+  parser.add_argument('--limit', type=int)
+  parser.add_argument('--count', action='store_true', help='print only the number of matches')
   args = parser.parse_args()
-  
-  callsign = args.callsign
-  data = get_data()
-  
-  if data:
-    entry = data.get(callsign)
-    if entry:
-      print(json.dumps(entry, indent=2))
+
+  query = LogQuery(callsign=args.callsign, registration=args.registration, aircraft_type=args.type,
+                   since_ms=args.since, until_ms=args.until, min_altitude=args.min_alt, max_altitude=args.max_alt)
+  try:
+    results = search(args.log, query, limit=args.limit)
+    if args.count:
+      print(sum(1 for _ in results))
     else:
-      print(f"Entry not found for callsign {callsign}.")
-  else:
-    print("No data found.")
\ No newline at end of file
+      found = 0
+      for entry in results:
+        print(json.dumps(entry))
+        found += 1
+      if not found:
+        print('No matching entries.', file=sys.stderr)
+  except FileNotFoundError:
+    print(f'No log found at {args.log}.', file=sys.stderr)
+    sys.exit(1)
+  except sqlite3.DatabaseError:
+    print(f'{args.log} is not a tracker log database. JSON Lines logs must end in .jsonl.', file=sys.stderr)
+    sys.exit(1)
@@ -7,6 +7,26 @@ LOG_FILE = "logs/plane-tracker.log"
 
 TRACKER_LOG_FILE = "tracker_log/log.json"
 TRACKER_LOG_TTL_HOURS = 168 # 1 week
+TRACKER_LOG_BACKEND = 'dynamodb' # or 'sqlite' to keep the log locally, with no AWS account needed
+TRACKER_LOG_DB_FILE = "tracker_log/log.db" # used by the sqlite backend
+TRACKER_LOG_PRUNE_MINUTES = 60 # how often the sqlite backend deletes expired entries
+TRACKER_LOG_QUEUE_SIZE = 2000 # entries buffered in memory for the background writer
+TRACKER_LOG_BATCH_SIZE = 25 # entries per DynamoDB batch write (API limit)
+TRACKER_LOG_FLUSH_SECONDS = 10 # longest an entry waits for its batch to fill
+TRACKER_LOG_MAX_RETRIES = 3 # retries for a failed or throttled batch
+TRACKER_LOG_RETRY_BASE_SECONDS = 1 # doubled on each retry
+TRACKER_LOG_OVERFLOW = 'drop_oldest' # when the queue is full: drop_oldest, drop_newest or spill
+TRACKER_LOG_SPILL_FILE = '' # e.g. "tracker_log/spill.jsonl" to keep entries that couldn't be written, one JSON object per line. They are never re-sent; read them with scripts/search_log.py --log. Empty to drop them
+TRACKER_LOG_SPILL_MAX_MB = 50 # entries are dropped instead of spilled once the spill file reaches this size
+TRACKER_LOG_DELTA_MODE = True # only log aircraft that are new, changed course, altitude or speed, or are due a heartbeat
+TRACKER_LOG_HEARTBEAT_MINUTES = 5 # longest gap between entries for an aircraft still in range
+TRACKER_LOG_POSITION_THRESHOLD = 1 # miles away from where the last entry's speed and track predicted
+TRACKER_LOG_ALTITUDE_THRESHOLD = 500 # feet
+TRACKER_LOG_SPEED_THRESHOLD = 25 # knots
+# Aircraft fields written to each entry (callsign, timestamps and expiry are always written).
+# 'flight' is left out since it's already the callsign. None writes every field.
+TRACKER_LOG_FIELDS = ['hex', 'r', 't', 'lat', 'lon', 'alt_baro', 'alt_geom', 'gs', 'track', 'baro_rate']
+TRACKER_LOG_DECIMALS = {'lat': 4, 'lon': 4, 'gs': 0, 'track': 0} # decimal places kept per float field (1 if not listed)
 
 DISTANCE_UNITS = "imperial"
 CLOCK_FORMAT = "24hr" #use 12hr or 24hr
@@ -26,6 +46,9 @@ GPIO_SLOWDOWN = 4 # TODO - depends what Pi you have I use 2 for Pi 3 and 1 for P
 JOURNEY_CODE_SELECTED = "xxx"
 JOURNEY_BLANK_FILLER = " ? "
 HAT_PWM_ENABLED = False
+TEXT_SPRITE_CACHE_SIZE = 32 # rendered strings kept for the scrolling flight details
+LOGO_CACHE_MAX_BYTES = 1024 * 1024 # decoded logos kept in memory, about 340 at 32x32
+LOGO_PRELOAD = ['UAL', 'AAL', 'SWA', 'DAL', 'SKW', 'ENY', 'RPA', 'ASH', 'JIA', 'NKS', 'FFT', 'ASA', 'JBU', 'FDX', 'UPS', 'GJS', 'EDV'] # airlines whose logos are decoded at startup
 
 ZIP_CODE = "60657"
 COUNTRY = "USA"
@@ -38,7 +61,24 @@ RADIUS = 70 # nautical miles
 LOCATION_COORDINATES_DEFAULT = [41.8755616, -87.6244212] # Chicago, IL
 
 DUPLICATION_AVOIDANCE_TTL = 3 # minutes
+POLL_INTERVAL = 42 # seconds between flight polls with normal traffic
+POLL_INTERVAL_FLOOR = 15 # seconds, shortest interval during busy periods
+POLL_INTERVAL_CEILING = 180 # seconds, used when the sky is empty or at night
+POLL_BUSY_AIRCRAFT = 60 # aircraft in range above which polling speeds up
+POLL_BUSY_TURNOVER = 0.3 # fraction of newly seen aircraft per poll above which polling speeds up
+POLL_JITTER = 0.1 # +/- fraction of each poll delay, so polls don't line up with other clients
+POLL_BACKOFF_BASE = 5 # seconds before retrying a failed poll, doubling per consecutive failure
+POLL_BACKOFF_MAX = 300 # seconds
+POLL_METRICS_LOG_MINUTES = 15 # how often the chosen poll interval, its reason and the poller's state are logged
 ROUTESET_LIMIT_SECONDS = 1 # second
+ROUTESET_CANDIDATE_LIMIT = 40 # nearest in-band planes considered for a routeset lookup
+ROUTESET_CHUNK_SIZE = 20 # planes per routeset request (API limit)
+ROUTESET_MAX_CHUNKS = 5 # closest 100 planes at most
+ROUTESET_MAX_WORKERS = 2 # concurrent routeset requests
+ROUTESET_DEADLINE_SECONDS = 5 # chunks still in flight after this are left out of the current cycle
+ROUTE_CACHE_TTL = 30 # minutes
+ROUTE_NEGATIVE_CACHE_TTL = 5 # minutes, for callsigns with no plausible route
+ROUTE_CACHE_MAX_ENTRIES = 500
 
 # TODO: Once the adsb.lol API requires a key, update the secret with the key, and update this field accordingly.
 RAPIDAPI_TOKEN_KEYNAME = 'rapidapi_key'
@@ -48,6 +88,8 @@ AWS_REGION = 'us-east-2' # Ohio
 
 ADSB_API_SECRET_NAME = '' # TODO: update this value to include the secret name from AWS secrets.
 ADSB_LOL_URL = 'api.adsb.lol'
+ADSB_MAX_CONNECTIONS = 2 # kept-alive connections per host
+ADSB_CONNECTION_IDLE_TIMEOUT = 60 # seconds before an idle connection is discarded
 
 RAPIDAPI_KEY_NAME = 'plane_tracker_api_key'
 RAPIDAPI_HOST = 'forward-reverse-geocoding.p.rapidapi.com'
\ No newline at end of file
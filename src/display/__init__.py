@@ -1,5 +1,8 @@
+import config
 import sys
 from datetime import datetime
+from display.dirtyRegions import DirtyRegions
+from display.textSprites import TextSpriteCache
 from setup import frames, screen
 from workers.animator import Animator
 from workers.overhead import Overhead
@@ -65,6 +68,8 @@ def adjust_brightness(matrix):
   if matrix.brightness != new_brightness:
     # Update the brightness
     matrix.brightness = new_brightness
+    return True
+  return False
     
 class Display(
   FlightDetailsScene,
@@ -97,14 +102,17 @@ class Display(
     # Setup canvas
     self.canvas = self.matrix.CreateFrameCanvas()
     self.canvas.Clear()
+    self._dirty = DirtyRegions(screen.WIDTH, screen.HEIGHT)
+    self._text_sprites = TextSpriteCache(config.TEXT_SPRITE_CACHE_SIZE)
 
     # Data to render
     self._data_index = 0
     self._data = []
+    self._snapshot_sequence = 0
 
     # Start Looking for planes
     self.overhead = Overhead()
-    self.overhead.grab_data()
+    self.overhead.start()
 
     # Initalise animator and scenes
     super().__init__()
@@ -113,24 +121,50 @@ class Display(
     # Animator or Scenes
     self.delay = frames.PERIOD
 
+  # Fills columns x0 to x1 - 1 and rows y0 to y1, one line per row: bands are
+  # much wider than they are tall
   def draw_square(self, x0, y0, x1, y1, colour):
-    for x in range(x0, x1):
-      _ = graphics.DrawLine(self.canvas, x, y0, x, y1, colour)
+    if x1 <= x0:
+      return
+    for y in range(y0, y1 + 1):
+      _ = graphics.DrawLine(self.canvas, x0, y, x1 - 1, y, colour)
+    self.mark_dirty(x0, y0, x1, y1 + 1)
+
+  # Scenes call this for whatever they draw outside draw_square, so the frame gets shown
+  def mark_dirty(self, x0, y0, x1, y1):
+    self._dirty.mark(x0, y0, x1, y1)
+
+  # Marks text drawn with its baseline at y and the given length
+  def mark_text_dirty(self, font, x, y, length):
+    top = y - font.baseline
+    self._dirty.mark(x, top, x + length, top + font.height)
+
+  # Draws text with its baseline at y by copying a cached sprite, rather than setting
+  # each glyph's pixels. Returns the text's length. See TextSpriteCache for `pad`.
+  def draw_text_sprite(self, font, x, y, text, colour, numeric_colour=None, pad=0):
+    sprite = self._text_sprites.get(font, text, colour, numeric_colour, pad)
+    top = y - font.baseline
+    self.canvas.SetImage(sprite.image, x, top)
+    self._dirty.mark(x, top, x + sprite.image.width, top + font.height)
+    return sprite.width
 
   @Animator.KeyFrame.add(0, scene_name="display")
   def clear_screen(self):
     # First operation after
     # a screen reset
     self.canvas.Clear()
+    self._dirty.mark_all()
 
   @Animator.KeyFrame.add(frames.PER_SECOND * 5, scene_name="display")
   def check_for_loaded_data(self, count):
-    if self.overhead.new_data:
-      # Check if there's data
-      there_is_data = len(self._data) > 0 or not self.overhead.data_is_empty
+    # The poller publishes a new snapshot after every poll; reading it never blocks
+    snapshot = self.overhead.snapshot
+    if snapshot.sequence != self._snapshot_sequence:
+      self._snapshot_sequence = snapshot.sequence
+      new_data = list(snapshot.data)
 
-      # this marks self.overhead.data as no longer new
-      new_data = self.overhead.data
+      # Check if there's data
+      there_is_data = len(self._data) > 0 or len(new_data) > 0
 
       # See if this matches the data already on the screen
       # This test only checks if it's 2 lists with the same
@@ -151,34 +185,21 @@ class Display(
       if reset_required:
         self.reset_scene()
     
-    elif len(self.overhead.data) == 0:
-      self._data = self.overhead.data
+    elif len(snapshot.data) == 0 and len(self._data):
+      self._data = []
       self.reset_scene()
 
 
   @Animator.KeyFrame.add(1, scene_name="display")
   def sync(self, count):
-    # Redraw screen every frame
-    _ = self.matrix.SwapOnVSync(self.canvas)
-
     # Adjust brightness
-    adjust_brightness(self.matrix)
-
-  @Animator.KeyFrame.add(frames.PER_SECOND * 42, offset=frames.PER_SECOND * 7, scene_name="display")
-  def grab_new_data(self, count):
-    # Only grab data if we're not already searching
-    # for planes, or if there's new data available
-    # which hasn't been displayed.
-    #
-    # We also need wait until all previously grabbed
-    # data has been looped through the display.
-    #
-    # Last, if our internal store of the data
-    # is empty, try and grab data
-    if not (self.overhead.processing and self.overhead.new_data) and (
-      self._data_all_looped or len(self._data) <= 1
-    ):
-      self.overhead.grab_data()
+    if adjust_brightness(self.matrix):
+      self._dirty.mark_all()
+
+    # Only show the frame if a scene changed something
+    if self._dirty:
+      _ = self.matrix.SwapOnVSync(self.canvas)
+      self._dirty.clear()
 
   def run(self):
     try:
@@ -188,4 +209,5 @@ class Display(
 
     except KeyboardInterrupt:
       print("Exiting\n")
+      self.overhead.stop()
       sys.exit(0)
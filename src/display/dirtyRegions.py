@@ -0,0 +1,54 @@
+'''
+Tracks which parts of the canvas changed since the last frame was shown.
+
+Scenes mark the rectangles they clear or draw into, and Display only swaps
+the canvas onto the matrix when something was marked. A frame where nothing
+changed (e.g. the clock between minutes) therefore costs no drawing and no
+wait for vsync. Rectangles are half-open, [x0, x1) x [y0, y1), and clipped
+to the screen. Overlapping ones are merged into their bounding box, so no
+pixel is in two regions.
+'''
+class DirtyRegions:
+  def __init__(self, width, height):
+    self._width = width
+    self._height = height
+    self._regions: list[tuple[int, int, int, int]] = []
+
+  def mark(self, x0, y0, x1, y1):
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(x1, self._width), min(y1, self._height)
+    if x1 <= x0 or y1 <= y0:
+      return
+
+    # Growing the rectangle can make it overlap one already passed over, so repeat until it doesn't
+    regions = self._regions
+    merged = True
+    while merged:
+      merged = False
+      kept = []
+      for region in regions:
+        if region[0] < x1 and x0 < region[2] and region[1] < y1 and y0 < region[3]:
+          x0, y0 = min(x0, region[0]), min(y0, region[1])
+          x1, y1 = max(x1, region[2]), max(y1, region[3])
+          merged = True
+        else:
+          kept.append(region)
+      regions = kept
+    self._regions = regions + [(x0, y0, x1, y1)]
+
+  def mark_all(self):
+    self._regions = [(0, 0, self._width, self._height)]
+
+  def clear(self):
+    self._regions = []
+
+  @property
+  def regions(self):
+    return list(self._regions)
+
+  @property
+  def area(self):
+    return sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in self._regions)
+
+  def __bool__(self):
+    return bool(self._regions)
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+from PIL import Image
+from setup import fonts
+from setup.bdf import BdfFont
+
+
+class TextSprite(NamedTuple):
+  image: Image.Image
+  width: int  # advance width of the text, without the padding
+
+
+'''
+Rendered strings, so text that's redrawn every frame (the scrolling flight
+details) is rasterized once and then copied onto the canvas with SetImage.
+
+A sprite is as tall as its font, with the font's baseline `font.baseline`
+rows from the top, and is opaque: `pad` black columns on its right erase
+what the text covered when it was drawn `pad` pixels further right. Sprites
+are keyed by (font, text, colours, pad) and the least recently used one is
+dropped once there are more than `max_entries`.
+'''
+class TextSpriteCache:
+  def __init__(self, max_entries):
+    self._max_entries = max_entries
+    self._sprites: OrderedDict[tuple, TextSprite] = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  # Characters that are numeric are drawn in numeric_colour, if there is one
+  def get(self, font, text: str, colour, numeric_colour=None, pad=0) -> TextSprite:
+    key = (font, text, _rgb(colour), None if numeric_colour is None else _rgb(numeric_colour), pad)
+    sprite = self._sprites.get(key)
+    if sprite is not None:
+      self._sprites.move_to_end(key)
+      self.hits += 1
+      return sprite
+
+    self.misses += 1
+    sprite = render_text(fonts.bdf(font), text, colour, numeric_colour, pad)
+    self._sprites[key] = sprite
+    if len(self._sprites) > self._max_entries:
+      self._sprites.popitem(last=False)
+    return sprite
+
+  def __len__(self):
+    return len(self._sprites)
+
+
+def render_text(font: BdfFont, text: str, colour, numeric_colour=None, pad=0) -> TextSprite:
+  glyphs = [(ch, font.glyph(ord(ch))) for ch in text]
+  width = sum(glyph.advance for _, glyph in glyphs if glyph)
+  image = Image.new('RGB', (width + pad, font.height))
+  pixels = image.load()
+
+  x = 0
+  for ch, glyph in glyphs:
+    if glyph is None:
+      continue
+    rgb = _rgb(numeric_colour if numeric_colour is not None and ch.isnumeric() else colour)
+    top = font.baseline - glyph.height - glyph.y_offset
+    for glyph_x, glyph_y in glyph.pixels():
+      px, py = x + glyph_x, top + glyph_y
+      if 0 <= px < image.width and 0 <= py < image.height:
+        pixels[px, py] = rgb
+    x += glyph.advance
+  return TextSprite(image, width)
+
+
+def _rgb(colour):
+  return (colour.red, colour.green, colour.blue)
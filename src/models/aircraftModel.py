@@ -0,0 +1,56 @@
+BLANK_FIELDS = ["", "N/A", "NONE", "UNKNOWN"]
+
+_TEXT_FIELDS = ('hex', 'flight', 'r', 't')
+_NUMERIC_FIELDS = ('lat', 'lon', 'alt_baro', 'alt_geom', 'gs', 'track', 'baro_rate', 'geom_rate')
+
+
+class AircraftModel:
+  '''
+  The subset of an adsb.lol aircraft entry that the app uses, built once
+  when the /v2/point response is decoded.
+
+  Text fields are stripped, and placeholder values ('N/A', 'UNKNOWN', ...)
+  are normalized to ''. Numeric fields missing from the feed are None.
+  '''
+  __slots__ = _TEXT_FIELDS + _NUMERIC_FIELDS
+
+  def __init__(self, hex='', flight='', r='', t='', lat=None, lon=None, alt_baro=None, alt_geom=None,
+               gs=None, track=None, baro_rate=None, geom_rate=None):
+    self.hex: str = hex
+    self.flight: str = flight
+    self.r: str = r
+    self.t: str = t
+    self.lat: float | None = lat
+    self.lon: float | None = lon
+    self.alt_baro: int | None = alt_baro
+    self.alt_geom: int | None = alt_geom
+    self.gs: float | None = gs
+    self.track: float | None = track
+    self.baro_rate: int | None = baro_rate
+    self.geom_rate: int | None = geom_rate
+
+  @classmethod
+  def from_json(cls, raw: dict):
+    aircraft = cls.__new__(cls)
+    for field in _TEXT_FIELDS:
+      value = raw.get(field)
+      value = value.strip() if isinstance(value, str) else ''
+      setattr(aircraft, field, '' if value.upper() in BLANK_FIELDS else value)
+    for field in _NUMERIC_FIELDS:
+      setattr(aircraft, field, raw.get(field))
+    return aircraft
+
+  # Barometric rate when available, geometric rate otherwise
+  @property
+  def vertical_speed(self):
+    if self.baro_rate is not None:
+      return self.baro_rate
+    if self.geom_rate is not None:
+      return self.geom_rate
+    return 0
+
+  def to_dict(self):
+    return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+
+  def __repr__(self):
+    return f'AircraftModel(hex={self.hex!r}, flight={self.flight!r}, alt_baro={self.alt_baro!r})'
@@ -75,8 +75,12 @@ class ClockScene(object):
       # else:
       clock_color = NIGHT_COLOUR
 
+      # Nothing to draw until the minute changes
+      if current_time == self._last_time:
+        return
+
       if self._last_time:
-        _ = graphics.DrawText(
+        length = graphics.DrawText(
           self.canvas,
           CLOCK_FONT,
           CLOCK_POSITION[0],
@@ -84,13 +88,20 @@ class ClockScene(object):
           colours.BLACK,
           self._last_time,
         )
+        self.mark_text_dirty(CLOCK_FONT, CLOCK_POSITION[0], CLOCK_POSITION[1], length)
       self._last_time = current_time
 
-      _ = graphics.DrawText(
+      length = graphics.DrawText(
         self.canvas,
         CLOCK_FONT,
         CLOCK_POSITION[0],
         CLOCK_POSITION[1],
         clock_color,
         current_time,
-      )
\ No newline at end of file
+      )
+      self.mark_text_dirty(CLOCK_FONT, CLOCK_POSITION[0], CLOCK_POSITION[1], length)
+
+  @Animator.KeyFrame.add(0, scene_name="clock")
+  def reset_clock(self):
+    # The screen was just cleared, so the clock has to be drawn again
+    self._last_time = None
\ No newline at end of file
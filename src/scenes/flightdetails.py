@@ -1,13 +1,12 @@
 from workers.animator import Animator
 from setup import colours, fonts, screen
 
-from services.matrix_service import graphics
-
 # Setup
 FLIGHT_NO_DISTANCE_FROM_TOP = 24 * screen.SCALE_FACTOR
 PLANE_DISTANCE_FROM_TOP = 31 * screen.SCALE_FACTOR
 FLIGHT_NO_TEXT_HEIGHT = 8 * screen.SCALE_FACTOR  # based on font size
 FLIGHT_NO_FONT = fonts.small
+SCROLL_STEP = 1 * screen.SCALE_FACTOR
 
 FLIGHT_NUMBER_ALPHA_COLOUR = colours.BLUE_LIGHT
 FLIGHT_NUMBER_NUMERIC_COLOUR = colours.TROPICAL_YELLOW
@@ -33,23 +32,6 @@ class FlightDetailsScene(object):
     if len(self._data) == 0:
       return
 
-    # Clear the whole area (extended to ensure all text fragments are cleared)
-    self.draw_square(
-      0,
-      FLIGHT_NO_DISTANCE_FROM_TOP - FLIGHT_NO_TEXT_HEIGHT,
-      screen.WIDTH,
-      FLIGHT_NO_DISTANCE_FROM_TOP + 2,
-      colours.BLACK,
-    )
-
-    self.draw_square(
-      0,
-      PLANE_DISTANCE_FROM_TOP - FLIGHT_NO_TEXT_HEIGHT,
-      screen.WIDTH,
-      PLANE_DISTANCE_FROM_TOP + 2,
-      colours.BLACK,
-    )
-
     # Draw flight number if available
     flight_no_text_length = 0
     plane_details_text_length = 0
@@ -82,27 +64,26 @@ class FlightDetailsScene(object):
       # full_text = f'{flight_no}\n{plane_name_text}{distance_text}'
       plane_details_text = f'{plane_name_text}{distance_text}{altitude_text}{speed_text}'
 
-      for ch in flight_no:
-        ch_length = graphics.DrawText(
-          self.canvas,
-          FLIGHT_NO_FONT,
-          self.flight_position + flight_no_text_length,
-          FLIGHT_NO_DISTANCE_FROM_TOP,
-          FLIGHT_NUMBER_NUMERIC_COLOUR if ch.isnumeric() else FLIGHT_NUMBER_ALPHA_COLOUR,
-          ch,
-        )
-        flight_no_text_length += ch_length
-      
-      # for ch in plane_details_text:
-      plane_details_text_length = graphics.DrawText(
-        self.canvas,
+      # Each line is rendered once and copied in at the scroll position. The sprites' black
+      # padding erases the columns the text left behind, so the lines need no clearing.
+      flight_no_text_length = self.draw_text_sprite(
+        FLIGHT_NO_FONT,
+        self.flight_position,
+        FLIGHT_NO_DISTANCE_FROM_TOP,
+        flight_no,
+        FLIGHT_NUMBER_ALPHA_COLOUR,
+        numeric_colour=FLIGHT_NUMBER_NUMERIC_COLOUR,
+        pad=SCROLL_STEP,
+      )
+
+      plane_details_text_length = self.draw_text_sprite(
         FLIGHT_NO_FONT,
-        self.flight_position + plane_details_text_length,
+        self.flight_position,
         PLANE_DISTANCE_FROM_TOP,
-        colours.TROPICAL_ORANGE,
         plane_details_text,
+        colours.TROPICAL_ORANGE,
+        pad=SCROLL_STEP,
       )
-        # plane_details_text_length += ch_length
 
       text_length = max(plane_details_text_length, flight_no_text_length)
 
@@ -132,7 +113,7 @@ class FlightDetailsScene(object):
     self.flight_details_length = flight_no_text_length
 
     # Handle scrolling
-    self.flight_position -= 1 * screen.SCALE_FACTOR
+    self.flight_position -= SCROLL_STEP
     if self.flight_position + text_length < 0:
       self.flight_position = screen.WIDTH
       # if len(self._data) > 1:
@@ -104,34 +104,12 @@ class JourneyScene(object):
     right_start_x = JOURNEY_POSITION[0] + JOURNEY_WIDTH // 2
     right_end_x = min(JOURNEY_POSITION[0] + JOURNEY_WIDTH, screen.WIDTH * screen.SCALE_FACTOR)
     
-    # Calculate actual text widths by measuring
-    distance_origin_text_length = 0
-    origin_x_positions = []
-    for ch in distance_origin_text:
-      ch_length = graphics.DrawText(
-        self.canvas,
-        DISTANCE_FONT,
-        0,  # Dummy position for measurement
-        0,  # Dummy position
-        DISTANCE_COLOUR,
-        ch,
-      )
-      origin_x_positions.append(ch_length)
-      distance_origin_text_length += ch_length
-    
-    distance_destination_text_length = 0
-    destination_x_positions = []
-    for ch in distance_destination_text:
-      ch_length = graphics.DrawText(
-        self.canvas,
-        DISTANCE_FONT,
-        0,  # Dummy position for measurement
-        0,  # Dummy position
-        DISTANCE_COLOUR,
-        ch,
-      )
-      destination_x_positions.append(ch_length)
-      distance_destination_text_length += ch_length
+    # Measure the text from the font's glyph widths
+    origin_x_positions = fonts.char_widths(DISTANCE_FONT, distance_origin_text)
+    distance_origin_text_length = sum(origin_x_positions)
+
+    destination_x_positions = fonts.char_widths(DISTANCE_FONT, distance_destination_text)
+    distance_destination_text_length = sum(destination_x_positions)
     
     # Center the text within available space
     left_available_width = left_end_x - left_start_x
@@ -1,14 +1,36 @@
-import http.client
 import config
 import json
 import logging
 import time
 
+from concurrent.futures import ThreadPoolExecutor, wait
+from models.aircraftModel import AircraftModel
+from services.connectionPool import ConnectionPool
+from services.routeCache import RouteCache
+from utils.jsonStream import JsonStream
 from utils.timeUtils import TimeUtils
 from http import HTTPStatus
 
 EMPTY_ROUTESET = []
 
+
+# Pairs each flight with its route by callsign, preserving the order of flights.
+def merge_routes(flights, routes):
+  routes_by_callsign = {}
+  for route in routes:
+    routes_by_callsign.setdefault(route['callsign'].strip(), route)
+
+  merged_data = []
+  for flight in flights:
+    route = routes_by_callsign.get(flight.flight)
+    if route is not None:
+      merged_data.append({
+        'flight': flight,
+        'route': route
+      })
+  return merged_data
+
+
 class AdsbTrackerService():
   def __init__(self):
     self.logger = logging.getLogger(config.APP_NAME)
@@ -16,6 +38,14 @@ class AdsbTrackerService():
       self._default_routeset = json.load(f)
     
     self._routeset_timestamp = TimeUtils.current_time_milli()
+    self._pool = ConnectionPool(max_per_host=config.ADSB_MAX_CONNECTIONS,
+                                idle_timeout=config.ADSB_CONNECTION_IDLE_TIMEOUT)
+    self._route_cache = RouteCache(ttl_minutes=config.ROUTE_CACHE_TTL,
+                                   max_entries=config.ROUTE_CACHE_MAX_ENTRIES)
+    self._unroutable_cache = RouteCache(ttl_minutes=config.ROUTE_NEGATIVE_CACHE_TTL,
+                                        max_entries=config.ROUTE_CACHE_MAX_ENTRIES)
+    self._routeset_executor = ThreadPoolExecutor(max_workers=config.ROUTESET_MAX_WORKERS,
+                                                 thread_name_prefix='routeset')
 
   def decode_response_payload(self, data: bytes):
     try:
@@ -42,100 +72,150 @@ class AdsbTrackerService():
   
 
   # Gets nearby flights given a latitude, longitude, and radius in nautical miles.
+  # The 'ac' array is decoded one aircraft at a time as the body streams in, so the
+  # raw body and the full parsed document are never held in memory. Each aircraft is
+  # reduced to an AircraftModel as soon as it is decoded.
   def get_nearby_flights(self, lat, long, radius, timeout=15):
     self.logger.info(f'Getting nearby flights')
 
     try:
-      conn = http.client.HTTPSConnection(config.ADSB_LOL_URL, timeout=timeout)
-      conn.request('GET',
-                    self._get_nearby_flight_url(lat, long, radius),
-                    '',
-                    self._get_headers())
-      response = conn.getresponse()
-
-      if response.status != HTTPStatus.OK:
-        self.logger.error(f'Error getting flights. Response code: {response.status}')
-        return None
-      
-      data = self.decode_response_payload(response.read())
+      with self._pool.request(config.ADSB_LOL_URL,
+                              'GET',
+                              self._get_nearby_flight_url(lat, long, radius),
+                              '',
+                              self._get_headers(),
+                              timeout=timeout) as response:
+        if response.status != HTTPStatus.OK:
+          self.logger.error(f'Error getting flights. Response code: {response.status}')
+          return None
 
-      if data is None or 'ac' not in data:
-        return None
-      
-      try:
         filter_field = 'alt_baro'
-        data = [x for x in data['ac'] if filter_field in x and type(x[filter_field]) is int]
-      except KeyError as e:
-        with open('error_log.json', 'w') as f:
-          json.dump(data, f)
-        return None
+        aircraft = JsonStream(response.read).array_items('ac')
+        data = [AircraftModel.from_json(x) for x in aircraft if type(x.get(filter_field)) is int]
 
-      conn.close()
+        # Drain the trailing fields so the connection can be reused
+        response.read()
 
       # return sorted(data, key=lambda x: x['dst'])
       return data
 
+    except KeyError:
+      return None
+
+    except json.JSONDecodeError as e:
+      self.logger.error(f'Error decoding response payload: {e}')
+      return None
+
     except Exception as e:
       self.logger.error(f'Error getting nearby flights: {e}')
-      try: # attempt to close the connection if it's open
-        conn.close()
-      except Exception:
-        pass
       return None
 
 
-  # Attempts to get the routes of a list of flights by callsign.
-  def get_routeset(self, flights, timeout=15):
+  # Posts a single routeset request. Returns the routes that resolved to at least one airport,
+  # or None if the request failed.
+  def _fetch_routes(self, flights, timeout):
     payload = {'planes': []}
     
-    for flight in flights[:20]:
-      callsign = flight['flight']
-      lat = flight['lat']
-      long = flight['lon']
+    for flight in flights:
       payload['planes'].append({
-        'callsign': callsign.strip(),
-        'lat': lat,
-        'lng': long
+        'callsign': flight.flight,
+        'lat': flight.lat,
+        'lng': flight.lon
       })
   
     try:
-      conn = http.client.HTTPSConnection(config.ADSB_LOL_URL, timeout=timeout)
-      conn.request('POST',
-                        self._get_routeset_url(),
-                        json.dumps(payload),
-                        self._get_headers())
-      
-      response = conn.getresponse()
-      
-      if response.status != HTTPStatus.OK:
-        self.logger.error(f'Error getting flight routeset. Response code: {response.status}')
-        try:
-          conn.close()
-        except Exception:
-          pass
-        return EMPTY_ROUTESET
-
-      data = self.decode_response_payload(response.read())
-
-      conn.close()
-      
-      data = [x for x in data if x['_airports'] and len(x['_airports']) > 0]
-      
-      merged_data = []
-      for flight in flights:
-        for route in data:
-          if flight['flight'].strip() == route['callsign'].strip():
-            merged_data.append({
-              'flight': flight,
-              'route': route
-            })
-      return merged_data
+      with self._pool.request(config.ADSB_LOL_URL,
+                              'POST',
+                              self._get_routeset_url(),
+                              json.dumps(payload),
+                              self._get_headers(),
+                              timeout=timeout) as response:
+        if response.status != HTTPStatus.OK:
+          self.logger.error(f'Error getting flight routeset. Response code: {response.status}')
+          return None
+
+        data = self.decode_response_payload(response.read())
       
+      return [x for x in data if x['_airports'] and len(x['_airports']) > 0]
       
     except Exception as e:
       self.logger.error(f'Error getting routeset: {e}')
-      try: # attempt to close the connection if it's open
-        conn.close()
-      except Exception:
-        pass
-      return EMPTY_ROUTESET
+      return None
+
+
+  # Plausible routes go into the route cache. Callsigns that came back without airports,
+  # with an implausible route, or not at all go into the shorter-lived unroutable cache.
+  def _cache_routes(self, requested, fetched):
+    resolved = set()
+    for route in fetched:
+      if route.get('plausible'):
+        self._route_cache.put(route['callsign'], route)
+        resolved.add(route['callsign'].strip().upper())
+
+    for flight in requested:
+      if flight.flight.upper() not in resolved:
+        self._unroutable_cache.put(flight.flight, {})
+
+
+  # Runs on the routeset worker pool. Results are cached here rather than by the caller
+  # so that a chunk finishing after the deadline still benefits the next poll.
+  def _fetch_and_cache_routes(self, flights, timeout):
+    fetched = self._fetch_routes(flights, timeout)
+    if fetched is not None:
+      self._cache_routes(flights, fetched)
+    return fetched
+
+
+  # Splits the flights into routeset-sized chunks (closest first, as ordered by the caller)
+  # and fetches them concurrently. Returns the routes from every chunk that completed
+  # within the deadline, or None if none of them succeeded.
+  def _fetch_routes_concurrently(self, flights, timeout):
+    chunk_size = config.ROUTESET_CHUNK_SIZE
+    chunks = [flights[i:i + chunk_size] for i in range(0, len(flights), chunk_size)]
+    chunks = chunks[:config.ROUTESET_MAX_CHUNKS]
+
+    futures = [self._routeset_executor.submit(self._fetch_and_cache_routes, chunk, timeout) for chunk in chunks]
+    done, not_done = wait(futures, timeout=config.ROUTESET_DEADLINE_SECONDS)
+    for future in not_done:
+      future.cancel()
+    if not_done:
+      self.logger.warning(f'{len(not_done)} of {len(futures)} routeset requests missed the deadline')
+
+    results = [future.result() for future in futures if future in done and future.exception() is None]
+    results = [fetched for fetched in results if fetched is not None]
+    if not results:
+      return None
+    return [route for fetched in results for route in fetched]
+
+
+  # Attempts to get the routes of a list of flights by callsign. Flights are expected in
+  # priority order (closest first).
+  # Routes for callsigns seen recently are served from the route cache, and callsigns
+  # recently found to have no plausible route are skipped; only the remaining
+  # callsigns are sent to the routeset endpoint.
+  def get_routeset(self, flights, timeout=15):
+    cached = {}
+    uncached = []
+    unroutable = 0
+    for flight in flights:
+      route = self._route_cache.get(flight.flight)
+      if route is not None:
+        cached[route['callsign'].strip()] = route
+      elif self._unroutable_cache.get(flight.flight) is not None:
+        unroutable += 1
+      else:
+        uncached.append(flight)
+
+    if unroutable:
+      self.logger.debug(f'Skipped {unroutable} callsigns with no plausible route')
+
+    routes = list(cached.values())
+    if uncached:
+      fetched = self._fetch_routes_concurrently(uncached, timeout)
+      if fetched is None and not routes:
+        return EMPTY_ROUTESET
+      routes.extend(fetched or [])
+    else:
+      self.logger.debug(f'Served all {len(flights) - unroutable} routes from cache')
+
+    return merge_routes(flights, routes)
@@ -1,15 +1,149 @@
+import config
 import json
+import logging
+import mmap
+import os
+import struct
 
 LOOKUP_FILE = 'src/app_data/airlines.json'
+COMPILED_FILE = 'src/app_data/airlines.bin'
+ACTIVE_FLAG = 'Y'
+
+'''
+Compiled airline table layout (little endian):
+
+  header   magic, version, record count, source size, source mtime (ns)
+  records  fixed width, sorted by ICAO key: key (NUL padded), name offset, name length
+  names    UTF-8 airline names, referenced by offset from the start of this block
+
+The source size and mtime recorded in the header tie the table to the
+airlines.json it was compiled from, so an edited JSON file is picked up and
+recompiled the next time the service starts.
+'''
+_MAGIC = b'ALDB'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHIQQ')
+_KEY_SIZE = 8
+_RECORD = struct.Struct(f'<{_KEY_SIZE}sIH')
+
+
+def build_index(airlines: list[dict]) -> dict[str, str]:
+  '''
+  Builds an ICAO -> airline name index from the raw airlines list.
+  Several ICAO codes are shared between defunct and current carriers, so an
+  active entry always wins over an inactive one; otherwise the first entry
+  in file order is kept.
+  '''
+  index: dict[str, str] = {}
+  active: set[str] = set()
+  for airline in airlines:
+    icao = airline['icao'].upper()
+    if not icao or icao in active:
+      continue
+
+    is_active = airline['active'].upper() == ACTIVE_FLAG
+    if is_active:
+      active.add(icao)
+    elif icao in index:
+      continue
+    index[icao] = airline['name']
+  return index
+
+
+def _encode_key(code: str) -> bytes | None:
+  key = code.upper().encode('utf-8')
+  if len(key) > _KEY_SIZE:
+    return None
+  return key.ljust(_KEY_SIZE, b'\0')
+
+
+def _source_stamp(source: str) -> tuple[int, int]:
+  stat = os.stat(source)
+  return stat.st_size, stat.st_mtime_ns
+
+
+def compile_airline_db(source: str = LOOKUP_FILE, target: str = COMPILED_FILE):
+  '''
+  Compiles the airlines JSON file into the sorted binary table read by
+  AirlineLookupService. The table is written to a temporary file and moved
+  into place so a concurrently starting service never maps a partial file.
+  '''
+  size, mtime_ns = _source_stamp(source)
+  with open(source, 'r') as f:
+    index = build_index(json.load(f))
+
+  entries = sorted((key, name) for key, name in
+                   ((_encode_key(icao), name) for icao, name in index.items())
+                   if key is not None)
+
+  records = bytearray()
+  names = bytearray()
+  for key, name in entries:
+    encoded = name.encode('utf-8')
+    records += _RECORD.pack(key, len(names), len(encoded))
+    names += encoded
+
+  tmp = f'{target}.tmp'
+  with open(tmp, 'wb') as f:
+    f.write(_HEADER.pack(_MAGIC, _VERSION, len(entries), size, mtime_ns))
+    f.write(records)
+    f.write(names)
+  os.replace(tmp, target)
+  return len(entries)
+
+
+def _is_current(source: str, target: str) -> bool:
+  try:
+    with open(target, 'rb') as f:
+      header = f.read(_HEADER.size)
+  except FileNotFoundError:
+    return False
+
+  if len(header) != _HEADER.size:
+    return False
+  magic, version, _, size, mtime_ns = _HEADER.unpack(header)
+  return magic == _MAGIC and version == _VERSION and (size, mtime_ns) == _source_stamp(source)
+
 
 class AirlineLookupService:
-  def __init__(self):
-    with open(LOOKUP_FILE, 'r') as f:
-      self._data = json.load(f)
-  
+  def __init__(self, source: str = LOOKUP_FILE, compiled: str = COMPILED_FILE):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._mmap = None
+    self._index = None
+
+    try:
+      if not _is_current(source, compiled):
+        self.logger.info(f'Compiling airline table from {source}')
+        compile_airline_db(source, compiled)
+      with open(compiled, 'rb') as f:
+        self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+      _, _, self._count, _, _ = _HEADER.unpack_from(self._mmap, 0)
+      self._names_start = _HEADER.size + self._count * _RECORD.size
+    except OSError:
+      # Read-only install or similar; fall back to an in-memory index.
+      self.logger.warning('Unable to use compiled airline table. Loading airlines in memory.', exc_info=True)
+      with open(source, 'r') as f:
+        self._index = build_index(json.load(f))
+
+  def _search(self, key: bytes) -> str:
+    lo, hi = 0, self._count
+    while lo < hi:
+      mid = (lo + hi) // 2
+      record_key, offset, length = _RECORD.unpack_from(self._mmap, _HEADER.size + mid * _RECORD.size)
+      if record_key < key:
+        lo = mid + 1
+      elif record_key > key:
+        hi = mid
+      else:
+        start = self._names_start + offset
+        return self._mmap[start:start + length].decode('utf-8')
+    return ''
+
   def lookup(self, code: str):
-    results = [airline for airline in self._data if airline['icao'] == code.upper()]
-    if len(results):
-      return results[0]['name']
-    
-    return ''
\ No newline at end of file
+    if self._index is not None:
+      return self._index.get(code.upper(), '')
+
+    key = _encode_key(code)
+    if not code or key is None:
+      return ''
+    return self._search(key)
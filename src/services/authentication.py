@@ -1,4 +1,3 @@
-import boto3
 import json
 import os
 import config
@@ -22,9 +21,19 @@ class AuthenticationService:
       return cls._instance
   
   def __init__(self):
+    if hasattr(self, '_initialized'):
+      return
+    self._initialized = True
     self.logger = logging.getLogger(config.APP_NAME)
     self.error = False
     self.runtime_service = RuntimeService()
+    self._rapidapi_token = None
+    self._fetch_lock = threading.Lock()
+
+  # Deferred until the first token is asked for, like DynamoDbBackend.table
+  def _fetch_secret(self):
+    import boto3
+
     retries = 1
     while retries < _retries_allowed:
       try:
@@ -60,6 +69,9 @@ class AuthenticationService:
 
   @property
   def rapidapi_token(self):
+    with self._fetch_lock:
+      if self._rapidapi_token is None and not self.error:
+        self._fetch_secret()
     if not self.error:
       return self._rapidapi_token
     else:
@@ -0,0 +1,115 @@
+import http.client
+import logging
+import threading
+import time
+
+import config
+
+from contextlib import contextmanager
+
+# Errors that mean a kept-alive connection was dropped by the server while idle.
+# The request is retried once on a fresh connection when these hit a reused socket.
+_STALE_CONNECTION_ERRORS = (ConnectionError, http.client.BadStatusLine, http.client.CannotSendRequest)
+
+'''
+Keep-alive connection pool shared by services that poll the same API hosts.
+
+Connections are handed out per host, bounded by max_per_host, and returned
+to the pool once their response has been fully read. Idle connections older
+than idle_timeout are discarded instead of reused, and a reused connection
+that turns out to have been closed by the server is transparently replaced.
+'''
+class ConnectionPool:
+  def __init__(self, max_per_host=2, idle_timeout=60, connection_cls=None):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._max_per_host = max_per_host
+    self._idle_timeout = idle_timeout
+    self._connection_cls = connection_cls
+    self._lock = threading.Lock()
+    self._idle: dict[str, list[tuple[http.client.HTTPConnection, float]]] = {}
+    self._slots: dict[str, threading.BoundedSemaphore] = {}
+
+  def _slot(self, host):
+    with self._lock:
+      if host not in self._slots:
+        self._slots[host] = threading.BoundedSemaphore(self._max_per_host)
+      return self._slots[host]
+
+  def _connect(self, host, timeout):
+    # Resolved at call time so the connection class can be swapped (e.g. patched in tests)
+    connection_cls = self._connection_cls or http.client.HTTPSConnection
+    return connection_cls(host, timeout=timeout)
+
+  def _checkout(self, host, timeout):
+    now = time.monotonic()
+    with self._lock:
+      idle = self._idle.get(host, [])
+      while idle:
+        conn, last_used = idle.pop()
+        if now - last_used < self._idle_timeout:
+          conn.timeout = timeout
+          if conn.sock:
+            conn.sock.settimeout(timeout)
+          return conn, True
+        conn.close()
+    return self._connect(host, timeout), False
+
+  def _checkin(self, host, conn):
+    with self._lock:
+      self._idle.setdefault(host, []).append((conn, time.monotonic()))
+
+  @staticmethod
+  def _send(conn, method, url, body, headers):
+    conn.request(method, url, body, headers)
+    return conn.getresponse()
+
+  @contextmanager
+  def request(self, host, method, url, body=None, headers=None, timeout=15):
+    '''
+    Sends a request and yields the response. The connection goes back to the
+    pool only if the caller read the whole body and the server did not ask
+    to close it; otherwise it is closed on exit.
+    '''
+    headers = headers or {}
+    slot = self._slot(host)
+    if not slot.acquire(timeout=timeout):
+      raise TimeoutError(f'No connection to {host} available within {timeout} seconds')
+
+    try:
+      conn, reused = self._checkout(host, timeout)
+      try:
+        response = self._send(conn, method, url, body, headers)
+      except _STALE_CONNECTION_ERRORS:
+        conn.close()
+        if not reused:
+          raise
+        self.logger.debug(f'Kept-alive connection to {host} was closed. Reconnecting.')
+        conn = self._connect(host, timeout)
+        try:
+          response = self._send(conn, method, url, body, headers)
+        except BaseException:
+          conn.close()
+          raise
+      except BaseException:
+        conn.close()
+        raise
+
+      try:
+        yield response
+      except BaseException:
+        conn.close()
+        raise
+
+      if response.isclosed() and not response.will_close:
+        self._checkin(host, conn)
+      else:
+        conn.close()
+    finally:
+      slot.release()
+
+  def close(self):
+    with self._lock:
+      for idle in self._idle.values():
+        for conn, _ in idle:
+          conn.close()
+      self._idle.clear()
@@ -0,0 +1,81 @@
+import math
+
+from models.aircraftModel import AircraftModel
+from utils.geoUtils import GeoUtils
+
+KNOTS_TO_MPH = 1.15078
+MILES_PER_DEGREE_LAT = 69.0
+
+'''
+Decides which aircraft sightings are worth a tracker log entry.
+
+An aircraft is logged when it is first seen, when it has gone `heartbeat_ms`
+without an entry, or when it no longer matches its last entry: it is more
+than `position_threshold` miles from where its last logged speed and track
+would have put it, its altitude is `altitude_threshold` feet off what its
+last vertical rate predicted, or its ground speed moved past
+`speed_threshold`. An aircraft in steady flight (level, or a constant climb or
+descent) is therefore logged once per heartbeat, while turns, level-offs and
+speed changes are still captured.
+'''
+class DeltaFilter:
+  def __init__(self, heartbeat_ms, position_threshold, altitude_threshold, speed_threshold):
+    self._heartbeat_ms = heartbeat_ms
+    self._position_threshold = position_threshold
+    self._altitude_threshold = altitude_threshold
+    self._speed_threshold = speed_threshold
+    self._last_logged: dict[str, tuple[AircraftModel, float]] = {}
+    self.suppressed = 0
+
+  @staticmethod
+  def _key(entry: AircraftModel):
+    return entry.hex or entry.flight or entry.r
+
+  def should_write(self, entry: AircraftModel, now_ms: float):
+    key = self._key(entry)
+    last = self._last_logged.get(key)
+    if last is None or self._changed(last[0], entry, now_ms - last[1]):
+      self._last_logged[key] = (entry, now_ms)
+      return True
+    self.suppressed += 1
+    return False
+
+  # Forgets aircraft whose heartbeat has lapsed; their next sighting is logged anyway
+  def prune(self, now_ms: float):
+    self._last_logged = {k: v for k, v in self._last_logged.items() if now_ms - v[1] < self._heartbeat_ms}
+
+  def _changed(self, last: AircraftModel, entry: AircraftModel, elapsed_ms: float):
+    if elapsed_ms >= self._heartbeat_ms:
+      return True
+    if _moved_by(_predict_altitude(last, elapsed_ms), entry.alt_baro, self._altitude_threshold):
+      return True
+    if _moved_by(last.gs, entry.gs, self._speed_threshold):
+      return True
+    if None in (last.lat, last.lon, entry.lat, entry.lon):
+      return False
+
+    lat, lon = _predict_position(last, elapsed_ms)
+    return GeoUtils.distance_miles(entry.lat, entry.lon, [lat, lon]) > self._position_threshold
+
+
+def _moved_by(previous, current, threshold):
+  if previous is None or current is None:
+    return previous is not current
+  return abs(current - previous) >= threshold
+
+
+def _predict_altitude(last: AircraftModel, elapsed_ms: float):
+  if last.alt_baro is None:
+    return None
+  return last.alt_baro + last.vertical_speed * elapsed_ms / 60_000
+
+
+# Dead reckoning from the last entry's speed and track; flat-earth is plenty over a few minutes
+def _predict_position(last: AircraftModel, elapsed_ms: float):
+  if last.gs is None or last.track is None:
+    return last.lat, last.lon
+  miles = last.gs * KNOTS_TO_MPH * elapsed_ms / 3_600_000
+  heading = math.radians(last.track)
+  lat = last.lat + miles * math.cos(heading) / MILES_PER_DEGREE_LAT
+  lon = last.lon + miles * math.sin(heading) / (MILES_PER_DEGREE_LAT * math.cos(math.radians(last.lat)))
+  return lat, lon
@@ -37,34 +37,47 @@ class GeoService():
       return cls._instance
   
   def __init__(self):
+    if hasattr(self, '_initialized'):
+      return
+    self._initialized = True
     self.logger = logging.getLogger(config.APP_NAME)
     self._location = []
+    self._location_ready = threading.Event()
     if not config.LOCATION_COORDINATES_OVERRIDE:
-      try:
-        self.authentication = AuthenticationService()
-        with open(filepath, 'r') as f:
-          cached_location_data = json.load(f)
-          current_timestamp = TimeUtils.current_time_milli()
-          if round((current_timestamp - cached_location_data['timestamp']) / 1000 / 60) > config.LOCATION_CACHE_TIMEOUT:
-            self.logger.warning(f'Location cache expired. Updating cache...')
-            self._update_cache()
-          else:
-            self._location = [float(x) for x in cached_location_data['location']]
-      except FileNotFoundError:
-        self.logger.info(f'Location cache not found. Building cache...')
-        self._update_cache()
-
-      except Exception as e:
-        self.logger.error(f'Error getting location data. Falling back to default coordinates: {config.LOCATION_COORDINATES_DEFAULT}')
-        self._location = config.LOCATION_COORDINATES_DEFAULT
+      self.authentication = AuthenticationService()
+      # Refreshing the cache can mean fetching the RapidAPI secret and geocoding the zip code,
+      # so it runs in the background; location stays empty until it's done
+      threading.Thread(target=self._load_location, name='geo-location', daemon=True).start()
     else:
       self.logger.warning(f'Location coordinates override detected. Using override coordinates: {config.LOCATION_COORDINATES_OVERRIDE}')
       self._location = config.LOCATION_COORDINATES_OVERRIDE
+      self._location_ready.set()
       try:
         os.remove(filepath)
       except FileNotFoundError:
         pass
 
+  def _load_location(self):
+    try:
+      with open(filepath, 'r') as f:
+        cached_location_data = json.load(f)
+        current_timestamp = TimeUtils.current_time_milli()
+        if round((current_timestamp - cached_location_data['timestamp']) / 1000 / 60) > config.LOCATION_CACHE_TIMEOUT:
+          self.logger.warning(f'Location cache expired. Updating cache...')
+          self._update_cache()
+        else:
+          self._location = [float(x) for x in cached_location_data['location']]
+    except FileNotFoundError:
+      self.logger.info(f'Location cache not found. Building cache...')
+      self._update_cache()
+
+    except Exception as e:
+      self.logger.error(f'Error getting location data. Falling back to default coordinates: {config.LOCATION_COORDINATES_DEFAULT}')
+      self._location = config.LOCATION_COORDINATES_DEFAULT
+
+    finally:
+      self._location_ready.set()
+
   def _update_cache(self):
     token = self.authentication.rapidapi_token
 
@@ -108,6 +121,11 @@ class GeoService():
     with open('src/app_data/geo_cache.json', 'w') as f:
       json.dump({'location': self._location, 'timestamp': TimeUtils.current_time_milli()}, f)
     
+  # Blocks until the location has been loaded (or fallen back to the default).
+  # Returns False if it still isn't ready after `timeout` seconds.
+  def wait_for_location(self, timeout=None):
+    return self._location_ready.wait(timeout)
+
   @property
   def location(self):
     return self._location
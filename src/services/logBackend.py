@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+'''
+Storage behind TrackerLog. The write-behind queue hands each batch of items
+to `write` on its writer thread (or on the caller's thread during a flush).
+
+Items are flat dicts: the projected aircraft fields plus 'callsign',
+'timestamp' (epoch ms), 'timestamp_readable' and 'expires_at' (epoch s).
+Float fields arrive as Decimals.
+'''
+class LogBackend(ABC):
+  # Stores the batch. Returns False if it couldn't be stored.
+  @abstractmethod
+  def write(self, items: list[dict]) -> bool:
+    ...
+
+  def close(self):
+    pass
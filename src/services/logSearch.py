@@ -0,0 +1,120 @@
+import json
+import os
+import sqlite3
+
+from typing import Iterator, NamedTuple
+
+'''
+Searches the tracker log without loading it into memory.
+
+A SQLite log (TRACKER_LOG_BACKEND = 'sqlite') is queried through its
+indexes: a callsign prefix becomes a range scan on the primary key, a time
+range uses the timestamp index and a registration uses its own. Type and
+altitude are checked on the rows those select.
+A JSON Lines log (e.g. TRACKER_LOG_SPILL_FILE) is streamed a line at a time
+and filtered in Python. Either way matches are yielded as they're found, so
+memory use doesn't grow with the size of the log.
+'''
+class LogQuery(NamedTuple):
+  callsign: str = None  # prefix, e.g. 'UAL' or 'UAL1234'
+  registration: str = None
+  aircraft_type: str = None
+  since_ms: int = None  # inclusive
+  until_ms: int = None  # exclusive
+  min_altitude: int = None
+  max_altitude: int = None
+
+
+def search(path: str, query: LogQuery, limit: int = None) -> Iterator[dict]:
+  if not os.path.exists(path):
+    raise FileNotFoundError(path)
+  if path.endswith('.jsonl'):
+    return _search_jsonl(path, _normalized(query), limit)
+  return _search_sqlite(path, _normalized(query), limit)
+
+
+def matches(item: dict, query: LogQuery):
+  if query.callsign and not item.get('callsign', '').startswith(query.callsign):
+    return False
+  if query.registration and item.get('r') != query.registration:
+    return False
+  if query.aircraft_type and item.get('t') != query.aircraft_type:
+    return False
+  timestamp = item.get('timestamp')
+  if query.since_ms is not None and (timestamp is None or timestamp < query.since_ms):
+    return False
+  if query.until_ms is not None and (timestamp is None or timestamp >= query.until_ms):
+    return False
+  altitude = item.get('alt_baro')
+  if query.min_altitude is not None and (altitude is None or altitude < query.min_altitude):
+    return False
+  if query.max_altitude is not None and (altitude is None or altitude > query.max_altitude):
+    return False
+  return True
+
+
+# Callsigns, registrations and type codes are stored upper case
+def _normalized(query: LogQuery):
+  return query._replace(**{field: getattr(query, field).strip().upper()
+                           for field in ('callsign', 'registration', 'aircraft_type') if getattr(query, field)})
+
+
+def _search_jsonl(path, query, limit):
+  found = 0
+  with open(path, 'r') as file:
+    for line in file:
+      if limit is not None and found >= limit:
+        return
+      if not line.strip():
+        continue
+      item = json.loads(line)
+      if matches(item, query):
+        found += 1
+        yield item
+
+
+def _search_sqlite(path, query, limit):
+  where, params = _where(query)
+  sql = f'SELECT * FROM tracker_log{where} ORDER BY timestamp'
+  if limit is not None:
+    sql += ' LIMIT ?'
+    params.append(limit)
+
+  connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+  connection.row_factory = sqlite3.Row
+  try:
+    for row in connection.execute(sql, params):
+      yield {key: row[key] for key in row.keys() if row[key] is not None}
+  finally:
+    connection.close()
+
+
+def _where(query: LogQuery):
+  clauses, params = [], []
+  if query.callsign:
+    # A range rather than LIKE, so SQLite can seek the primary key
+    clauses.append('callsign >= ? AND callsign < ?')
+    params += [query.callsign, _prefix_upper_bound(query.callsign)]
+  if query.registration:
+    clauses.append('r = ?')
+    params.append(query.registration)
+  if query.aircraft_type:
+    clauses.append('t = ?')
+    params.append(query.aircraft_type)
+  if query.since_ms is not None:
+    clauses.append('timestamp >= ?')
+    params.append(query.since_ms)
+  if query.until_ms is not None:
+    clauses.append('timestamp < ?')
+    params.append(query.until_ms)
+  if query.min_altitude is not None:
+    clauses.append('alt_baro >= ?')
+    params.append(query.min_altitude)
+  if query.max_altitude is not None:
+    clauses.append('alt_baro <= ?')
+    params.append(query.max_altitude)
+  return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+
+def _prefix_upper_bound(prefix: str):
+  return prefix[:-1] + chr(ord(prefix[-1]) + 1)
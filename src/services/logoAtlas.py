@@ -0,0 +1,131 @@
+import io
+import mmap
+import os
+import struct
+
+from PIL import Image
+
+ATLAS_FILE = 'logos.atlas'
+LOGO_BASE_SIZE = 16
+SCALES = (1, 2, 3)
+
+'''
+Packed logo atlas layout (little endian):
+
+  header   magic, version, record count, source mtime (ns)
+  records  fixed width, sorted by scale then name: scale, name (NUL padded),
+           side length in pixels, offset of the pixels from the start of the data block
+  data     raw RGB rows, side * side * 3 bytes per logo
+
+Every scale variant of every logo lives in the one file, so a logo is read
+by mapping the atlas once and slicing it, rather than opening and inflating
+a PNG. Built from the per-scale logo directories by scripts/build_logo_atlas.py.
+
+The header records the newest mtime among the sources it was built from, so
+a logo directory changed since (a logo added, say) can be noticed with
+is_older_than().
+'''
+_MAGIC = b'LGAT'
+_VERSION = 2
+_HEADER = struct.Struct('<4sHIQ')
+_KEY_SIZE = 8
+_RECORD = struct.Struct(f'<B{_KEY_SIZE}sHI')
+_RECORD_KEY_SIZE = 1 + _KEY_SIZE
+
+
+def _encode_key(scale: int, name: str) -> bytes | None:
+  key = name.encode('utf-8')
+  if len(key) > _KEY_SIZE:
+    return None
+  return bytes([scale]) + key.ljust(_KEY_SIZE, b'\0')
+
+
+# Fits the logo inside a side x side square, centred on white, like the old bulk resize script
+def fit_logo(image: Image.Image, side: int) -> Image.Image:
+  image = image.convert('RGB')
+  if image.size == (side, side):
+    return image
+  image.thumbnail((side, side), Image.Resampling.LANCZOS)
+  square = Image.new('RGB', (side, side), 'white')
+  square.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+  return square
+
+
+def compile_logo_atlas(sources: dict[int, dict[str, bytes]], target: str = ATLAS_FILE, source_mtime_ns: int = 0):
+  '''
+  Packs logos into an atlas. `sources` maps each scale to the PNG files
+  available for it, by name. Every logo is packed at every scale: when a
+  scale has no file for a logo, the largest file there is for it is resized.
+  The atlas is written to a temporary file and moved into place so a running
+  tracker never maps a partial file.
+  '''
+  names = sorted({name for files in sources.values() for name in files})
+  entries = []
+  for scale in SCALES:
+    for name in names:
+      key = _encode_key(scale, name)
+      if key is None:
+        continue
+      source = sources.get(scale, {}).get(name)
+      if source is None:
+        source = next(sources[s][name] for s in sorted(sources, reverse=True) if name in sources[s])
+      with Image.open(io.BytesIO(source)) as image:
+        entries.append((key, fit_logo(image, LOGO_BASE_SIZE * scale)))
+
+  records = bytearray()
+  size = 0
+  for key, image in entries:
+    records += _RECORD.pack(key[0], key[1:], image.width, size)
+    size += image.width * image.height * 3
+
+  tmp = f'{target}.tmp'
+  with open(tmp, 'wb') as f:
+    f.write(_HEADER.pack(_MAGIC, _VERSION, len(entries), source_mtime_ns))
+    f.write(records)
+    for _, image in entries:
+      f.write(image.tobytes())
+  os.replace(tmp, target)
+  return len(entries)
+
+
+class LogoAtlas:
+  def __init__(self, path: str = ATLAS_FILE):
+    with open(path, 'rb') as f:
+      self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, self._count, self._source_mtime_ns = _HEADER.unpack_from(self._mmap, 0)
+    if magic != _MAGIC or version != _VERSION:
+      self._mmap.close()
+      raise ValueError(f'{path} is not a version {_VERSION} logo atlas')
+    self._data_start = _HEADER.size + self._count * _RECORD.size
+
+  def _search(self, key: bytes):
+    lo, hi = 0, self._count
+    while lo < hi:
+      mid = (lo + hi) // 2
+      position = _HEADER.size + mid * _RECORD.size
+      record_key = self._mmap[position:position + _RECORD_KEY_SIZE]
+      if record_key < key:
+        lo = mid + 1
+      elif record_key > key:
+        hi = mid
+      else:
+        _, _, side, offset = _RECORD.unpack_from(self._mmap, position)
+        return side, self._data_start + offset
+    return None
+
+  # Returns the logo as an RGB image, or None if the atlas doesn't have it at this scale
+  def get(self, name: str, scale: int):
+    key = _encode_key(scale, name)
+    found = self._search(key) if key is not None else None
+    if found is None:
+      return None
+    side, start = found
+    pixels = memoryview(self._mmap)[start:start + side * side * 3]
+    return Image.frombuffer('RGB', (side, side), pixels, 'raw', 'RGB', 0, 1)
+
+  # True if `path` (e.g. a logo directory) was modified after the atlas's sources
+  def is_older_than(self, path: str):
+    return os.stat(path).st_mtime_ns > self._source_mtime_ns
+
+  def __len__(self):
+    return self._count
@@ -0,0 +1,198 @@
+import config
+import json
+import logging
+import os
+import queue
+import threading
+
+from collections import OrderedDict
+from functools import partial
+from PIL import Image
+from services.logoAtlas import ATLAS_FILE, LogoAtlas
+from setup import screen
+
+DEFAULT_IMAGE = "default"
+LOGO_DIR = "logos" if screen.SCALE_FACTOR == 1 else f"logos_{screen.SCALE_FACTOR}x"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+MISSING_LOGOS_DIR = os.path.join(REPO_ROOT, "missing_logos")
+MISSING_LOGOS_FILE = os.path.join(MISSING_LOGOS_DIR, "missing_logos.json")
+
+
+def _record_missing_logo(icao: str) -> None:
+  os.makedirs(MISSING_LOGOS_DIR, exist_ok=True)
+
+  missing_logos: dict[str, int] = {}
+  if os.path.exists(MISSING_LOGOS_FILE):
+    try:
+      with open(MISSING_LOGOS_FILE, "r", encoding="utf-8") as file:
+        missing_logos = json.load(file)
+    except (json.JSONDecodeError, OSError):
+      missing_logos = {}
+
+  missing_logos[icao] = int(missing_logos.get(icao, 0)) + 1
+
+  with open(MISSING_LOGOS_FILE, "w", encoding="utf-8") as file:
+    json.dump(missing_logos, file, indent=2, sort_keys=True)
+
+
+'''
+Decoded RGB airline logos, keyed by ICAO code, so drawing a logo is a
+dictionary lookup instead of a PNG decode.
+
+Logos are read on a background 'logo-loader' thread, from the packed atlas
+(see LogoAtlas) or, if it hasn't been built or doesn't have a logo, from the
+PNGs in LOGO_DIR. The
+default logo and config.LOGO_PRELOAD are read at startup, and any other
+airline when it's prefetched (Overhead does this as soon as it picks a
+flight) or first asked for; until then get() returns None. Airlines without
+a logo get the default one, and each time one is drawn it's counted in
+missing_logos.json, also on the loader thread. The least recently used
+logos are dropped once they take more than config.LOGO_CACHE_MAX_BYTES; the
+default logo is always kept.
+
+Singleton class, shared by Overhead and the logo scene.
+'''
+class LogoCache:
+  _instance = None
+  _lock = threading.Lock()
+
+  def __new__(cls):
+    with cls._lock:
+      if cls._instance is None:
+        cls._instance = super(LogoCache, cls).__new__(cls)
+      return cls._instance
+
+  def __init__(self):
+    if hasattr(self, '_initialized'):
+      return
+    self._initialized = True
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._max_bytes = config.LOGO_CACHE_MAX_BYTES
+    self._logos: OrderedDict[str, Image.Image] = OrderedDict()
+    self._bytes = 0
+    self._default = None
+    self._missing: set[str] = set()
+    self._queued: set[str] = set()
+    self._entries_lock = threading.Lock()
+    self._requests = queue.Queue()
+    self._atlas = None
+    self.hits = 0
+    self.misses = 0
+
+    self.prefetch(DEFAULT_IMAGE)
+    for icao in config.LOGO_PRELOAD:
+      self.prefetch(icao)
+    threading.Thread(target=self._run, name='logo-loader', daemon=True).start()
+
+  @staticmethod
+  def _key(icao: str):
+    return DEFAULT_IMAGE if icao in ("", "N/A") else icao
+
+  # Returns the airline's logo, the default logo if it has none, or None if it hasn't been loaded yet.
+  # Never touches the filesystem, so it's safe to call while drawing.
+  def get(self, icao: str):
+    key = self._key(icao)
+    with self._entries_lock:
+      if key == DEFAULT_IMAGE and self._default is not None:
+        self.hits += 1
+        return self._default
+      image = self._logos.get(key)
+      if image is not None:
+        self._logos.move_to_end(key)
+        self.hits += 1
+        return image
+      if key in self._missing:
+        self.hits += 1
+        self._requests.put(partial(_record_missing_logo, key))
+        return self._default
+      self.misses += 1
+    self.prefetch(key)
+    return None
+
+  # Queues the airline's logo to be loaded in the background, unless it's cached or already queued
+  def prefetch(self, icao: str):
+    key = self._key(icao)
+    with self._entries_lock:
+      if key in self._logos or key in self._missing or key in self._queued:
+        return
+      if key == DEFAULT_IMAGE and self._default is not None:
+        return
+      self._queued.add(key)
+    self._requests.put(partial(self._load, key))
+
+  # Waits until everything queued so far has been loaded or recorded
+  def join(self):
+    self._requests.join()
+
+  @property
+  def size_bytes(self):
+    with self._entries_lock:
+      return self._bytes
+
+  def __len__(self):
+    with self._entries_lock:
+      return len(self._logos)
+
+  # True when get() would return a logo rather than None
+  def __contains__(self, icao: str):
+    key = self._key(icao)
+    with self._entries_lock:
+      if key in self._logos:
+        return True
+      return self._default is not None and (key == DEFAULT_IMAGE or key in self._missing)
+
+  def _run(self):
+    try:
+      self._atlas = LogoAtlas(ATLAS_FILE)
+      if os.path.isdir(LOGO_DIR) and self._atlas.is_older_than(LOGO_DIR):
+        self.logger.warning(f'{ATLAS_FILE} is older than {LOGO_DIR}. Rebuild it with scripts/build_logo_atlas.py.')
+    except (OSError, ValueError):
+      self.logger.info(f'No logo atlas at {ATLAS_FILE}, reading logos from {LOGO_DIR}. Build it with scripts/build_logo_atlas.py.')
+
+    while True:
+      request = self._requests.get()
+      try:
+        request()
+      except Exception:
+        self.logger.error('Logo loader request failed.', exc_info=True)
+      finally:
+        self._requests.task_done()
+
+  def _load(self, key: str):
+    try:
+      image = self._read(key)
+    finally:
+      with self._entries_lock:
+        self._queued.discard(key)
+
+    with self._entries_lock:
+      if image is None:
+        self._missing.add(key)
+        return
+      if key == DEFAULT_IMAGE:
+        self._default = image
+        return
+      self._logos[key] = image
+      self._bytes += _size(image)
+      while self._bytes > self._max_bytes and len(self._logos) > 1:
+        _, evicted = self._logos.popitem(last=False)
+        self._bytes -= _size(evicted)
+
+  # Returns None if there's no logo for the airline
+  def _read(self, key: str):
+    if self._atlas is not None:
+      image = self._atlas.get(key, screen.SCALE_FACTOR)
+      if image is not None:
+        return image
+
+    # Logos added since the atlas was built are only in LOGO_DIR.
+    # convert() decodes the whole PNG, so nothing is left to read when the logo is drawn
+    try:
+      with Image.open(os.path.join(LOGO_DIR, f"{key}.png")) as image:
+        return image.convert('RGB')
+    except FileNotFoundError:
+      return None
+
+
+def _size(image: Image.Image):
+  return image.width * image.height * len(image.getbands())
@@ -0,0 +1,52 @@
+import threading
+
+from collections import OrderedDict
+from utils.timeUtils import TimeUtils
+
+'''
+In-process callsign -> route cache with a per-entry TTL and an LRU bound.
+
+Airliners stay overhead for many minutes and their routes don't change in
+that time, so routeset lookups only need to be made for callsigns that are
+missing or whose entry has expired.
+'''
+class RouteCache:
+  def __init__(self, ttl_minutes, max_entries):
+    self._ttl_ms = ttl_minutes * 60 * 1000
+    self._max_entries = max_entries
+    self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def _key(callsign: str):
+    return callsign.strip().upper()
+
+  def get(self, callsign: str):
+    key = self._key(callsign)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+
+      route, stored_at = entry
+      if TimeUtils.current_time_milli() - stored_at >= self._ttl_ms:
+        del self._entries[key]
+        return None
+
+      self._entries.move_to_end(key)
+      return route
+
+  def put(self, callsign: str, route: dict):
+    key = self._key(callsign)
+    if not key:
+      return
+
+    with self._lock:
+      self._entries[key] = (route, TimeUtils.current_time_milli())
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+  def __len__(self):
+    with self._lock:
+      return len(self._entries)
@@ -0,0 +1,87 @@
+import config
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from decimal import Decimal
+from models.aircraftModel import AircraftModel
+from services.logBackend import LogBackend
+
+COLUMNS = ('callsign', 'timestamp', 'expires_at') + AircraftModel.__slots__
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tracker_log (
+  callsign TEXT NOT NULL,
+  timestamp INTEGER NOT NULL,
+  expires_at INTEGER NOT NULL,
+  hex TEXT, flight TEXT, r TEXT, t TEXT,
+  lat REAL, lon REAL, alt_baro INTEGER, alt_geom INTEGER,
+  gs REAL, track REAL, baro_rate INTEGER, geom_rate INTEGER,
+  PRIMARY KEY (callsign, timestamp)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tracker_log_timestamp ON tracker_log (timestamp);
+CREATE INDEX IF NOT EXISTS tracker_log_expires_at ON tracker_log (expires_at);
+CREATE INDEX IF NOT EXISTS tracker_log_r ON tracker_log (r);
+'''
+
+_INSERT = f'INSERT OR REPLACE INTO tracker_log ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})'
+
+
+'''
+Local flight history in a SQLite database, for installs without AWS.
+
+The database runs in WAL mode so readers (e.g. scripts/search_log.py) don't
+block the writer. The primary key (callsign, timestamp) matches the DynamoDB
+table's keys, and timestamp and registration are indexed for searches. Each
+batch is inserted in one transaction, and entries past their expires_at are
+deleted every `prune_minutes`, mirroring the DynamoDB TTL set from
+TRACKER_LOG_TTL_HOURS.
+'''
+class SqliteLogBackend(LogBackend):
+  def __init__(self, path, prune_minutes=60):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._prune_seconds = prune_minutes * 60
+    self._last_prune = 0
+    self._lock = threading.Lock()
+    if os.path.dirname(path):
+      os.makedirs(os.path.dirname(path), exist_ok=True)
+    # The queue writes from its own thread, and flush() from the caller's; the lock serializes them
+    self._connection = sqlite3.connect(path, check_same_thread=False)
+    self._connection.execute('PRAGMA journal_mode=WAL')
+    self._connection.execute('PRAGMA synchronous=NORMAL')
+    self._connection.executescript(_SCHEMA)
+
+  def write(self, items: list[dict]) -> bool:
+    rows = [tuple(_column_value(item.get(column)) for column in COLUMNS) for item in items]
+    try:
+      with self._lock:
+        with self._connection:
+          self._connection.executemany(_INSERT, rows)
+        self._prune_if_due()
+      return True
+    except sqlite3.Error:
+      self.logger.error('Failed to write entries to the local tracker log.', exc_info=True)
+      return False
+
+  # Deletes expired entries at most once per prune interval
+  def _prune_if_due(self):
+    now = time.time()
+    if now - self._last_prune < self._prune_seconds:
+      return
+    self._last_prune = now
+    with self._connection:
+      deleted = self._connection.execute('DELETE FROM tracker_log WHERE expires_at <= ?', (int(now),)).rowcount
+    if deleted:
+      self.logger.debug(f'Pruned {deleted} expired tracker log entries.')
+
+  def close(self):
+    with self._lock:
+      self._connection.close()
+
+
+def _column_value(value):
+  if isinstance(value, Decimal):
+    return float(value)
+  return value
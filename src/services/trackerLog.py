@@ -1,15 +1,80 @@
 import threading
 import config
+import json
 import logging
-import boto3
+import os
+import time
 
 from decimal import Decimal
 from datetime import datetime
+from models.aircraftModel import AircraftModel
 from utils.timeUtils import TimeUtils
+from services.deltaFilter import DeltaFilter
+from services.logBackend import LogBackend
 from services.runtime import RuntimeService
+from services.sqliteLogBackend import SqliteLogBackend
+from services.writeBehindQueue import WriteBehindQueue
 from setup.screen import IS_RASPBERRY_PI
 
 _DYNAMODB_TABLE_NAME = 'tracker_log' if IS_RASPBERRY_PI else 'tracker_log_emu'
+_THROTTLING_ERRORS = {'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded'}
+
+
+class DynamoDbBackend(LogBackend):
+  def __init__(self):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._table = None
+    self._table_lock = threading.Lock()
+
+  # boto3 takes over a second to import on a Pi Zero, so the import and the resource wait
+  # for the first write, which happens on the queue's writer thread rather than at startup
+  @property
+  def table(self):
+    with self._table_lock:
+      if self._table is None:
+        import boto3
+
+        runtime = RuntimeService()
+        self._table = boto3.resource(
+          'dynamodb',
+          aws_access_key_id=runtime.aws_access_key_id,
+          aws_secret_access_key=runtime.aws_secret_access_key,
+          region_name=config.AWS_REGION
+        ).Table(_DYNAMODB_TABLE_NAME)
+      return self._table
+
+  # Retries a failed batch with exponential backoff, which mostly covers throttling
+  # once the table's write capacity is used up.
+  def write(self, items: list[dict]):
+    delay = config.TRACKER_LOG_RETRY_BASE_SECONDS
+    for attempt in range(config.TRACKER_LOG_MAX_RETRIES + 1):
+      if self._batch_write(items):
+        return True
+      if attempt < config.TRACKER_LOG_MAX_RETRIES:
+        time.sleep(delay)
+        delay *= 2
+    return False
+
+  def _batch_write(self, items: list[dict]):
+    try:
+      with self.table.batch_writer() as batch:
+        for item in items:
+          batch.put_item(Item=item)
+      return True
+    except Exception as e:
+      if _is_throttling_error(e):
+        self.logger.warning(f'DynamoDB throttled a batch of {len(items)} entries.')
+      else:
+        self.logger.error('Failed to write entries to DynamoDB.', exc_info=True)
+      return False
+
+
+def _create_backend() -> LogBackend:
+  if config.TRACKER_LOG_BACKEND == 'dynamodb':
+    return DynamoDbBackend()
+  if config.TRACKER_LOG_BACKEND == 'sqlite':
+    return SqliteLogBackend(config.TRACKER_LOG_DB_FILE, prune_minutes=config.TRACKER_LOG_PRUNE_MINUTES)
+  raise ValueError(f'Unknown tracker log backend: {config.TRACKER_LOG_BACKEND}')
 
 
 class TrackerLog:
@@ -27,43 +92,116 @@ class TrackerLog:
       return
     self._initialized = True
     self.logger = logging.getLogger(config.APP_NAME)
-    runtime = RuntimeService()
-    self._table = boto3.resource(
-      'dynamodb',
-      aws_access_key_id=runtime.aws_access_key_id,
-      aws_secret_access_key=runtime.aws_secret_access_key,
-      region_name=config.AWS_REGION
-    ).Table(_DYNAMODB_TABLE_NAME)
-
-  def update_log(self, entries: list[dict]):
+    self._backend = _create_backend()
+    self._queue = WriteBehindQueue(self._backend.write,
+                                   max_items=config.TRACKER_LOG_QUEUE_SIZE,
+                                   batch_size=config.TRACKER_LOG_BATCH_SIZE,
+                                   flush_seconds=config.TRACKER_LOG_FLUSH_SECONDS,
+                                   overflow=config.TRACKER_LOG_OVERFLOW,
+                                   spill=self._spill if config.TRACKER_LOG_SPILL_FILE else None,
+                                   name='tracker-log')
+    self._fields = _projection(config.TRACKER_LOG_FIELDS, self.logger)
+    self._spill_full = False
+    self._delta_filter = None
+    if config.TRACKER_LOG_DELTA_MODE:
+      self._delta_filter = DeltaFilter(heartbeat_ms=config.TRACKER_LOG_HEARTBEAT_MINUTES * 60 * 1000,
+                                       position_threshold=config.TRACKER_LOG_POSITION_THRESHOLD,
+                                       altitude_threshold=config.TRACKER_LOG_ALTITUDE_THRESHOLD,
+                                       speed_threshold=config.TRACKER_LOG_SPEED_THRESHOLD)
+
+  # Queues the entries for the background writer; never waits on the backend
+  def update_log(self, entries: list[AircraftModel]):
     current_timestamp = TimeUtils.current_time_milli()
     expires_at = int(current_timestamp / 1000) + config.TRACKER_LOG_TTL_HOURS * 3600
+    timestamp_readable = datetime.fromtimestamp(current_timestamp / 1000).isoformat()
+
+    if self._delta_filter:
+      self._delta_filter.prune(current_timestamp)
 
     items = []
     for entry in entries:
-      try:
-        callsign = entry.get('flight') or entry.get('r')
-        callsign = callsign.strip()
-      except AttributeError:
+      callsign = entry.flight or entry.r
+      if not callsign:
         self.logger.warning(f'Entry {entry} does not have an identifier. Flight will not be logged.')
         continue
+      if self._delta_filter and not self._delta_filter.should_write(entry, current_timestamp):
+        continue
 
-      item = _floats_to_decimal(entry)
+      if self._fields:
+        item = _to_item(entry, self._fields, config.TRACKER_LOG_DECIMALS)
+      else:
+        item = _floats_to_decimal(entry.to_dict())
       item['callsign'] = callsign
       item['timestamp'] = int(current_timestamp)
-      item['timestamp_readable'] = datetime.fromtimestamp(current_timestamp / 1000).isoformat()
+      item['timestamp_readable'] = timestamp_readable
       item['expires_at'] = expires_at
       items.append(item)
 
-    self._batch_write(items)
+    self._queue.put(items)
 
-  def _batch_write(self, items: list[dict]):
+  # Writes everything still queued on the calling thread
+  def flush(self):
+    self._queue.flush()
+
+  # Releases the backend (e.g. the sqlite connection); call flush() first
+  def close(self):
+    self._backend.close()
+
+  @property
+  def stats(self):
+    stats = self._queue.stats
+    stats['suppressed'] = self._delta_filter.suppressed if self._delta_filter else 0
+    return stats
+
+  # Appends entries that couldn't be written to a local JSON Lines file. Nothing reads them
+  # back, so once the file reaches TRACKER_LOG_SPILL_MAX_MB they're dropped instead.
+  def _spill(self, items: list[dict]):
     try:
-      with self._table.batch_writer() as batch:
-        for item in items:
-          batch.put_item(Item=item)
-    except Exception:
-      self.logger.error('Failed to write entries to DynamoDB.', exc_info=True)
+      size = os.path.getsize(config.TRACKER_LOG_SPILL_FILE)
+    except FileNotFoundError:
+      size = 0
+    if size >= config.TRACKER_LOG_SPILL_MAX_MB * 1024 * 1024:
+      if not self._spill_full:
+        self._spill_full = True
+        self.logger.warning(f'{config.TRACKER_LOG_SPILL_FILE} is full. Dropping entries that could not be written.')
+      return False
+
+    self._spill_full = False
+    os.makedirs(os.path.dirname(config.TRACKER_LOG_SPILL_FILE) or '.', exist_ok=True)
+    with open(config.TRACKER_LOG_SPILL_FILE, 'a') as f:
+      for item in items:
+        f.write(json.dumps(item, default=float) + '\n')
+    return True
+
+
+def _is_throttling_error(error: Exception):
+  code = getattr(error, 'response', {}).get('Error', {}).get('Code')
+  return code in _THROTTLING_ERRORS
+
+
+# Keeps the configured fields that exist on AircraftModel, in order. None writes every field.
+def _projection(fields, logger):
+  if fields is None:
+    return None
+  unknown = [field for field in fields if field not in AircraftModel.__slots__]
+  if unknown:
+    logger.warning(f'Ignoring unknown tracker log fields: {unknown}')
+  return tuple(field for field in fields if field in AircraftModel.__slots__)
+
+
+# Builds an item from the projected fields in one flat pass. Missing and blank values are
+# left out, and floats are rounded to `decimals` places (1 unless listed) before becoming
+# Decimals, since DynamoDB sizes numbers by their significant digits.
+def _to_item(entry: AircraftModel, fields, decimals):
+  item = {}
+  for field in fields:
+    value = getattr(entry, field)
+    if value is None or value == '':
+      continue
+    if type(value) is float:
+      value = Decimal(f'{value:.{decimals.get(field, 1)}f}')
+    item[field] = value
+  return item
 
 
 def _floats_to_decimal(obj):
@@ -0,0 +1,132 @@
+import config
+import logging
+import threading
+import time
+
+from collections import deque
+
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+SPILL = 'spill'
+
+'''
+Bounded in-memory buffer that hands items to a slow sink in batches on a
+background thread, so callers never wait on the sink.
+
+A batch is written once `batch_size` items are waiting or `flush_seconds`
+after the writer picked up the first of them, whichever comes first.
+`write(batch)` returns True when the batch was stored; a batch it couldn't
+store is passed to `spill` if one was given, otherwise dropped. `spill`
+returns False when it can't take any more, and the items are dropped.
+
+When the buffer is full, `overflow` decides what gives:
+  drop_oldest - discard the oldest buffered item to make room
+  drop_newest - discard the incoming item
+  spill       - pass the incoming item to `spill` instead of buffering it
+'''
+class WriteBehindQueue:
+  def __init__(self, write, max_items, batch_size, flush_seconds, overflow=DROP_OLDEST, spill=None, name='write-behind'):
+    if overflow == SPILL and spill is None:
+      raise ValueError('The spill overflow policy needs a spill function')
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._write = write
+    self._spill = spill
+    self._max_items = max_items
+    self._batch_size = batch_size
+    self._flush_seconds = flush_seconds
+    self._overflow = overflow
+    self._name = name
+    self._buffer = deque()
+    self._condition = threading.Condition()
+    self._thread = None
+    self._stats = {'queued': 0, 'written': 0, 'dropped': 0, 'spilled': 0}
+
+  def put(self, items):
+    overflowed = []
+    with self._condition:
+      for item in items:
+        if len(self._buffer) >= self._max_items:
+          if self._overflow == DROP_OLDEST:
+            self._buffer.popleft()
+            self._stats['dropped'] += 1
+          else:
+            overflowed.append(item)
+            continue
+        self._buffer.append(item)
+        self._stats['queued'] += 1
+      self._condition.notify()
+
+    if overflowed:
+      self.logger.warning(f'{self._name} queue is full. {len(overflowed)} item(s) not queued.')
+      self._discard(overflowed)
+    self._ensure_writer()
+
+  # Writes everything currently buffered on the calling thread
+  def flush(self):
+    while True:
+      with self._condition:
+        batch = self._take_batch()
+      if not batch:
+        return
+      self._write_batch(batch)
+
+  @property
+  def stats(self):
+    with self._condition:
+      return dict(self._stats, pending=len(self._buffer))
+
+  def _ensure_writer(self):
+    with self._condition:
+      if self._thread and self._thread.is_alive():
+        return
+      self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+      self._thread.start()
+
+  def _take_batch(self):
+    count = min(self._batch_size, len(self._buffer))
+    return [self._buffer.popleft() for _ in range(count)]
+
+  def _next_batch(self):
+    with self._condition:
+      while not self._buffer:
+        self._condition.wait()
+
+      deadline = time.monotonic() + self._flush_seconds
+      while len(self._buffer) < self._batch_size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+          break
+        self._condition.wait(remaining)
+      return self._take_batch()
+
+  def _run(self):
+    while True:
+      batch = self._next_batch()
+      if batch:
+        self._write_batch(batch)
+
+  def _write_batch(self, batch):
+    try:
+      written = self._write(batch)
+    except Exception:
+      self.logger.error(f'{self._name} write failed.', exc_info=True)
+      written = False
+
+    if written:
+      with self._condition:
+        self._stats['written'] += len(batch)
+    else:
+      self._discard(batch)
+
+  def _discard(self, items):
+    if self._spill is not None:
+      try:
+        if self._spill(items) is not False:
+          with self._condition:
+            self._stats['spilled'] += len(items)
+          return
+      except Exception:
+        self.logger.error(f'{self._name} spill failed.', exc_info=True)
+
+    with self._condition:
+      self._stats['dropped'] += len(items)
@@ -0,0 +1,85 @@
+from typing import NamedTuple
+
+REPLACEMENT_CODEPOINT = 0xFFFD
+
+'''
+Minimal BDF reader, for drawing and measuring text without a canvas.
+
+Glyph placement follows rpi-rgb-led-matrix's Font::DrawGlyph (and the
+emulator's copy of it): a glyph's bitmap sits `height + y_offset` rows above
+the baseline, shifted right by `x_offset`, and anything past its advance
+width is dropped. Missing characters fall back to U+FFFD, then to nothing.
+'''
+class Glyph(NamedTuple):
+  advance: int
+  width: int
+  height: int
+  x_offset: int
+  y_offset: int
+  rows: tuple  # one int per bitmap row, leftmost pixel in the highest of row_bits bits
+  row_bits: int
+
+  # (x, y) of each lit pixel, x from the pen position and y down from the glyph's top row
+  def pixels(self):
+    for y, row in enumerate(self.rows):
+      for col in range(self.width):
+        if self.x_offset + col >= self.advance:
+          break
+        if (row >> (self.row_bits - 1 - col)) & 1:
+          yield self.x_offset + col, y
+
+
+class BdfFont:
+  def __init__(self, height, baseline, glyphs: dict[int, Glyph]):
+    self.height = height
+    self.baseline = baseline
+    self._glyphs = glyphs
+    # What DrawText advances for each character; layout measures text from this
+    self.advances = {codepoint: glyph.advance for codepoint, glyph in glyphs.items()}
+    replacement = glyphs.get(REPLACEMENT_CODEPOINT)
+    self._missing_advance = replacement.advance if replacement else 0
+
+  def glyph(self, codepoint: int):
+    return self._glyphs.get(codepoint) or self._glyphs.get(REPLACEMENT_CODEPOINT)
+
+  def advance(self, codepoint: int):
+    return self.advances.get(codepoint, self._missing_advance)
+
+
+def load_bdf(path: str) -> BdfFont:
+  height = baseline = 0
+  glyphs = {}
+  with open(path, 'r', encoding='latin-1') as file:
+    lines = iter(file)
+    for line in lines:
+      keyword, _, value = line.strip().partition(' ')
+      if keyword == 'FONTBOUNDINGBOX':
+        _, height, _, y_offset = (int(v) for v in value.split())
+        baseline = height + y_offset
+      elif keyword == 'STARTCHAR':
+        codepoint, glyph = _read_glyph(lines)
+        if codepoint >= 0:
+          glyphs[codepoint] = glyph
+  return BdfFont(height, baseline, glyphs)
+
+
+def _read_glyph(lines):
+  codepoint, advance, bbx = -1, 0, (0, 0, 0, 0)
+  for line in lines:
+    keyword, _, value = line.strip().partition(' ')
+    if keyword == 'ENCODING':
+      codepoint = int(value.split()[0])
+    elif keyword == 'DWIDTH':
+      advance = int(value.split()[0])
+    elif keyword == 'BBX':
+      bbx = tuple(int(v) for v in value.split())
+    elif keyword == 'BITMAP':
+      rows = []
+      for row in lines:
+        row = row.strip()
+        if row == 'ENDCHAR':
+          break
+        rows.append(row)
+      row_bits = len(rows[0]) * 4 if rows else 0
+      return codepoint, Glyph(advance, *bbx, rows=tuple(int(row, 16) for row in rows), row_bits=row_bits)
+  return codepoint, Glyph(advance, *bbx, rows=(), row_bits=0)
@@ -1,6 +1,7 @@
 import os
 from services.matrix_service import graphics
 from setup import screen
+from setup.bdf import BdfFont, load_bdf
 
 # Fonts
 DIR_PATH = os.path.dirname(os.path.realpath(__file__))
@@ -31,21 +32,40 @@ large = graphics.Font()
 large_bold = graphics.Font()
 
 # Load fonts with appropriate scaling
-if screen.IS_RASPBERRY_PI:
-    extrasmall.LoadFont(f"{FONT_DIR}/4x6.bdf")
-    small.LoadFont(f"{FONT_DIR}/5x8.bdf")
-    regular.LoadFont(f"{FONT_DIR}/6x13.bdf")
-    regular_bold.LoadFont(f"{FONT_DIR}/6x13B.bdf")
-    regularplus.LoadFont(f"{FONT_DIR}/7x13.bdf")
-    regularplus_bold.LoadFont(f"{FONT_DIR}/7x13B.bdf")
-    large.LoadFont(f"{FONT_DIR}/8x13.bdf")
-    large_bold.LoadFont(f"{FONT_DIR}/8x13B.bdf")
-else:
-    extrasmall.LoadFont(f"{FONT_DIR}/4x6{FONT_SUFFIX}.bdf")
-    small.LoadFont(f"{FONT_DIR}/5x8{FONT_SUFFIX}.bdf")
-    regular.LoadFont(f"{FONT_DIR}/6x13{FONT_SUFFIX}.bdf")
-    regular_bold.LoadFont(f"{FONT_DIR}/6x13B{FONT_SUFFIX}.bdf")
-    regularplus.LoadFont(f"{FONT_DIR}/7x13{FONT_SUFFIX}.bdf")
-    regularplus_bold.LoadFont(f"{FONT_DIR}/7x13B{FONT_SUFFIX}.bdf")
-    large.LoadFont(f"{FONT_DIR}/8x13{FONT_SUFFIX}.bdf")
-    large_bold.LoadFont(f"{FONT_DIR}/8x13B{FONT_SUFFIX}.bdf")
+# The files are remembered so text can be drawn and measured off-canvas, see bdf()
+_FONT_FILES = {}
+_BDF_FONTS = {}
+
+
+def _load(font, name):
+    path = f"{FONT_DIR}/{name}.bdf" if screen.IS_RASPBERRY_PI else f"{FONT_DIR}/{name}{FONT_SUFFIX}.bdf"
+    font.LoadFont(path)
+    _FONT_FILES[font] = path
+
+
+_load(extrasmall, "4x6")
+_load(small, "5x8")
+_load(regular, "6x13")
+_load(regular_bold, "6x13B")
+_load(regularplus, "7x13")
+_load(regularplus_bold, "7x13B")
+_load(large, "8x13")
+_load(large_bold, "8x13B")
+
+
+# The parsed glyphs of a loaded font, read from its file the first time they're needed
+def bdf(font) -> BdfFont:
+    parsed = _BDF_FONTS.get(font)
+    if parsed is None:
+        parsed = _BDF_FONTS[font] = load_bdf(_FONT_FILES[font])
+    return parsed
+
+
+# Widths DrawText would advance for each character of text, measured without drawing
+def char_widths(font, text):
+    advance = bdf(font).advance
+    return [advance(ord(ch)) for ch in text]
+
+
+def text_width(font, text):
+    return sum(char_widths(font, text))
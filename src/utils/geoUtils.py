@@ -0,0 +1,92 @@
+import heapq
+import math
+
+# NumPy ships with RGBMatrixEmulator and Raspberry Pi OS. Without it the same
+# kernels run as plain Python loops.
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+EARTH_RADIUS_M = 6371000  # Earth's radius in m
+METERS_TO_MILES = 0.000621371
+
+
+class GeoUtils:
+  '''
+  Batched great-circle kernels. The batch functions take parallel sequences
+  of latitudes and longitudes (degrees) and a [lat, lon] home position, and
+  return one value per aircraft.
+  '''
+  def __init__(self):
+    pass
+
+
+  # Haversine distance in miles (unrounded)
+  @staticmethod
+  def distances_miles(lats, lons, home):
+    if np is None:
+      return [GeoUtils.distance_miles(lat, lon, home) for lat, lon in zip(lats, lons)]
+
+    phi1 = np.radians(np.asarray(lats, dtype=np.float64))
+    lambda1 = np.radians(np.asarray(lons, dtype=np.float64))
+    phi2 = math.radians(home[0])
+    lambda2 = math.radians(home[1])
+
+    a = np.sin((phi2 - phi1) / 2.0) ** 2 + np.cos(phi1) * math.cos(phi2) * np.sin((lambda2 - lambda1) / 2.0) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return EARTH_RADIUS_M * c * METERS_TO_MILES
+
+
+  # Initial bearing from home to each aircraft, in degrees [0, 360)
+  @staticmethod
+  def bearings(lats, lons, home):
+    if np is None:
+      return [GeoUtils.bearing(lat, lon, home) for lat, lon in zip(lats, lons)]
+
+    lat1 = math.radians(home[0])
+    long1 = math.radians(home[1])
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))
+    long2 = np.radians(np.asarray(lons, dtype=np.float64))
+
+    bearing = np.arctan2(
+      np.sin(long2 - long1) * np.cos(lat2),
+      math.cos(lat1) * np.sin(lat2) - math.sin(lat1) * np.cos(lat2) * np.cos(long2 - long1)
+    )
+    return (np.degrees(bearing) + 360) % 360
+
+
+  # Indices of the `limit` smallest distances, closest first. Ties keep their input order.
+  @staticmethod
+  def nearest(distances, limit):
+    if np is None:
+      return heapq.nsmallest(limit, range(len(distances)), key=distances.__getitem__)
+    return np.argsort(distances, kind='stable')[:limit].tolist()
+
+
+  # Scalar versions for single aircraft, where NumPy's per-call overhead isn't worth it
+  @staticmethod
+  def distance_miles(lat, lon, home):
+    phi1 = math.radians(lat)
+    phi2 = math.radians(home[0])
+
+    delta_phi = math.radians(home[0] - lat)
+    delta_lambda = math.radians(home[1] - lon)
+
+    a = math.sin(delta_phi / 2.0) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2.0) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return EARTH_RADIUS_M * c * METERS_TO_MILES
+
+
+  @staticmethod
+  def bearing(lat, lon, home):
+    lat1 = math.radians(home[0])
+    long1 = math.radians(home[1])
+    lat2 = math.radians(lat)
+    long2 = math.radians(lon)
+
+    bearing = math.atan2(
+      math.sin(long2 - long1) * math.cos(lat2),
+      math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(long2 - long1)
+    )
+    return (math.degrees(bearing) + 360) % 360
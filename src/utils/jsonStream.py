@@ -0,0 +1,101 @@
+import codecs
+import json
+
+CHUNK_SIZE = 16384
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',]}' + _WHITESPACE
+
+
+class JsonStream:
+  '''
+  Incrementally decodes the elements of one array inside a top-level JSON
+  object, e.g. the 'ac' list of an adsb.lol response, without holding the
+  whole body (or the whole parsed document) in memory. Only the current
+  chunk and the element being decoded are buffered.
+
+  `read` is any callable returning up to `amt` bytes, such as
+  HTTPResponse.read; it returns b'' once the body is exhausted.
+  '''
+  def __init__(self, read, chunk_size=CHUNK_SIZE):
+    self._read = read
+    self._chunk_size = chunk_size
+    self._decoder = json.JSONDecoder()
+    self._bytes_decoder = codecs.getincrementaldecoder('utf-8')()
+    self._buffer = ''
+    self._pos = 0
+    self._eof = False
+
+  def _fill(self):
+    if self._eof:
+      return False
+    chunk = self._read(self._chunk_size)
+    if not chunk:
+      self._eof = True
+      return False
+    # Drop what has already been consumed so the buffer stays bounded
+    self._buffer = self._buffer[self._pos:] + self._bytes_decoder.decode(chunk)
+    self._pos = 0
+    return True
+
+  def _skip_whitespace(self):
+    while True:
+      while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+        self._pos += 1
+      if self._pos < len(self._buffer) or not self._fill():
+        return
+
+  def _expect(self, token):
+    self._skip_whitespace()
+    if self._buffer[self._pos:self._pos + 1] != token:
+      raise json.JSONDecodeError(f'Expecting {token!r}', self._buffer, self._pos)
+    self._pos += 1
+
+  def _peek(self):
+    self._skip_whitespace()
+    return self._buffer[self._pos:self._pos + 1]
+
+  def _value(self):
+    '''
+    Decodes the next complete JSON value. A value is only accepted once a
+    delimiter follows it (or the stream is exhausted), since a number split
+    across chunks, e.g. '1712345678.' + '5', also decodes as a shorter value.
+    '''
+    self._skip_whitespace()
+    while True:
+      try:
+        value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        if self._eof or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS):
+          self._pos = end
+          return value
+      except json.JSONDecodeError:
+        if self._eof:
+          raise
+      self._fill()
+
+  def array_items(self, key):
+    '''
+    Yields each element of the array stored under `key` in the top-level
+    object. Raises KeyError if the object has no such key.
+    '''
+    self._expect('{')
+    if self._peek() == '}':
+      raise KeyError(key)
+
+    while True:
+      name = self._value()
+      self._expect(':')
+      if name == key:
+        break
+      self._value()
+      if self._peek() == '}':
+        raise KeyError(key)
+      self._expect(',')
+
+    self._expect('[')
+    if self._peek() == ']':
+      return
+    while True:
+      yield self._value()
+      if self._peek() == ']':
+        return
+      self._expect(',')
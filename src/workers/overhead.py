@@ -1,14 +1,18 @@
 from services.adsbTracker import AdsbTrackerService
 from services.airlineLookup import AirlineLookupService
 from services.flightLogic import FlightLogic
-from threading import Thread, Lock
-from time import sleep
 from services.geo import GeoService
+from services.logoCache import LogoCache
+from types import MappingProxyType
+from typing import NamedTuple
+from workers.poller import Poller
+from workers.pollSchedule import PollSchedule
 
 import config
 import json
 import logging
 import re
+import time
 
 from requests.exceptions import ConnectionError
 from urllib3.exceptions import NewConnectionError
@@ -19,11 +23,23 @@ from services.trackerLog import TrackerLog
 
 
 EARTH_RADIUS_M = 6371000  # Earth's radius in m
-BLANK_FIELDS = ["", "N/A", "NONE", "UNKNOWN"]
 NW = 315  # degrees
 SE = 135  # degrees
 
 AIRLINE_CODE_REG = r'^(?P<icao>[a-zA-Z]{3}+)+[0-9]*\s*$'
+LOCATION_WAIT_LOG_SECONDS = 10 # how often to log while the first poll waits for the location
+
+
+# What the render loop reads. A new snapshot (with a higher sequence) is swapped in
+# after every poll; entries are read-only so the poller can never mutate data
+# a scene is drawing.
+class OverheadSnapshot(NamedTuple):
+  sequence: int
+  data: tuple
+
+
+EMPTY_SNAPSHOT = OverheadSnapshot(sequence=0, data=())
+
 
 class Overhead:
   def __init__(self):
@@ -33,27 +49,56 @@ class Overhead:
     self._airline_lookup = AirlineLookupService()
     self._flight_logic = FlightLogic()
     self._tracker_log = TrackerLog()
-    self._lock = Lock()
-    self._data = []
-    self._new_data = False
-    self._processing = False
+    self._logo_cache = LogoCache()
+    self._snapshot = EMPTY_SNAPSHOT
+    self._schedule = PollSchedule(base=config.POLL_INTERVAL,
+                                  floor=config.POLL_INTERVAL_FLOOR,
+                                  ceiling=config.POLL_INTERVAL_CEILING,
+                                  busy_aircraft=config.POLL_BUSY_AIRCRAFT,
+                                  busy_turnover=config.POLL_BUSY_TURNOVER)
+    self._poller = Poller(self._poll,
+                          interval=self._schedule.interval,
+                          jitter=config.POLL_JITTER,
+                          backoff_base=config.POLL_BACKOFF_BASE,
+                          backoff_max=config.POLL_BACKOFF_MAX,
+                          name='overhead-poller')
     self.dupe_tracker = {}
-
-  def grab_data(self):
-    while not len(self._geo_service.location):
+    self._metrics_logged_at = None
+
+  def start(self):
+    self._poller.start()
+
+  # The tracker log's writer is a daemon thread, so whatever it still has queued is
+  # written here before the process exits
+  def stop(self):
+    self._poller.stop(timeout=1)
+    self._tracker_log.flush()
+    self._tracker_log.close()
+
+  # Runs on the poller thread. Returns False when the poll should be retried with backoff.
+  def _poll(self):
+    # The location loads in the background at startup. Waiting for it here, rather than
+    # failing the poll, means the first fetch happens as soon as it's ready instead of
+    # after the poller's failure backoff.
+    while not self._geo_service.wait_for_location(timeout=LOCATION_WAIT_LOG_SECONDS):
       self.logger.info('Waiting for location data...')
-      sleep(1)
-
-    with self._lock:
-      if self._processing:
-        return
-
-      self._new_data = False
-      self._processing = True
 
-    t = Thread(target=self._grab_data)
-    t.daemon = True
-    t.start()
+    data = self._grab_data()
+    self._publish(data or [])
+    self._log_poll_metrics()
+    return data is not None
+
+  def _log_poll_metrics(self):
+    now = time.monotonic()
+    if self._metrics_logged_at is not None and now - self._metrics_logged_at < config.POLL_METRICS_LOG_MINUTES * 60:
+      return
+    self._metrics_logged_at = now
+    self.logger.info(f'Poll metrics: {self.poll_metrics}')
+
+  def _publish(self, data):
+    # Replacing the reference is atomic, so readers never need a lock
+    self._snapshot = OverheadSnapshot(sequence=self._snapshot.sequence + 1,
+                                      data=tuple(MappingProxyType(entry) for entry in data))
   
   @staticmethod
   def tokenize_airline_code_from_callsign(callsign: str) -> str:
@@ -62,8 +107,8 @@ class Overhead:
     return icao
       
 
+  # Returns the entries to display, or None if the flights couldn't be fetched
   def _grab_data(self):
-    # Mark data as old
     data = []
 
     # Grab flight details
@@ -74,29 +119,21 @@ class Overhead:
         self.logger.warning("Timeout experienced when getting nearby flights.", exc_info=True)
         flights = None
 
-      if not flights or len(flights) == 0:
-        with self._lock:
-          self._new_data = False
-          self._processing = False
-          self._data = []
-        sleep(0.1)
-        return
+      if flights is None:
+        return None
+      self._schedule.observe(flights)
+      if len(flights) == 0:
+        return []
 
+      # Only queues the entries; the tracker log writes them on its own thread
       self._tracker_log.update_log(flights)
       self.logger.debug(f'Retrieved {len(flights)} flights')
 
       flight, route = self._flight_logic.choose_flight(flights, self._adsb_api.get_routeset)
 
       if flight:
-        # Get plane type
         flight_capture_timestamp = datetime.now()
-        try:
-          plane = flight['t']
-        except (KeyError, TypeError):
-          plane = ""
-
-        # Tidy up what we pass along
-        plane = plane if not (plane.upper() in BLANK_FIELDS) else ""
+        plane = flight.t
 
         try:
           airport_details = route['_airports'][len(route['_airports']) - 2:]
@@ -111,9 +148,7 @@ class Overhead:
           origin = {'iata': '', 'icao': '', 'lat': 0, 'lon': 0, 'alt_feet': 0}
           destination = {'iata': '', 'icao': '', 'lat': 0, 'lon': 0, 'alt_feet': 0}
 
-        callsign: str = flight['flight']
-        if callsign.upper() in BLANK_FIELDS:
-          callsign = ''
+        callsign: str = flight.flight
 
         if (route.get('airline_code')):
           airline = self._airline_lookup.lookup(route['airline_code'])
@@ -129,16 +164,12 @@ class Overhead:
 
         # Get owner icao
         owner_icao = route.get('airline_code') or Overhead.tokenize_airline_code_from_callsign(callsign=callsign)
+        # Decoded in the background while the rest of the entry is built, so the logo scene finds it cached
+        self._logo_cache.prefetch(owner_icao)
         owner_iata = airline or 'N/A'
 
-        try:
-          vertical_speed = flight['baro_rate']
-        except KeyError:
-          try:
-            vertical_speed = flight['geom_rate']
-          except KeyError:
-            vertical_speed = 0
-            
+        vertical_speed = flight.vertical_speed
+
         origin_str: str
         destination_str: str
         if origin['iata']:
@@ -155,7 +186,8 @@ class Overhead:
         else:
           destination_str = ''
 
-        try:
+        # Speed and altitude are what the details scene shows; without them there's nothing to display
+        if flight.gs is not None and flight.alt_geom is not None:
           data.append(
             {
               "airline": airline,
@@ -166,13 +198,13 @@ class Overhead:
               "destination": destination_str,
               "vertical_speed": vertical_speed,
               "callsign": callsign,
-              "registration": flight['r'],
+              "registration": flight.r,
               "distance_origin": distance_origin,
               "distance_destination": distance_destination,
               "distance": FlightLogic.distance_from_flight_to_location(flight, self._geo_service.location),
               "direction": FlightLogic.degrees_to_cardinal(FlightLogic.plane_bearing(flight)),
-              "ground_speed": flight['gs'],
-              "altitude": flight['alt_geom']
+              "ground_speed": flight.gs,
+              "altitude": flight.alt_geom
             }
           )
           
@@ -190,53 +222,35 @@ class Overhead:
             "Flight": callsign,
             "Route": route_str,
             "Plane": plane,
-            "Altitude": f"{flight['alt_geom']} ft",
-            "Ground Speed": f"{flight['gs']} kts"
+            "Altitude": f"{flight.alt_geom} ft",
+            "Ground Speed": f"{flight.gs} kts"
           }
           
           # Serialize the log and remove bracks and quotes
           log_str = json.dumps(log).replace("{", "").replace("}", "").replace("\"", "")
           self.logger.info(log_str)
-          
-          with self._lock:
-            self._new_data = len(data) > 0
-            self._processing = False
-            self._data = data
-        except KeyError:
-          with self._lock:
-            self._new_data = False
-            self._processing = False
-            self._data = []
+
+        return data
       else:
         self.logger.info(f'No eligible flights found in the area.')
-        with self._lock:
-          self._new_data = False
-          self._processing = False
-          self._data = []
+        return []
 
     except (ConnectionError, NewConnectionError, MaxRetryError):
-      with self._lock:
-        self._new_data = False
-        self._processing = False
-        self._data = []
+      return None
 
   @property
-  def new_data(self):
-    with self._lock:
-      return self._new_data
+  def snapshot(self) -> OverheadSnapshot:
+    return self._snapshot
 
   @property
   def processing(self):
-    with self._lock:
-      return self._processing
-
-  @property
-  def data(self):
-    with self._lock:
-      self._new_data = False
-      return self._data
+    return self._poller.busy
 
+  # The interval picked by the schedule and why, plus the delay actually used
+  # (after jitter and any failure backoff)
   @property
-  def data_is_empty(self):
-    with self._lock:
-      return len(self._data) == 0
+  def poll_metrics(self):
+    metrics = self._schedule.metrics
+    metrics['last_delay'] = round(self._poller.last_delay, 1)
+    metrics['failures'] = self._poller.failures
+    return metrics
@@ -0,0 +1,83 @@
+import config
+import logging
+import threading
+
+from datetime import datetime
+
+
+# Mirrors the display's night brightness window: night runs from NIGHT_START to NIGHT_END
+def night_mode_active(now: datetime = None):
+  if not config.NIGHT_BRIGHTNESS:
+    return False
+  now = (now or datetime.now()).time().replace(second=0, microsecond=0)
+  night_start = datetime.strptime(config.NIGHT_START, '%H:%M').time()
+  night_end = datetime.strptime(config.NIGHT_END, '%H:%M').time()
+  return not (night_end <= now < night_start)
+
+
+class PollSchedule:
+  '''
+  Picks the delay before the next flight poll from what the last poll saw.
+
+  A busy sky (many aircraft in range, or many that weren't there on the
+  previous poll) shortens the delay in proportion to how far past the busy
+  thresholds it is. An empty sky, or night mode, stretches it to the
+  ceiling. The result is always kept within [floor, ceiling].
+  '''
+  def __init__(self, base, floor, ceiling, busy_aircraft, busy_turnover, is_night=night_mode_active):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._base = base
+    self._floor = floor
+    self._ceiling = ceiling
+    self._busy_aircraft = busy_aircraft
+    self._busy_turnover = busy_turnover
+    self._is_night = is_night
+    self._lock = threading.Lock()
+    self._seen = None
+    self._metrics = {'interval': base, 'aircraft': None, 'turnover': None, 'night': False, 'reason': 'default'}
+
+  # Records the aircraft (by hex) returned by the latest poll
+  def observe(self, flights):
+    current = {flight.hex for flight in flights}
+    with self._lock:
+      if self._seen is None or not current:
+        turnover = 0.0
+      else:
+        turnover = len(current - self._seen) / len(current)
+      self._seen = current
+      self._metrics['aircraft'] = len(current)
+      self._metrics['turnover'] = round(turnover, 3)
+
+  def interval(self):
+    night = self._is_night()
+    with self._lock:
+      aircraft = self._metrics['aircraft']
+      turnover = self._metrics['turnover']
+
+      if night:
+        interval, reason = self._ceiling, 'night'
+      elif aircraft is None:
+        interval, reason = self._base, 'default'
+      elif aircraft == 0:
+        interval, reason = self._ceiling, 'empty'
+      else:
+        activity = max(aircraft / self._busy_aircraft, turnover / self._busy_turnover)
+        if activity > 1:
+          interval, reason = self._base / activity, 'busy'
+        else:
+          interval, reason = self._base, 'normal'
+
+      interval = min(max(interval, self._floor), self._ceiling)
+      # A busy interval scales with activity and shifts on most polls, so only a change of
+      # reason is worth an INFO line
+      if reason != self._metrics['reason']:
+        self.logger.info(f'Poll interval now {interval:.0f}s ({reason}, {aircraft} aircraft, {turnover} turnover)')
+      elif interval != self._metrics['interval']:
+        self.logger.debug(f'Poll interval now {interval:.0f}s ({reason}, {aircraft} aircraft, {turnover} turnover)')
+      self._metrics.update(interval=interval, night=night, reason=reason)
+      return interval
+
+  @property
+  def metrics(self):
+    with self._lock:
+      return dict(self._metrics)
@@ -0,0 +1,72 @@
+import config
+import logging
+import random
+import threading
+
+
+class Poller:
+  '''
+  Calls `poll` on one long-lived daemon thread, independent of the frame loop.
+
+  `poll` returns True when it succeeded. A falsy return or an exception counts
+  as a failure, and consecutive failures back off exponentially from
+  `backoff_base` up to `backoff_max` seconds. After a success the next poll is
+  `interval` seconds away; `interval` may be a callable so the owner can adapt
+  the schedule between polls. Every delay is spread by +/- `jitter` (a
+  fraction of the delay).
+  '''
+  def __init__(self, poll, interval, jitter=0.0, backoff_base=5, backoff_max=300, name='poller', rng=None):
+    self.logger = logging.getLogger(config.APP_NAME)
+    self._poll = poll
+    self._interval = interval
+    self._jitter = jitter
+    self._backoff_base = backoff_base
+    self._backoff_max = backoff_max
+    self._name = name
+    self._rng = rng or random.Random()
+    self._failures = 0
+    self._stop_event = threading.Event()
+    self._thread = None
+    self.busy = False
+    self.last_delay = 0
+
+  def start(self):
+    if self._thread and self._thread.is_alive():
+      return
+    self._stop_event.clear()
+    self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+    self._thread.start()
+
+  def stop(self, timeout=None):
+    self._stop_event.set()
+    if self._thread:
+      self._thread.join(timeout)
+
+  @property
+  def failures(self):
+    return self._failures
+
+  def next_delay(self, succeeded: bool):
+    if succeeded:
+      self._failures = 0
+      delay = self._interval() if callable(self._interval) else self._interval
+    else:
+      self._failures += 1
+      delay = min(self._backoff_base * 2 ** (self._failures - 1), self._backoff_max)
+    return max(0, delay * (1 + self._rng.uniform(-self._jitter, self._jitter)))
+
+  def _run(self):
+    while not self._stop_event.is_set():
+      self.busy = True
+      try:
+        succeeded = bool(self._poll())
+      except Exception:
+        self.logger.error(f'{self._name} poll failed.', exc_info=True)
+        succeeded = False
+      finally:
+        self.busy = False
+
+      self.last_delay = self.next_delay(succeeded)
+      if not succeeded:
+        self.logger.warning(f'{self._name} poll failed {self._failures} time(s) in a row. Retrying in {self.last_delay:.1f}s')
+      self._stop_event.wait(self.last_delay)
@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from display.dirtyRegions import DirtyRegions
+
+
+def test_starts_clean():
+    regions = DirtyRegions(64, 32)
+    assert not regions
+    assert regions.area == 0
+
+
+def test_mark_records_region():
+    regions = DirtyRegions(64, 32)
+    regions.mark(2, 3, 10, 8)
+    assert regions
+    assert regions.regions == [(2, 3, 10, 8)]
+    assert regions.area == 40
+
+
+def test_mark_clips_to_screen():
+    regions = DirtyRegions(64, 32)
+    regions.mark(-5, 30, 70, 40)
+    assert regions.regions == [(0, 30, 64, 32)]
+
+
+def test_mark_ignores_region_off_screen():
+    regions = DirtyRegions(64, 32)
+    regions.mark(64, 0, 80, 10)
+    regions.mark(10, 10, 10, 20)
+    assert not regions
+
+
+def test_overlapping_regions_merge_into_bounding_box():
+    regions = DirtyRegions(64, 32)
+    regions.mark(0, 0, 10, 10)
+    regions.mark(5, 5, 20, 12)
+    assert regions.regions == [(0, 0, 20, 12)]
+
+
+def test_adjacent_regions_stay_separate():
+    regions = DirtyRegions(64, 32)
+    regions.mark(0, 0, 10, 10)
+    regions.mark(10, 0, 20, 10)
+    assert len(regions.regions) == 2
+    assert regions.area == 200
+
+
+def test_merge_repeats_until_no_overlap():
+    regions = DirtyRegions(64, 32)
+    regions.mark(10, 5, 14, 9)
+    regions.mark(0, 0, 4, 10)
+    # Overlaps only the second region, but merging with it reaches the first
+    regions.mark(3, 0, 12, 2)
+    assert regions.regions == [(0, 0, 14, 10)]
+
+
+def test_mark_all_covers_screen():
+    regions = DirtyRegions(64, 32)
+    regions.mark(1, 1, 2, 2)
+    regions.mark_all()
+    assert regions.regions == [(0, 0, 64, 32)]
+
+
+def test_clear_empties_regions():
+    regions = DirtyRegions(64, 32)
+    regions.mark_all()
+    regions.clear()
+    assert not regions
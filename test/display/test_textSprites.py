@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from display.textSprites import TextSpriteCache, render_text
+from services.matrix_service import graphics
+from setup import colours, fonts
+
+BLUE = colours.BLUE_LIGHT
+YELLOW = colours.TROPICAL_YELLOW
+
+
+class RecordingCanvas:
+    width = 1000
+    height = 100
+
+    def __init__(self):
+        self.pixels = {}
+
+    def SetPixel(self, x, y, r, g, b):
+        self.pixels[(x, y)] = (r, g, b)
+
+
+def lit_pixels(sprite):
+    image = sprite.image
+    return {(x, y): image.getpixel((x, y)) for x in range(image.width) for y in range(image.height)
+            if image.getpixel((x, y)) != (0, 0, 0)}
+
+
+def drawn_pixels(font, text, colour_for):
+    canvas = RecordingCanvas()
+    x = 0
+    for ch in text:
+        x += graphics.DrawText(canvas, font, x, font.baseline, colour_for(ch), ch)
+    return canvas.pixels, x
+
+
+def test_sprite_matches_draw_text():
+    for font in (fonts.small, fonts.extrasmall, fonts.large_bold):
+        sprite = render_text(fonts.bdf(font), 'UAL 1234 B738 4.21mi', BLUE)
+        pixels, length = drawn_pixels(font, 'UAL 1234 B738 4.21mi', lambda ch: BLUE)
+        assert lit_pixels(sprite) == pixels
+        assert sprite.width == length
+
+
+def test_numeric_colour_applies_to_digits():
+    sprite = render_text(fonts.bdf(fonts.small), 'UAL12', BLUE, numeric_colour=YELLOW)
+    pixels, _ = drawn_pixels(fonts.small, 'UAL12', lambda ch: YELLOW if ch.isnumeric() else BLUE)
+    assert lit_pixels(sprite) == pixels
+
+
+def test_sprite_is_font_height_and_padded():
+    sprite = render_text(fonts.bdf(fonts.small), 'UAL', BLUE, pad=3)
+    assert sprite.image.size == (sprite.width + 3, fonts.small.height)
+    assert all(sprite.image.getpixel((x, y)) == (0, 0, 0)
+               for x in range(sprite.width, sprite.width + 3) for y in range(fonts.small.height))
+
+
+def test_cache_reuses_sprite():
+    cache = TextSpriteCache(max_entries=4)
+    first = cache.get(fonts.small, 'UAL1', BLUE)
+    assert cache.get(fonts.small, 'UAL1', BLUE) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_keys_on_colour_and_padding():
+    cache = TextSpriteCache(max_entries=4)
+    cache.get(fonts.small, 'UAL1', BLUE)
+    cache.get(fonts.small, 'UAL1', YELLOW)
+    cache.get(fonts.small, 'UAL1', BLUE, numeric_colour=YELLOW)
+    cache.get(fonts.small, 'UAL1', BLUE, pad=2)
+    assert cache.misses == 4
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TextSpriteCache(max_entries=2)
+    first = cache.get(fonts.small, 'A', BLUE)
+    cache.get(fonts.small, 'B', BLUE)
+    cache.get(fonts.small, 'A', BLUE)
+    cache.get(fonts.small, 'C', BLUE)
+    assert len(cache) == 2
+    assert cache.get(fonts.small, 'A', BLUE) is first
+    cache.get(fonts.small, 'B', BLUE)
+    assert cache.misses == 4
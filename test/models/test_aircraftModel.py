@@ -0,0 +1,54 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from models.aircraftModel import AircraftModel
+
+
+RAW_AIRCRAFT = {
+  'hex': 'a1b2c3',
+  'type': 'adsb_icao',
+  'flight': 'UAL123  ',
+  'r': 'N12345',
+  't': 'B738',
+  'alt_baro': 35000,
+  'alt_geom': 35650,
+  'gs': 452.3,
+  'track': 271.6,
+  'baro_rate': -64,
+  'lat': 41.9,
+  'lon': -87.9,
+  'nav_modes': ['autopilot', 'vnav'],
+  'rssi': -21.4,
+}
+
+
+def test_from_json_keeps_only_known_fields():
+  aircraft = AircraftModel.from_json(RAW_AIRCRAFT)
+
+  assert aircraft.flight == 'UAL123'
+  assert aircraft.alt_baro == 35000
+  assert aircraft.geom_rate is None
+  assert not hasattr(aircraft, '__dict__')
+  with pytest.raises(AttributeError):
+    aircraft.rssi
+
+
+@pytest.mark.parametrize('placeholder', ['', 'N/A', 'none', 'Unknown', '   ', None])
+def test_from_json_normalizes_placeholder_text(placeholder):
+  aircraft = AircraftModel.from_json({'hex': 'abc', 'flight': placeholder, 't': placeholder})
+
+  assert aircraft.flight == ''
+  assert aircraft.t == ''
+
+
+def test_vertical_speed_prefers_barometric_rate():
+  assert AircraftModel(baro_rate=-64, geom_rate=128).vertical_speed == -64
+  assert AircraftModel(geom_rate=128).vertical_speed == 128
+  assert AircraftModel().vertical_speed == 0
+
+
+def test_to_dict_omits_missing_numeric_fields():
+  aircraft = AircraftModel.from_json({'hex': 'abc', 'flight': 'AAL1', 'lat': 41.9})
+
+  assert aircraft.to_dict() == {'hex': 'abc', 'flight': 'AAL1', 'r': '', 't': '', 'lat': 41.9}
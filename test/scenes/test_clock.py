@@ -0,0 +1,77 @@
+import os
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import scenes.clock as clock
+from scenes.clock import ClockScene
+
+
+class ClockHost(ClockScene):
+  def __init__(self):
+    super().__init__()
+    self.canvas = MagicMock()
+    self._data = []
+    self.dirty = []
+
+  def mark_text_dirty(self, font, x, y, length):
+    self.dirty.append((x, y, length))
+
+
+@pytest.fixture
+def mock_graphics():
+  with patch.object(clock, "graphics") as mg:
+    mg.DrawText.return_value = 30
+    yield mg
+
+
+def at(hour, minute):
+  return patch.object(clock, "datetime", MagicMock(now=MagicMock(return_value=datetime(2024, 5, 1, hour, minute))))
+
+
+def test_clock_draws_and_marks_first_time(mock_graphics):
+  host = ClockHost()
+  with at(9, 30):
+    host.clock(0)
+  mock_graphics.DrawText.assert_called_once()
+  assert host.dirty == [(clock.CLOCK_POSITION[0], clock.CLOCK_POSITION[1], 30)]
+
+
+def test_clock_skips_drawing_until_the_minute_changes(mock_graphics):
+  host = ClockHost()
+  with at(9, 30):
+    host.clock(0)
+    host.clock(1)
+  assert mock_graphics.DrawText.call_count == 1
+  assert len(host.dirty) == 1
+
+
+def test_clock_erases_old_time_when_the_minute_changes(mock_graphics):
+  host = ClockHost()
+  with at(9, 30):
+    host.clock(0)
+  with at(9, 31):
+    host.clock(1)
+  assert mock_graphics.DrawText.call_count == 3
+  assert len(host.dirty) == 3
+
+
+def test_reset_clock_forces_a_redraw(mock_graphics):
+  host = ClockHost()
+  with at(9, 30):
+    host.clock(0)
+    host.reset_clock()
+    host.clock(1)
+  assert mock_graphics.DrawText.call_count == 2
+
+
+def test_clock_does_not_draw_with_flight_data(mock_graphics):
+  host = ClockHost()
+  host._data = [{"callsign": "UAL1"}]
+  host.clock(0)
+  mock_graphics.DrawText.assert_not_called()
+  assert host.dirty == []
@@ -1,34 +1,77 @@
-import json
 import os
 import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
 import scenes.flightlogo as flightlogo
+from scenes.flightlogo import FlightLogoScene
 
 
-def test_record_missing_logo_creates_and_increments(tmp_path, monkeypatch):
-  missing_dir = tmp_path / "missing_logos"
-  missing_file = missing_dir / "missing_logos.json"
+class LogoHost(FlightLogoScene):
+  def __init__(self, data):
+    super().__init__()
+    self.matrix = MagicMock()
+    self._data = data
+    self._data_index = 0
+    self.squares = []
 
-  monkeypatch.setattr(flightlogo, "MISSING_LOGOS_DIR", str(missing_dir))
-  monkeypatch.setattr(flightlogo, "MISSING_LOGOS_FILE", str(missing_file))
+  def draw_square(self, x0, y0, x1, y1, colour):
+    self.squares.append((x0, y0, x1, y1))
 
-  flightlogo._record_missing_logo("ABC")
-  assert missing_file.exists()
 
-  with open(missing_file, "r", encoding="utf-8") as file:
-    data = json.load(file)
-  assert data == {"ABC": 1}
+@pytest.fixture
+def mock_logos():
+  with patch.object(flightlogo, "LogoCache") as ml:
+    yield ml.return_value
 
-  flightlogo._record_missing_logo("ABC")
-  with open(missing_file, "r", encoding="utf-8") as file:
-    data = json.load(file)
-  assert data == {"ABC": 2}
 
-  flightlogo._record_missing_logo("DEF")
-  with open(missing_file, "r", encoding="utf-8") as file:
-    data = json.load(file)
-  assert data == {"ABC": 2, "DEF": 1}
+def test_no_data_draws_nothing(mock_logos):
+  host = LogoHost([])
+  host.logo_details()
+  assert host.squares == []
+  host.matrix.SetImage.assert_not_called()
+
+
+def test_draws_cached_logo(mock_logos):
+  logo = object()
+  mock_logos.get.return_value = logo
+  host = LogoHost([{"owner_icao": "UAL"}])
+
+  host.logo_details()
+
+  assert host.squares == [(0, 0, flightlogo.LOGO_SIZE, flightlogo.LOGO_SIZE)]
+  mock_logos.get.assert_called_once_with("UAL")
+  host.matrix.SetImage.assert_called_once_with(logo)
+
+
+def test_logo_still_loading_shows_default_then_swaps_in(mock_logos):
+  default, logo = object(), object()
+  mock_logos.get.side_effect = lambda icao: default if icao == "" else None
+  mock_logos.__contains__.return_value = False
+  host = LogoHost([{"owner_icao": "UAL"}])
+
+  host.logo_details()
+  host.logo_loaded(0)
+  host.matrix.SetImage.assert_called_once_with(default)
+
+  mock_logos.get.side_effect = lambda icao: logo
+  mock_logos.__contains__.return_value = True
+  host.logo_loaded(1)
+  host.logo_loaded(2)
+  assert host.matrix.SetImage.call_args_list[1:] == [((logo,),)]
+
+
+def test_reset_forgets_pending_logo(mock_logos):
+  mock_logos.get.return_value = None
+  host = LogoHost([{"owner_icao": "UAL"}])
+  host.logo_details()
+
+  host._data = []
+  host.logo_details()
+  mock_logos.__contains__.return_value = True
+  host.logo_loaded(0)
+
+  host.matrix.SetImage.assert_not_called()
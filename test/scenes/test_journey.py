@@ -0,0 +1,50 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import scenes.journey as journey
+from scenes.journey import JourneyScene
+from setup import fonts
+
+
+class JourneyHost(JourneyScene):
+  def __init__(self, data):
+    super().__init__()
+    self.canvas = MagicMock()
+    self._data = data
+    self._data_index = 0
+
+  def draw_square(self, x0, y0, x1, y1, colour):
+    pass
+
+
+@pytest.fixture
+def host():
+  return JourneyHost([{
+    "origin": "ORD", "destination": "DEN", "distance_origin": 12.3, "distance_destination": 880.1,
+  }])
+
+
+def test_journey_draws_distances_without_measuring_on_the_canvas(host):
+  with patch.object(journey, "graphics") as mock_graphics:
+    mock_graphics.DrawText.return_value = 10
+    host.journey()
+
+  distance_calls = [c for c in mock_graphics.DrawText.call_args_list if c.args[1] is journey.DISTANCE_FONT]
+  assert all(c.args[3] == journey.DISTANCE_POSITION[1] for c in distance_calls)
+  assert "".join(c.args[5] for c in distance_calls) == "12mi880mi"
+
+
+def test_journey_advances_distance_characters_by_glyph_width(host):
+  with patch.object(journey, "graphics") as mock_graphics:
+    mock_graphics.DrawText.return_value = 10
+    host.journey()
+
+  distance_calls = [c for c in mock_graphics.DrawText.call_args_list if c.args[1] is journey.DISTANCE_FONT]
+  origin_xs = [c.args[2] for c in distance_calls[:4]]
+  widths = fonts.char_widths(journey.DISTANCE_FONT, "12mi")
+  assert [b - a for a, b in zip(origin_xs, origin_xs[1:])] == widths[:-1]
@@ -1,21 +1,33 @@
+import io
 import json
 import pytest
+import threading
 from unittest.mock import patch, MagicMock
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
-from services.adsbTracker import AdsbTrackerService
+from models.aircraftModel import AircraftModel
+from services.adsbTracker import AdsbTrackerService, merge_routes
 
 @pytest.fixture
 def mock_config():
   with patch('services.adsbTracker.config') as mock_config:
     # Set APP_NAME to a string to avoid TypeError in logging.getLogger
     mock_config.APP_NAME = 'test_app'
+    mock_config.ADSB_MAX_CONNECTIONS = 2
+    mock_config.ADSB_CONNECTION_IDLE_TIMEOUT = 60
+    mock_config.ROUTE_CACHE_TTL = 30
+    mock_config.ROUTE_NEGATIVE_CACHE_TTL = 5
+    mock_config.ROUTESET_CHUNK_SIZE = 20
+    mock_config.ROUTESET_MAX_CHUNKS = 5
+    mock_config.ROUTESET_MAX_WORKERS = 2
+    mock_config.ROUTESET_DEADLINE_SECONDS = 5
+    mock_config.ROUTE_CACHE_MAX_ENTRIES = 500
     yield mock_config
 
 @pytest.fixture
 def mock_https_connection():
-  with patch('services.adsbTracker.http.client.HTTPSConnection') as mock_https_connection:
+  with patch('services.connectionPool.http.client.HTTPSConnection') as mock_https_connection:
     yield mock_https_connection
 
 def test_get_nearby_flight_success(mock_config, mock_https_connection):
@@ -23,12 +35,12 @@ def test_get_nearby_flight_success(mock_config, mock_https_connection):
   mock_conn = mock_https_connection.return_value
   mock_response = MagicMock()
   mock_response.status = 200
-  mock_response.read.return_value = json.dumps({
+  mock_response.read.side_effect = io.BytesIO(json.dumps({
     'ac': [
       {'alt_baro': 10000, 'dst': 5},
       {'alt_baro': 15000, 'dst': 3}
     ]
-  }).encode('utf-8')
+  }).encode('utf-8')).read
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
@@ -36,14 +48,14 @@ def test_get_nearby_flight_success(mock_config, mock_https_connection):
 
   assert result is not None
   assert len(result) == 2
-  assert result[0]['alt_baro'] == 10000
-  assert result[1]['alt_baro'] == 15000
+  assert result[0].alt_baro == 10000
+  assert result[1].alt_baro == 15000
 
 def test_get_nearby_flights_no_ac_field(mock_config, mock_https_connection):
   mock_config.ADSB_LOL_URL = 'test_url'
   mock_conn = mock_https_connection.return_value
   mock_response = MagicMock()
-  mock_response.read.return_value = json.dumps({}).encode('utf-8')
+  mock_response.read.side_effect = io.BytesIO(json.dumps({}).encode('utf-8')).read
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
@@ -67,7 +79,7 @@ def test_get_nearby_flights_bad_json(mock_config, mock_https_connection):
   mock_config.ADSB_LOL_URL = 'test_url'
   mock_conn = mock_https_connection.return_value
   mock_response = MagicMock()
-  mock_response.read.return_value = 'bad json'.encode('utf-8')
+  mock_response.read.side_effect = io.BytesIO('bad json'.encode('utf-8')).read
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
@@ -80,9 +92,9 @@ def test_get_nearby_flights_missing_ac_key(mock_config, mock_https_connection):
   mock_conn = mock_https_connection.return_value
   mock_response = MagicMock()
   mock_response.status = 200
-  mock_response.read.return_value = json.dumps({
+  mock_response.read.side_effect = io.BytesIO(json.dumps({
     'some_other_key': []
-  }).encode('utf-8')
+  }).encode('utf-8')).read
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
@@ -102,7 +114,7 @@ def test_get_routeset_success(mock_config, mock_https_connection):
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
-  flights = [{'flight': 'test_callsign', 'lat': 40.7128, 'lon': -74.0060}]
+  flights = [AircraftModel(flight='test_callsign', lat=40.7128, lon=-74.0060)]
   result = service.get_routeset(flights)
 
   assert result is not None
@@ -122,7 +134,7 @@ def test_get_routeset_no_callsign(mock_config, mock_https_connection):
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
-  flights = [{'flight': '', 'lat': 40.7128, 'lon': -74.0060}]
+  flights = [AircraftModel(flight='', lat=40.7128, lon=-74.0060)]
   result = service.get_routeset(flights)
 
   # Empty callsign matches empty callsign
@@ -137,7 +149,7 @@ def test_get_routeset_bad_status(mock_config, mock_https_connection):
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
-  flights = [{'flight': 'test_callsign', 'lat': 40.7128, 'lon': -74.0060}]
+  flights = [AircraftModel(flight='test_callsign', lat=40.7128, lon=-74.0060)]
   result = service.get_routeset(flights)
 
   # Bad status returns empty routeset
@@ -153,7 +165,7 @@ def test_get_routeset_bad_json(mock_config, mock_https_connection):
   mock_conn.getresponse.return_value = mock_response
 
   service = AdsbTrackerService()
-  flights = [{'flight': 'test_callsign', 'lat': 40.7128, 'lon': -74.0060}]
+  flights = [AircraftModel(flight='test_callsign', lat=40.7128, lon=-74.0060)]
   result = service.get_routeset(flights)
 
   # Bad JSON causes exception, returns empty routeset
@@ -183,7 +195,7 @@ def test_get_routeset_bad_status_logs_error(mock_config, mock_https_connection):
 
   service = AdsbTrackerService()
   with patch.object(service.logger, 'error') as mock_error:
-    service.get_routeset([{'flight': 'AAL1', 'lat': 40.7128, 'lon': -74.0060}])
+    service.get_routeset([AircraftModel(flight='AAL1', lat=40.7128, lon=-74.0060)])
     mock_error.assert_called_once()
     assert '429' in mock_error.call_args[0][0]
 
@@ -194,4 +206,298 @@ def test_get_headers_contains_required_fields(mock_config):
   headers = service._get_headers()
 
   assert headers['Accept'] == 'application/json'
-  assert headers['Content-Type'] == 'application/json'
\ No newline at end of file
+  assert headers['Content-Type'] == 'application/json'
+
+def make_routeset_response(routes, status=200):
+  response = MagicMock()
+  response.status = status
+  response.read.return_value = json.dumps(routes).encode('utf-8')
+  return response
+
+
+def posted_callsigns(mock_conn, call_index=-1):
+  body = mock_conn.request.call_args_list[call_index][0][2]
+  return [plane['callsign'] for plane in json.loads(body)['planes']]
+
+
+def test_get_routeset_serves_cached_routes_without_request(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.return_value = make_routeset_response([{'callsign': 'AAL1', '_airports': ['ORD'], 'plausible': 1}])
+
+  service = AdsbTrackerService()
+  flights = [AircraftModel.from_json({'flight': 'AAL1  ', 'lat': 41.9, 'lon': -87.9})]
+  service.get_routeset(flights)
+  result = service.get_routeset(flights)
+
+  assert mock_conn.request.call_count == 1
+  assert len(result) == 1
+  assert result[0]['flight'] is flights[0]
+  assert result[0]['route']['_airports'] == ['ORD']
+
+
+def test_get_routeset_only_requests_uncached_callsigns(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([{'callsign': 'AAL1', '_airports': ['ORD'], 'plausible': 1}]),
+    make_routeset_response([{'callsign': 'UAL2', '_airports': ['DEN'], 'plausible': 1}]),
+  ]
+
+  service = AdsbTrackerService()
+  service.get_routeset([AircraftModel(flight='AAL1', lat=41.9, lon=-87.9)])
+  result = service.get_routeset([
+    AircraftModel(flight='AAL1', lat=41.9, lon=-87.9),
+    AircraftModel(flight='UAL2', lat=41.8, lon=-87.7),
+  ])
+
+  assert posted_callsigns(mock_conn) == ['UAL2']
+  assert {item['route']['callsign'] for item in result} == {'AAL1', 'UAL2'}
+
+
+def test_get_routeset_refetches_expired_routes(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([{'callsign': 'AAL1', '_airports': ['ORD'], 'plausible': 1}]),
+    make_routeset_response([{'callsign': 'AAL1', '_airports': ['LGA'], 'plausible': 1}]),
+  ]
+
+  with patch('services.routeCache.TimeUtils') as mock_time:
+    mock_time.current_time_milli.return_value = 0
+    service = AdsbTrackerService()
+    flights = [AircraftModel(flight='AAL1', lat=41.9, lon=-87.9)]
+    service.get_routeset(flights)
+
+    mock_time.current_time_milli.return_value = 31 * 60 * 1000
+    result = service.get_routeset(flights)
+
+  assert mock_conn.request.call_count == 2
+  assert result[0]['route']['_airports'] == ['LGA']
+
+
+def test_get_routeset_returns_cached_routes_when_request_fails(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([{'callsign': 'AAL1', '_airports': ['ORD'], 'plausible': 1}]),
+    make_routeset_response([], status=503),
+  ]
+
+  service = AdsbTrackerService()
+  service.get_routeset([AircraftModel(flight='AAL1', lat=41.9, lon=-87.9)])
+  result = service.get_routeset([
+    AircraftModel(flight='AAL1', lat=41.9, lon=-87.9),
+    AircraftModel(flight='UAL2', lat=41.8, lon=-87.7),
+  ])
+
+  assert [item['route']['callsign'] for item in result] == ['AAL1']
+
+
+def test_get_routeset_skips_recently_unroutable_callsigns(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([
+      {'callsign': 'N123AB', '_airports': [], 'plausible': 0},
+      {'callsign': 'RCH42', '_airports': ['DOV'], 'plausible': 0},
+    ]),
+    make_routeset_response([{'callsign': 'UAL2', '_airports': ['DEN'], 'plausible': 1}]),
+  ]
+
+  service = AdsbTrackerService()
+  flights = [
+    AircraftModel(flight='N123AB', lat=41.9, lon=-87.9),
+    AircraftModel(flight='RCH42', lat=41.9, lon=-87.9),
+    AircraftModel(flight='SWA3', lat=41.9, lon=-87.9),
+  ]
+  service.get_routeset(flights)
+  service.get_routeset(flights + [AircraftModel(flight='UAL2', lat=41.8, lon=-87.7)])
+
+  assert posted_callsigns(mock_conn) == ['UAL2']
+
+
+def test_get_routeset_retries_unroutable_callsigns_after_negative_ttl(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([{'callsign': 'RCH42', '_airports': [], 'plausible': 0}]),
+    make_routeset_response([{'callsign': 'RCH42', '_airports': ['DOV'], 'plausible': 1}]),
+  ]
+
+  with patch('services.routeCache.TimeUtils') as mock_time:
+    mock_time.current_time_milli.return_value = 0
+    service = AdsbTrackerService()
+    flights = [AircraftModel(flight='RCH42', lat=41.9, lon=-87.9)]
+    assert service.get_routeset(flights) == []
+
+    mock_time.current_time_milli.return_value = 4 * 60 * 1000
+    assert service.get_routeset(flights) == []
+    assert mock_conn.request.call_count == 1
+
+    mock_time.current_time_milli.return_value = 5 * 60 * 1000
+    result = service.get_routeset(flights)
+
+  assert mock_conn.request.call_count == 2
+  assert result[0]['route']['_airports'] == ['DOV']
+
+
+def test_get_routeset_does_not_mark_unroutable_when_request_fails(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.side_effect = [
+    make_routeset_response([], status=503),
+    make_routeset_response([{'callsign': 'AAL1', '_airports': ['ORD'], 'plausible': 1}]),
+  ]
+
+  service = AdsbTrackerService()
+  flights = [AircraftModel(flight='AAL1', lat=41.9, lon=-87.9)]
+  service.get_routeset(flights)
+  result = service.get_routeset(flights)
+
+  assert mock_conn.request.call_count == 2
+  assert len(result) == 1
+
+
+def test_merge_routes_pairs_by_stripped_callsign():
+  flights = [AircraftModel.from_json({'flight': 'AAL1  '}), AircraftModel.from_json({'flight': 'UAL2'})]
+  routes = [{'callsign': 'UAL2 '}, {'callsign': 'AAL1'}]
+
+  result = merge_routes(flights, routes)
+
+  assert [item['flight'] for item in result] == flights
+  assert [item['route']['callsign'] for item in result] == ['AAL1', 'UAL2 ']
+
+
+def test_merge_routes_skips_flights_without_route():
+  flights = [AircraftModel(flight='AAL1'), AircraftModel(flight='N123AB')]
+  routes = [{'callsign': 'AAL1'}]
+
+  result = merge_routes(flights, routes)
+
+  assert len(result) == 1
+  assert result[0]['flight'].flight == 'AAL1'
+
+
+def make_flights(count, prefix='AAL'):
+  return [AircraftModel(flight=f'{prefix}{i}', lat=41.9, lon=-87.9) for i in range(count)]
+
+
+def routes_for(flights):
+  return [{'callsign': f.flight, '_airports': ['ORD', 'JFK'], 'plausible': 1} for f in flights]
+
+
+def test_get_routeset_requests_all_flights_in_ordered_chunks(mock_config):
+  mock_config.ROUTESET_MAX_WORKERS = 1
+  service = AdsbTrackerService()
+  flights = make_flights(45)
+  requested = []
+
+  def fake_fetch(chunk, timeout):
+    requested.append([f.flight for f in chunk])
+    return routes_for(chunk)
+
+  with patch.object(service, '_fetch_routes', side_effect=fake_fetch):
+    result = service.get_routeset(flights)
+
+  assert [len(chunk) for chunk in requested] == [20, 20, 5]
+  assert requested[0][0] == 'AAL0'
+  assert [item['flight'] for item in result] == flights
+
+
+def test_get_routeset_limits_number_of_chunks(mock_config):
+  mock_config.ROUTESET_MAX_CHUNKS = 2
+  service = AdsbTrackerService()
+
+  with patch.object(service, '_fetch_routes', side_effect=lambda chunk, timeout: routes_for(chunk)) as mock_fetch:
+    result = service.get_routeset(make_flights(100))
+
+  assert mock_fetch.call_count == 2
+  assert len(result) == 40
+
+
+def test_get_routeset_returns_chunks_completed_before_deadline(mock_config):
+  mock_config.ROUTESET_DEADLINE_SECONDS = 0.2
+  service = AdsbTrackerService()
+  flights = make_flights(25)
+  release = threading.Event()
+  finished = threading.Event()
+
+  def fake_fetch(chunk, timeout):
+    if chunk[0].flight != 'AAL0':
+      release.wait(5)
+      finished.set()
+    return routes_for(chunk)
+
+  with patch.object(service, '_fetch_routes', side_effect=fake_fetch) as mock_fetch:
+    result = service.get_routeset(flights)
+    assert len(result) == 20
+
+    # The late chunk still lands in the cache for the next poll
+    release.set()
+    finished.wait(5)
+    service._routeset_executor.shutdown(wait=True)
+    assert service._route_cache.get('AAL24') is not None
+
+
+def test_get_routeset_partial_failure_returns_successful_chunks(mock_config):
+  service = AdsbTrackerService()
+
+  def fake_fetch(chunk, timeout):
+    return None if chunk[0].flight == 'AAL0' else routes_for(chunk)
+
+  with patch.object(service, '_fetch_routes', side_effect=fake_fetch):
+    result = service.get_routeset(make_flights(30))
+
+  assert [item['flight'].flight for item in result] == [f'AAL{i}' for i in range(20, 30)]
+
+
+def make_point_response(body: bytes):
+  response = MagicMock()
+  response.status = 200
+  response.read.side_effect = io.BytesIO(body).read
+  return response
+
+
+def test_get_nearby_flights_filters_non_integer_altitude(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.return_value = make_point_response(json.dumps({
+    'ac': [
+      {'hex': 'a', 'alt_baro': 'ground'},
+      {'hex': 'b', 'alt_baro': 12000},
+      {'hex': 'c'},
+    ],
+    'msg': 'No error',
+  }).encode('utf-8'))
+
+  result = AdsbTrackerService().get_nearby_flights(40.7128, -74.0060, 10)
+
+  assert [x.hex for x in result] == ['b']
+
+
+def test_get_nearby_flights_builds_aircraft_records(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  mock_conn.getresponse.return_value = make_point_response(json.dumps({
+    'ac': [{'hex': 'a', 'flight': 'AAL1    ', 'alt_baro': 12000, 'rssi': -20.1, 'nav_modes': ['autopilot'], 'mlat': []}],
+  }).encode('utf-8'))
+
+  result = AdsbTrackerService().get_nearby_flights(40.7128, -74.0060, 10)
+
+  assert len(result) == 1
+  assert isinstance(result[0], AircraftModel)
+  assert result[0].to_dict() == {'hex': 'a', 'flight': 'AAL1', 'r': '', 't': '', 'alt_baro': 12000}
+
+
+def test_get_nearby_flights_reads_body_in_chunks(mock_config, mock_https_connection):
+  mock_config.ADSB_LOL_URL = 'test_url'
+  mock_conn = mock_https_connection.return_value
+  body = json.dumps({'ac': [{'hex': f'{i:06x}', 'alt_baro': 30000 + i} for i in range(2000)], 'total': 2000}).encode('utf-8')
+  response = make_point_response(body)
+  mock_conn.getresponse.return_value = response
+
+  result = AdsbTrackerService().get_nearby_flights(40.7128, -74.0060, 10)
+
+  assert len(result) == 2000
+  assert all(call.args and call.args[0] < len(body) for call in response.read.call_args_list[:-1])
@@ -3,7 +3,7 @@ import pytest
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
-from services.airlineLookup import AirlineLookupService
+from services.airlineLookup import AirlineLookupService, build_index, compile_airline_db
 
 # Constants
 AIRLINES_JSON_PATH = 'src/app_data/airlines.json'
@@ -98,3 +98,91 @@ def test_air_premia_entry_complete():
   assert air_premia['callsign'] == 'AIR PREMIA'
   assert air_premia['country'] == 'South Korea'
   assert air_premia['active'] == 'Y'
+
+def test_build_index_prefers_active_duplicate():
+  """Test that an active airline wins over an inactive one sharing its ICAO code"""
+  airlines = [
+    {'icao': 'BON', 'name': 'B&H Airlines', 'active': 'N'},
+    {'icao': 'BON', 'name': 'Air Bosna', 'active': 'Y'},
+    {'icao': 'BON', 'name': 'Later Active', 'active': 'Y'},
+  ]
+
+  assert build_index(airlines) == {'BON': 'Air Bosna'}
+
+def test_build_index_keeps_first_inactive_duplicate():
+  """Test that the first entry is kept when no duplicate is active"""
+  airlines = [
+    {'icao': 'ABX', 'name': 'Airborne Express', 'active': 'N'},
+    {'icao': 'ABX', 'name': 'ABX Air', 'active': 'N'},
+  ]
+
+  assert build_index(airlines) == {'ABX': 'Airborne Express'}
+
+def test_build_index_skips_blank_icao():
+  """Test that entries without an ICAO code are not indexed"""
+  airlines = [{'icao': '', 'name': 'Abacus International', 'active': 'Y'}]
+
+  assert build_index(airlines) == {}
+
+def test_lookup_duplicate_icao_returns_active_airline():
+  """Test that lookup resolves a shared ICAO code to the active carrier"""
+  service = AirlineLookupService()
+
+  assert service.lookup('BON') == 'Air Bosna'
+
+def _write_airlines(path, airlines):
+  with open(path, 'w') as f:
+    json.dump(airlines, f)
+
+def test_compiled_table_lookup(tmp_path):
+  """Test that the compiled table resolves every indexed airline"""
+  source = tmp_path / 'airlines.json'
+  compiled = tmp_path / 'airlines.bin'
+  _write_airlines(source, [
+    {'icao': 'UAL', 'name': 'United Airlines', 'active': 'Y'},
+    {'icao': 'AAL', 'name': 'American Airlines', 'active': 'Y'},
+    {'icao': 'KTK', 'name': 'Ünïcode Air', 'active': 'Y'},
+  ])
+
+  assert compile_airline_db(str(source), str(compiled)) == 3
+
+  service = AirlineLookupService(str(source), str(compiled))
+  assert service.lookup('UAL') == 'United Airlines'
+  assert service.lookup('aal') == 'American Airlines'
+  assert service.lookup('KTK') == 'Ünïcode Air'
+  assert service.lookup('DAL') == ''
+  assert service.lookup('TOOLONGCODE') == ''
+
+def test_compiled_table_built_when_missing(tmp_path):
+  """Test that the service compiles the table on first use"""
+  source = tmp_path / 'airlines.json'
+  compiled = tmp_path / 'airlines.bin'
+  _write_airlines(source, [{'icao': 'UAL', 'name': 'United Airlines', 'active': 'Y'}])
+
+  service = AirlineLookupService(str(source), str(compiled))
+
+  assert compiled.exists()
+  assert service.lookup('UAL') == 'United Airlines'
+
+def test_compiled_table_rebuilt_when_source_changes(tmp_path):
+  """Test that editing the JSON source triggers a recompile"""
+  source = tmp_path / 'airlines.json'
+  compiled = tmp_path / 'airlines.bin'
+  _write_airlines(source, [{'icao': 'UAL', 'name': 'United Airlines', 'active': 'Y'}])
+  AirlineLookupService(str(source), str(compiled))
+
+  _write_airlines(source, [{'icao': 'UAL', 'name': 'United', 'active': 'Y'}])
+  stat = os.stat(source)
+  os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+  assert AirlineLookupService(str(source), str(compiled)).lookup('UAL') == 'United'
+
+def test_falls_back_to_memory_index_when_table_unwritable(tmp_path):
+  """Test that lookups still work if the compiled table cannot be written"""
+  source = tmp_path / 'airlines.json'
+  compiled = tmp_path / 'missing_dir' / 'airlines.bin'
+  _write_airlines(source, [{'icao': 'UAL', 'name': 'United Airlines', 'active': 'Y'}])
+
+  service = AirlineLookupService(str(source), str(compiled))
+
+  assert service.lookup('UAL') == 'United Airlines'
@@ -0,0 +1,68 @@
+import pytest
+import json
+from unittest.mock import patch, MagicMock
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from services.authentication import AuthenticationService
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    AuthenticationService._instance = None
+    yield
+    AuthenticationService._instance = None
+
+
+@pytest.fixture
+def mock_config():
+    with patch('services.authentication.config') as mc:
+        mc.APP_NAME = 'test_app'
+        mc.AWS_REGION = 'us-east-2'
+        mc.RAPIDAPI_KEY_NAME = 'rapidapi'
+        mc.RAPIDAPI_TOKEN_KEYNAME = 'token'
+        yield mc
+
+
+@pytest.fixture
+def mock_runtime():
+    with patch('services.authentication.RuntimeService') as mr:
+        mr.return_value.aws_access_key_id = 'fake_key'
+        mr.return_value.aws_secret_access_key = 'fake_secret'
+        yield mr
+
+
+@pytest.fixture
+def mock_boto3():
+    mb = MagicMock()
+    mb.client.return_value.get_secret_value.return_value = {'SecretString': json.dumps({'token': 'abc123'})}
+    with patch.dict('sys.modules', {'boto3': mb}):
+        yield mb
+
+
+def test_init_does_not_fetch_secret(mock_config, mock_runtime, mock_boto3):
+    AuthenticationService()
+    mock_boto3.client.assert_not_called()
+
+
+def test_rapidapi_token_fetches_secret_on_first_use(mock_config, mock_runtime, mock_boto3):
+    assert AuthenticationService().rapidapi_token == 'abc123'
+    mock_boto3.client.assert_called_once_with('secretsmanager', aws_access_key_id='fake_key',
+                                              aws_secret_access_key='fake_secret', region_name='us-east-2')
+
+
+def test_rapidapi_token_is_fetched_once(mock_config, mock_runtime, mock_boto3):
+    AuthenticationService().rapidapi_token
+    AuthenticationService().rapidapi_token
+    mock_boto3.client.return_value.get_secret_value.assert_called_once_with(SecretId='rapidapi')
+
+
+def test_rapidapi_token_is_none_after_retries_fail(mock_config, mock_runtime, mock_boto3):
+    mock_boto3.client.side_effect = Exception('no network')
+    with patch('services.authentication.time'):
+        service = AuthenticationService()
+        assert service.rapidapi_token is None
+        assert service.rapidapi_token is None
+    assert service.error
+    assert mock_boto3.client.call_count == 4
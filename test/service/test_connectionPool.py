@@ -0,0 +1,144 @@
+import http.client
+import pytest
+import threading
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from services.connectionPool import ConnectionPool
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+
+  def setup(self):
+    super().setup()
+    with self.server.stats_lock:
+      self.server.connections += 1
+
+  def do_GET(self):
+    body = b'{"ac": []}'
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+    # Simulate a server dropping an idle keep-alive connection without telling the client
+    if self.server.drop_after_response:
+      self.close_connection = True
+
+  def do_POST(self):
+    length = int(self.headers.get('Content-Length', 0))
+    body = self.rfile.read(length)
+    self.send_response(200)
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format, *args):
+    pass
+
+
+@pytest.fixture
+def server():
+  httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+  httpd.connections = 0
+  httpd.stats_lock = threading.Lock()
+  httpd.drop_after_response = False
+  thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+  thread.start()
+  yield httpd
+  httpd.shutdown()
+  httpd.server_close()
+
+
+def host_of(server):
+  return f'127.0.0.1:{server.server_address[1]}'
+
+
+def make_pool(**kwargs):
+  return ConnectionPool(connection_cls=http.client.HTTPConnection, **kwargs)
+
+
+def test_sequential_requests_reuse_connection(server):
+  pool = make_pool()
+
+  for _ in range(3):
+    with pool.request(host_of(server), 'GET', '/v2/point') as response:
+      assert response.status == 200
+      assert response.read() == b'{"ac": []}'
+
+  assert server.connections == 1
+  pool.close()
+
+
+def test_get_and_post_share_connection(server):
+  pool = make_pool()
+
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    response.read()
+  with pool.request(host_of(server), 'POST', '/api/0/routeset', '{"planes": []}') as response:
+    assert response.read() == b'{"planes": []}'
+
+  assert server.connections == 1
+  pool.close()
+
+
+def test_idle_timeout_discards_connection(server):
+  pool = make_pool(idle_timeout=0)
+
+  for _ in range(2):
+    with pool.request(host_of(server), 'GET', '/v2/point') as response:
+      response.read()
+
+  assert server.connections == 2
+  pool.close()
+
+
+def test_reconnects_when_server_dropped_idle_connection(server):
+  pool = make_pool()
+  server.drop_after_response = True
+
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    response.read()
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    assert response.status == 200
+    assert response.read() == b'{"ac": []}'
+
+  assert server.connections == 2
+  pool.close()
+
+
+def test_unread_response_is_not_reused(server):
+  pool = make_pool()
+
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    assert response.status == 200
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    response.read()
+
+  assert server.connections == 2
+  pool.close()
+
+
+def test_per_host_limit_times_out(server):
+  pool = make_pool(max_per_host=1)
+
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    response.read()
+    with pytest.raises(TimeoutError):
+      with pool.request(host_of(server), 'GET', '/v2/point', timeout=0.1):
+        pass
+
+  # The slot is released once the first request completes
+  with pool.request(host_of(server), 'GET', '/v2/point') as response:
+    assert response.read() == b'{"ac": []}'
+  pool.close()
+
+
+def test_connection_error_on_fresh_connection_propagates():
+  pool = make_pool()
+
+  with pytest.raises(ConnectionError):
+    with pool.request('127.0.0.1:1', 'GET', '/v2/point', timeout=1):
+      pass
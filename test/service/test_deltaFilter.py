@@ -0,0 +1,83 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from models.aircraftModel import AircraftModel
+from services.deltaFilter import DeltaFilter, KNOTS_TO_MPH, MILES_PER_DEGREE_LAT
+
+MINUTE_MS = 60 * 1000
+
+
+def make_filter():
+  return DeltaFilter(heartbeat_ms=5 * MINUTE_MS, position_threshold=1, altitude_threshold=500, speed_threshold=25)
+
+
+def northbound(minutes, **overrides):
+  # 480 kts due north, positioned where dead reckoning expects it after `minutes`
+  miles = 480 * KNOTS_TO_MPH * minutes / 60
+  fields = dict(hex='abc', flight='UAL1', lat=41.0 + miles / MILES_PER_DEGREE_LAT, lon=-87.0,
+                alt_baro=35000, gs=480, track=0)
+  fields.update(overrides)
+  return AircraftModel(**fields)
+
+
+def test_first_sighting_is_written():
+  assert make_filter().should_write(northbound(0), 0) is True
+
+
+def test_straight_and_level_flight_is_suppressed_until_heartbeat():
+  delta = make_filter()
+  delta.should_write(northbound(0), 0)
+
+  written = [delta.should_write(northbound(minute), minute * MINUTE_MS) for minute in range(1, 6)]
+
+  assert written == [False, False, False, False, True]
+  assert delta.suppressed == 4
+
+
+def test_turn_is_written():
+  delta = make_filter()
+  delta.should_write(northbound(0), 0)
+
+  # Two minutes later it turned east and is several miles off the predicted track
+  assert delta.should_write(northbound(0, lat=41.05, lon=-86.85, track=90), 2 * MINUTE_MS) is True
+
+
+@pytest.mark.parametrize('change, expected', [
+  ({'alt_baro': 35400}, False),
+  ({'alt_baro': 35500}, True),
+  ({'gs': 500}, False),
+  ({'gs': 505}, True),
+])
+def test_altitude_and_speed_thresholds(change, expected):
+  delta = make_filter()
+  delta.should_write(northbound(0), 0)
+
+  assert delta.should_write(northbound(1, **change), MINUTE_MS) is expected
+
+
+def test_prune_forgets_aircraft_past_heartbeat():
+  delta = make_filter()
+  delta.should_write(northbound(0), 0)
+  delta.should_write(northbound(0, hex='def'), 4 * MINUTE_MS)
+
+  delta.prune(5 * MINUTE_MS)
+
+  assert list(delta._last_logged) == ['def']
+
+
+def test_aircraft_without_position_only_logs_on_heartbeat():
+  delta = make_filter()
+  parked = AircraftModel(hex='abc', flight='UAL1', alt_baro=35000)
+  delta.should_write(parked, 0)
+
+  assert delta.should_write(parked, MINUTE_MS) is False
+  assert delta.should_write(parked, 5 * MINUTE_MS) is True
+
+
+def test_steady_climb_is_suppressed_but_level_off_is_written():
+  delta = make_filter()
+  delta.should_write(northbound(0, alt_baro=20000, baro_rate=2000), 0)
+
+  assert delta.should_write(northbound(1, alt_baro=22000, baro_rate=2000), MINUTE_MS) is False
+  assert delta.should_write(northbound(2, alt_baro=22000, baro_rate=0), 2 * MINUTE_MS) is True
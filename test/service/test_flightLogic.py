@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from models.aircraftModel import AircraftModel
 from services.flightLogic import FlightLogic
 
 
@@ -23,6 +24,7 @@ def mock_config():
     mock_config.DUPLICATION_AVOIDANCE_TTL = 5
     mock_config.MAX_ALTITUDE = 50000
     mock_config.MIN_ALTITUDE = 1000
+    mock_config.ROUTESET_CANDIDATE_LIMIT = 40
     mock_config.LOCATION_COORDINATES_DEFAULT = [41.8781, -87.6298]
     yield mock_config
 
@@ -46,7 +48,7 @@ def mock_time_utils():
 def make_flight(**overrides):
   flight = VALID_FLIGHT.copy()
   flight.update(overrides)
-  return flight
+  return AircraftModel.from_json(flight)
 
 
 def make_route_item(flight, plausible=True, airports=None):
@@ -155,7 +157,7 @@ def test_choose_flight_skips_routes_with_wrong_airport_count(mock_config, mock_g
 def test_choose_flight_filters_invalid_flights(mock_config, mock_geo_service, mock_time_utils):
   """Flights missing required fields should be filtered before selection."""
   logic = FlightLogic()
-  invalid_flight = {'hex': 'xyz'}  # missing lat, lon, flight, alt_baro, t
+  invalid_flight = AircraftModel.from_json({'hex': 'xyz'})  # missing lat, lon, flight, alt_baro, t
   valid_flight = make_flight()
 
   result_flight, result_route = logic.choose_flight(
@@ -169,7 +171,7 @@ def test_choose_flight_filters_invalid_flights(mock_config, mock_geo_service, mo
 def test_choose_flight_all_invalid_flights_returns_none(mock_config, mock_geo_service, mock_time_utils):
   """If all flights are invalid, should return (None, {})."""
   logic = FlightLogic()
-  invalid_flight = {'hex': 'xyz'}
+  invalid_flight = AircraftModel.from_json({'hex': 'xyz'})
 
   result_flight, result_route = logic.choose_flight(
     [invalid_flight],
@@ -178,3 +180,85 @@ def test_choose_flight_all_invalid_flights_returns_none(mock_config, mock_geo_se
 
   assert result_flight is None
   assert result_route == {}
+
+
+def test_choose_flight_requests_routes_closest_first(mock_config, mock_geo_service, mock_time_utils):
+  """Flights should be handed to the routeset lookup ordered by distance from home."""
+  logic = FlightLogic()
+  far = make_flight(hex='far', flight='AAL1', lat=42.5, lon=-88.5)
+  near = make_flight(hex='near', flight='UAL2', lat=41.88, lon=-87.63)
+  middle = make_flight(hex='mid', flight='DAL3', lat=42.0, lon=-87.8)
+  requested = []
+
+  def get_routeset(flights):
+    requested.extend(f.hex for f in flights)
+    return []
+
+  logic.choose_flight([far, near, middle], get_routeset_func=get_routeset)
+
+  assert requested == ['near', 'mid', 'far']
+
+
+def test_choose_flight_only_requests_routes_in_altitude_band(mock_config, mock_geo_service, mock_time_utils):
+  """Flights outside MIN_ALTITUDE/MAX_ALTITUDE should never be sent for a routeset lookup."""
+  logic = FlightLogic()
+  low = make_flight(hex='low', alt_baro=500)
+  high = make_flight(hex='high', alt_baro=60000)
+  cruising = make_flight(hex='cruise', alt_baro=35000)
+  requested = []
+
+  def get_routeset(flights):
+    requested.extend(f.hex for f in flights)
+    return []
+
+  logic.choose_flight([low, high, cruising], get_routeset_func=get_routeset)
+
+  assert requested == ['cruise']
+
+
+def test_choose_flight_limits_routeset_candidates_to_nearest(mock_config, mock_geo_service, mock_time_utils):
+  """Only the nearest ROUTESET_CANDIDATE_LIMIT flights should be sent for a routeset lookup."""
+  mock_config.ROUTESET_CANDIDATE_LIMIT = 2
+  logic = FlightLogic()
+  flights = [make_flight(hex=f'f{i}', lat=41.8781 + i * 0.1) for i in range(5)]
+  requested = []
+
+  def get_routeset(flights):
+    requested.extend(f.hex for f in flights)
+    return []
+
+  logic.choose_flight(list(reversed(flights)), get_routeset_func=get_routeset)
+
+  assert requested == ['f0', 'f1']
+
+
+def test_choose_flight_skips_routeset_call_when_no_candidates(mock_config, mock_geo_service, mock_time_utils):
+  """No routeset request should be made when nothing is inside the altitude band."""
+  logic = FlightLogic()
+  get_routeset = MagicMock(return_value=[])
+  low = make_flight(alt_baro=500)
+
+  result_flight, result_route = logic.choose_flight([low], get_routeset_func=get_routeset)
+
+  get_routeset.assert_not_called()
+  assert result_flight == low
+  assert result_route == {}
+
+
+def test_nearest_candidates_orders_by_distance(mock_config):
+  home = [41.8781, -87.6298]
+  flights = [make_flight(hex=f'f{i}', lat=41.8781 + i * 0.1) for i in (3, 1, 2)]
+
+  result = FlightLogic.nearest_candidates(flights, home, limit=10)
+
+  assert [f.hex for f in result] == ['f1', 'f2', 'f3']
+
+
+def test_choose_flight_rejects_placeholder_type(mock_config, mock_geo_service, mock_time_utils):
+  logic = FlightLogic()
+  flight = make_flight(t='N/A')
+
+  result_flight, result_route = logic.choose_flight([flight], MagicMock(return_value=[]))
+
+  assert result_flight is None
+  assert result_route == {}
@@ -0,0 +1,64 @@
+import json
+import pytest
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import services.geo as geo
+from services.geo import GeoService
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    GeoService._instance = None
+    yield
+    GeoService._instance = None
+
+
+@pytest.fixture
+def mock_config():
+    with patch('services.geo.config') as mc:
+        mc.APP_NAME = 'test_app'
+        mc.LOCATION_COORDINATES_OVERRIDE = []
+        mc.LOCATION_COORDINATES_DEFAULT = [41.8755616, -87.6244212]
+        mc.LOCATION_CACHE_TIMEOUT = 30
+        yield mc
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / 'geo_cache.json'
+    monkeypatch.setattr(geo, 'filepath', str(path))
+    return path
+
+
+def test_override_location_is_ready_immediately(mock_config, cache_file):
+    mock_config.LOCATION_COORDINATES_OVERRIDE = [39.77, -105.08]
+
+    service = GeoService()
+
+    assert service.wait_for_location(timeout=0) is True
+    assert service.location == [39.77, -105.08]
+
+
+def test_cached_location_is_ready_once_loaded(mock_config, cache_file):
+    with open(cache_file, 'w') as f:
+        json.dump({'location': [40.0, -88.0], 'timestamp': 1_000_000}, f)
+
+    with patch('services.geo.AuthenticationService'), \
+         patch('services.geo.TimeUtils') as mock_time:
+        mock_time.current_time_milli.return_value = 1_000_000
+        service = GeoService()
+        assert service.wait_for_location(timeout=5) is True
+
+    assert service.location == [40.0, -88.0]
+
+
+def test_location_is_ready_after_falling_back_to_default(mock_config, cache_file):
+    cache_file.write_text('not json')
+
+    with patch('services.geo.AuthenticationService'):
+        service = GeoService()
+        assert service.wait_for_location(timeout=5) is True
+
+    assert service.location == mock_config.LOCATION_COORDINATES_DEFAULT
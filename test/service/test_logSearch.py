@@ -0,0 +1,105 @@
+import pytest
+import json
+import sqlite3
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from services.logSearch import LogQuery, matches, search
+from services.sqliteLogBackend import SqliteLogBackend
+
+EXPIRES_AT = 2_000_000_000
+
+ITEMS = [
+    {'callsign': 'UAL12', 'timestamp': 1000, 'expires_at': EXPIRES_AT, 'r': 'N101', 't': 'B738', 'alt_baro': 35000},
+    {'callsign': 'UAL345', 'timestamp': 2000, 'expires_at': EXPIRES_AT, 'r': 'N102', 't': 'A320', 'alt_baro': 12000},
+    {'callsign': 'UAM1', 'timestamp': 3000, 'expires_at': EXPIRES_AT, 'r': 'N103', 't': 'B738', 'alt_baro': 8000},
+    {'callsign': 'DAL9', 'timestamp': 4000, 'expires_at': EXPIRES_AT, 'r': 'N104', 't': 'B738', 'alt_baro': 36000},
+    {'callsign': 'N12345', 'timestamp': 5000, 'expires_at': EXPIRES_AT, 'r': 'N12345', 't': 'C172'},
+]
+
+
+@pytest.fixture
+def sqlite_log(tmp_path):
+    path = str(tmp_path / 'log.db')
+    with patch('services.sqliteLogBackend.time') as mt:
+        mt.time.return_value = 0
+        backend = SqliteLogBackend(path)
+        backend.write(ITEMS)
+        backend.close()
+    return path
+
+
+@pytest.fixture
+def jsonl_log(tmp_path):
+    path = tmp_path / 'spill.jsonl'
+    path.write_text(''.join(json.dumps(item) + '\n' for item in ITEMS) + '\n')
+    return str(path)
+
+
+@pytest.fixture(params=['sqlite_log', 'jsonl_log'])
+def log(request):
+    return request.getfixturevalue(request.param)
+
+
+def callsigns(log, limit=None, **filters):
+    return [item['callsign'] for item in search(log, LogQuery(**filters), limit=limit)]
+
+
+def test_no_filters_returns_everything_in_time_order(log):
+    assert callsigns(log) == ['UAL12', 'UAL345', 'UAM1', 'DAL9', 'N12345']
+
+
+def test_callsign_is_a_prefix(log):
+    assert callsigns(log, callsign='UAL') == ['UAL12', 'UAL345']
+
+
+def test_callsign_prefix_ignores_case_and_whitespace(log):
+    assert callsigns(log, callsign=' ual3 ') == ['UAL345']
+
+
+def test_filters_by_registration(log):
+    assert callsigns(log, registration='n103') == ['UAM1']
+
+
+def test_filters_by_type(log):
+    assert callsigns(log, aircraft_type='B738') == ['UAL12', 'UAM1', 'DAL9']
+
+
+def test_time_range_is_inclusive_then_exclusive(log):
+    assert callsigns(log, since_ms=2000, until_ms=4000) == ['UAL345', 'UAM1']
+
+
+def test_altitude_band_excludes_entries_without_altitude(log):
+    assert callsigns(log, min_altitude=10000, max_altitude=35000) == ['UAL12', 'UAL345']
+
+
+def test_filters_combine(log):
+    assert callsigns(log, aircraft_type='B738', min_altitude=30000) == ['UAL12', 'DAL9']
+
+
+def test_limit_stops_early(log):
+    assert callsigns(log, limit=2) == ['UAL12', 'UAL345']
+
+
+def test_sqlite_results_leave_out_null_columns(sqlite_log):
+    result = next(search(sqlite_log, LogQuery(callsign='N12345')))
+    assert 'alt_baro' not in result
+    assert result['t'] == 'C172'
+
+
+def test_missing_log_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        search(str(tmp_path / 'log.db'), LogQuery())
+
+
+def test_file_that_is_not_a_database_raises_database_error(tmp_path):
+    path = tmp_path / 'log.json'
+    path.write_text(json.dumps([{'callsign': 'AAL1'}]))
+    with pytest.raises(sqlite3.DatabaseError):
+        list(search(str(path), LogQuery()))
+
+
+def test_matches_rejects_entry_missing_timestamp_when_time_filtered():
+    assert not matches({'callsign': 'UAL1'}, LogQuery(since_ms=0))
@@ -0,0 +1,104 @@
+import io
+import os
+import pytest
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from PIL import Image
+from services.logoAtlas import LogoAtlas, compile_logo_atlas, fit_logo
+
+def _png(size, colour, mode='RGB'):
+  buffer = io.BytesIO()
+  Image.new(mode, size, colour).save(buffer, format='PNG')
+  return buffer.getvalue()
+
+def _sources():
+  return {
+    1: {'UAL': _png((16, 16), (0, 0, 255)), 'default': _png((16, 16), (0, 0, 0))},
+    2: {'UAL': _png((32, 32), (0, 0, 200)), 'DAL': _png((32, 32), (255, 0, 0, 128), 'RGBA')},
+  }
+
+def test_compiled_atlas_returns_every_scale(tmp_path):
+  """Test that each logo is packed at every scale, from its own file when there is one"""
+  target = tmp_path / 'logos.atlas'
+
+  assert compile_logo_atlas(_sources(), str(target)) == 9
+
+  atlas = LogoAtlas(str(target))
+  assert len(atlas) == 9
+  ual_1x = atlas.get('UAL', 1)
+  assert ual_1x.mode == 'RGB'
+  assert ual_1x.size == (16, 16)
+  assert ual_1x.getpixel((0, 0)) == (0, 0, 255)
+  assert atlas.get('UAL', 2).getpixel((31, 31)) == (0, 0, 200)
+  assert atlas.get('default', 3).size == (48, 48)
+
+def test_missing_scales_are_resized_from_largest_file(tmp_path):
+  """Test that a logo with no file for a scale is resized from the largest one"""
+  target = tmp_path / 'logos.atlas'
+  compile_logo_atlas(_sources(), str(target))
+
+  atlas = LogoAtlas(str(target))
+  assert atlas.get('DAL', 1).size == (16, 16)
+  assert atlas.get('DAL', 1).getpixel((8, 8)) == (255, 0, 0)
+  assert atlas.get('UAL', 3).getpixel((24, 24)) == (0, 0, 200)
+
+def test_atlas_pixels_match_png_decode(tmp_path):
+  """Test that packed logos look the same as the PNGs converted to RGB"""
+  target = tmp_path / 'logos.atlas'
+  sources = _sources()
+  compile_logo_atlas(sources, str(target))
+
+  atlas = LogoAtlas(str(target))
+  expected = Image.open(io.BytesIO(sources[2]['DAL'])).convert('RGB')
+  assert atlas.get('DAL', 2).tobytes() == expected.tobytes()
+
+def test_unknown_logo_returns_none(tmp_path):
+  """Test that names and scales missing from the atlas return None"""
+  target = tmp_path / 'logos.atlas'
+  compile_logo_atlas(_sources(), str(target))
+
+  atlas = LogoAtlas(str(target))
+  assert atlas.get('AAL', 1) is None
+  assert atlas.get('UAL', 4) is None
+  assert atlas.get('TOOLONGNAME', 1) is None
+
+def test_compile_replaces_atlas_without_leaving_temporary_file(tmp_path):
+  """Test that rebuilding the atlas swaps the new file into place"""
+  target = tmp_path / 'logos.atlas'
+  compile_logo_atlas(_sources(), str(target))
+  compile_logo_atlas({1: {'AAL': _png((16, 16), (1, 2, 3))}}, str(target))
+
+  atlas = LogoAtlas(str(target))
+  assert atlas.get('AAL', 1).getpixel((0, 0)) == (1, 2, 3)
+  assert atlas.get('UAL', 1) is None
+  assert os.listdir(tmp_path) == ['logos.atlas']
+
+def test_rejects_files_that_are_not_atlases(tmp_path):
+  """Test that a file with the wrong header isn't mapped as an atlas"""
+  target = tmp_path / 'logos.atlas'
+  target.write_bytes(b'\x89PNG' + bytes(32))
+
+  with pytest.raises(ValueError):
+    LogoAtlas(str(target))
+
+def test_fit_logo_centres_non_square_logos_on_white():
+  """Test that logos that aren't square are scaled to fit and padded with white"""
+  image = fit_logo(Image.new('RGB', (64, 32), (0, 0, 255)), 16)
+
+  assert image.size == (16, 16)
+  assert image.getpixel((8, 0)) == (255, 255, 255)
+  assert image.getpixel((8, 8)) == (0, 0, 255)
+  assert image.getpixel((8, 15)) == (255, 255, 255)
+
+def test_is_older_than_compares_against_source_stamp(tmp_path):
+  """Test that the atlas notices a logo directory modified after it was built"""
+  target = tmp_path / 'logos.atlas'
+  logos = tmp_path / 'logos'
+  logos.mkdir()
+  mtime_ns = os.stat(logos).st_mtime_ns
+
+  compile_logo_atlas(_sources(), str(target), mtime_ns)
+  assert not LogoAtlas(str(target)).is_older_than(str(logos))
+
+  compile_logo_atlas(_sources(), str(target), mtime_ns - 1)
+  assert LogoAtlas(str(target)).is_older_than(str(logos))
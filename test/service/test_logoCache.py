@@ -0,0 +1,211 @@
+import json
+import logging
+import os
+import sys
+
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from PIL import Image
+
+import services.logoCache as logoCache
+from services.logoAtlas import compile_logo_atlas
+from services.logoCache import LogoCache
+
+
+LOGO_BYTES = 32 * 32 * 3
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    LogoCache._instance = None
+    yield
+    LogoCache._instance = None
+
+
+@pytest.fixture
+def logo_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'logos'
+    directory.mkdir()
+    for name, colour in [('default', (0, 0, 0, 255)), ('UAL', (0, 0, 255, 255)),
+                         ('AAL', (255, 0, 0, 255)), ('DAL', (0, 255, 0, 128))]:
+        Image.new('RGBA', (32, 32), colour).save(directory / f'{name}.png')
+    monkeypatch.setattr(logoCache, 'LOGO_DIR', str(directory))
+    monkeypatch.setattr(logoCache, 'ATLAS_FILE', str(tmp_path / 'logos.atlas'))
+    monkeypatch.setattr(logoCache, 'MISSING_LOGOS_DIR', str(tmp_path / 'missing_logos'))
+    monkeypatch.setattr(logoCache, 'MISSING_LOGOS_FILE', str(tmp_path / 'missing_logos' / 'missing_logos.json'))
+    yield tmp_path
+    # The loader thread outlives the test; let it finish before the paths are unpatched
+    if LogoCache._instance is not None:
+        LogoCache._instance.join()
+
+
+@pytest.fixture
+def mock_config():
+    with patch('services.logoCache.config') as mc:
+        mc.APP_NAME = 'test_app'
+        mc.LOGO_CACHE_MAX_BYTES = 10 * LOGO_BYTES
+        mc.LOGO_PRELOAD = []
+        yield mc
+
+
+@pytest.fixture
+def cache(logo_dir, mock_config):
+    cache = LogoCache()
+    cache.join()
+    return cache
+
+
+def read_missing(tmp_path):
+    with open(tmp_path / 'missing_logos' / 'missing_logos.json', 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def test_singleton_returns_same_instance(logo_dir, mock_config):
+    assert LogoCache() is LogoCache()
+
+
+def test_default_logo_is_loaded_at_startup(cache):
+    assert '' in cache
+    assert 'N/A' in cache
+    assert cache.get('').getpixel((0, 0)) == (0, 0, 0)
+
+
+def test_preload_decodes_configured_airlines(logo_dir, mock_config):
+    mock_config.LOGO_PRELOAD = ['UAL', 'AAL']
+    cache = LogoCache()
+    cache.join()
+
+    assert 'UAL' in cache and 'AAL' in cache
+    assert len(cache) == 2
+    assert cache.size_bytes == 2 * LOGO_BYTES
+
+
+def test_logos_are_cached_as_rgb(cache):
+    cache.prefetch('DAL')
+    cache.join()
+
+    image = cache.get('DAL')
+    assert image.mode == 'RGB'
+    assert image.getpixel((0, 0)) == (0, 255, 0)
+
+
+def test_miss_returns_none_and_loads_in_background(cache):
+    assert cache.get('UAL') is None
+    assert cache.misses == 1
+
+    cache.join()
+    assert cache.get('UAL').getpixel((0, 0)) == (0, 0, 255)
+    assert cache.hits == 1
+
+
+def test_get_never_reads_files(cache):
+    cache.prefetch('UAL')
+    cache.join()
+
+    with patch('services.logoCache.Image.open') as mock_open:
+        assert cache.get('UAL') is not None
+        assert cache.get('') is not None
+    mock_open.assert_not_called()
+
+
+def test_prefetch_skips_cached_and_queued_logos(cache):
+    with patch.object(cache, '_read', wraps=cache._read) as mock_read:
+        cache.prefetch('UAL')
+        cache.prefetch('UAL')
+        cache.join()
+        cache.prefetch('UAL')
+        cache.join()
+    assert mock_read.call_count == 1
+
+
+def test_evicts_least_recently_used_past_byte_limit(cache):
+    cache._max_bytes = 2 * LOGO_BYTES
+    for icao in ['UAL', 'AAL']:
+        cache.prefetch(icao)
+    cache.join()
+    cache.get('UAL')
+
+    cache.prefetch('DAL')
+    cache.join()
+
+    assert 'AAL' not in cache
+    assert 'UAL' in cache and 'DAL' in cache
+    assert cache.size_bytes == 2 * LOGO_BYTES
+
+
+def test_default_logo_is_never_evicted(cache):
+    cache._max_bytes = LOGO_BYTES
+    for icao in ['UAL', 'AAL', 'DAL']:
+        cache.prefetch(icao)
+    cache.join()
+
+    assert len(cache) == 1
+    assert '' in cache
+
+
+def test_missing_logo_falls_back_to_default_and_is_recorded_when_drawn(cache, logo_dir):
+    cache.prefetch('XYZ')
+    cache.join()
+    assert not os.path.exists(logo_dir / 'missing_logos')
+
+    assert cache.get('XYZ') is cache.get('')
+    cache.get('XYZ')
+    cache.join()
+    assert read_missing(logo_dir) == {'XYZ': 2}
+
+
+def build_atlas(logo_dir, names, source_mtime_ns=0):
+    sources = {}
+    for scale in (1, 2, 3):
+        sources[scale] = {}
+        for name in names:
+            with open(logo_dir / 'logos' / f'{name}.png', 'rb') as f:
+                sources[scale][name] = f.read()
+    compile_logo_atlas(sources, str(logo_dir / 'logos.atlas'), source_mtime_ns)
+
+
+def test_reads_logos_from_atlas_when_built(logo_dir, mock_config):
+    build_atlas(logo_dir, ['default', 'UAL'])
+    os.remove(logo_dir / 'logos' / 'UAL.png')
+
+    cache = LogoCache()
+    cache.prefetch('UAL')
+    cache.prefetch('XYZ')
+    cache.join()
+
+    assert cache.get('UAL').getpixel((0, 0)) == (0, 0, 255)
+    assert cache.get('XYZ') is cache.get('')
+
+
+def test_logos_added_after_atlas_was_built_are_read_from_png(logo_dir, mock_config):
+    build_atlas(logo_dir, ['default', 'UAL'])
+
+    cache = LogoCache()
+    cache.prefetch('AAL')
+    cache.join()
+
+    assert cache.get('AAL').getpixel((0, 0)) == (255, 0, 0)
+    assert not os.path.exists(logo_dir / 'missing_logos')
+
+
+def test_warns_when_atlas_is_older_than_logo_directory(logo_dir, mock_config):
+    build_atlas(logo_dir, ['default'], source_mtime_ns=1)
+
+    with patch.object(logging.getLogger(mock_config.APP_NAME), 'warning') as mock_warning:
+        LogoCache().join()
+
+    assert 'older than' in mock_warning.call_args.args[0]
+
+
+def test_record_missing_logo_creates_and_increments(logo_dir):
+    logoCache._record_missing_logo('ABC')
+    assert read_missing(logo_dir) == {'ABC': 1}
+
+    logoCache._record_missing_logo('ABC')
+    assert read_missing(logo_dir) == {'ABC': 2}
+
+    logoCache._record_missing_logo('DEF')
+    assert read_missing(logo_dir) == {'ABC': 2, 'DEF': 1}
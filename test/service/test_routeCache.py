@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from services.routeCache import RouteCache
+
+
+@pytest.fixture
+def mock_time():
+  with patch('services.routeCache.TimeUtils') as mock_time:
+    mock_time.current_time_milli.return_value = 0
+    yield mock_time
+
+
+def test_get_returns_stored_route(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=10)
+  route = {'callsign': 'AAL1'}
+  cache.put('AAL1', route)
+
+  assert cache.get('AAL1') is route
+
+
+def test_get_normalizes_callsign(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=10)
+  cache.put('AAL1   ', {'callsign': 'AAL1'})
+
+  assert cache.get('aal1') is not None
+
+
+def test_get_missing_returns_none(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=10)
+
+  assert cache.get('AAL1') is None
+
+
+def test_expired_entry_is_evicted(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=10)
+  cache.put('AAL1', {'callsign': 'AAL1'})
+
+  mock_time.current_time_milli.return_value = 30 * 60 * 1000
+
+  assert cache.get('AAL1') is None
+  assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=2)
+  cache.put('AAL1', {'callsign': 'AAL1'})
+  cache.put('UAL2', {'callsign': 'UAL2'})
+  cache.get('AAL1')
+  cache.put('DAL3', {'callsign': 'DAL3'})
+
+  assert cache.get('UAL2') is None
+  assert cache.get('AAL1') is not None
+  assert cache.get('DAL3') is not None
+
+
+def test_blank_callsign_is_not_cached(mock_time):
+  cache = RouteCache(ttl_minutes=30, max_entries=10)
+  cache.put('  ', {'callsign': ''})
+
+  assert len(cache) == 0
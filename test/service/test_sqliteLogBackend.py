@@ -0,0 +1,82 @@
+import pytest
+import sqlite3
+from decimal import Decimal
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from services.sqliteLogBackend import SqliteLogBackend
+
+NOW_S = 1_000_000
+
+
+def make_item(callsign='AAL1', timestamp=NOW_S * 1000, expires_at=NOW_S + 3600, **fields):
+    return {'callsign': callsign, 'timestamp': timestamp, 'timestamp_readable': '2001-09-09T01:46:40',
+            'expires_at': expires_at, **fields}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'tracker_log' / 'log.db')
+
+
+@pytest.fixture
+def backend(db_path):
+    with patch('services.sqliteLogBackend.time') as mt:
+        mt.time.return_value = NOW_S
+        backend = SqliteLogBackend(db_path)
+        yield backend
+    backend.close()
+
+
+def rows(db_path, query='SELECT callsign, timestamp FROM tracker_log ORDER BY timestamp'):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute(query).fetchall()
+
+
+def test_creates_database_directory(backend, db_path):
+    assert os.path.exists(db_path)
+
+
+def test_database_uses_wal_mode(backend, db_path):
+    assert rows(db_path, 'PRAGMA journal_mode') == [('wal',)]
+
+
+def test_write_inserts_batch(backend, db_path):
+    assert backend.write([make_item('AAL1', 1000), make_item('UAL2', 2000)]) is True
+    assert rows(db_path) == [('AAL1', 1000), ('UAL2', 2000)]
+
+
+def test_write_replaces_duplicate_key(backend, db_path):
+    backend.write([make_item('AAL1', 1000, alt_baro=30000)])
+    backend.write([make_item('AAL1', 1000, alt_baro=31000)])
+    assert rows(db_path, 'SELECT alt_baro FROM tracker_log') == [(31000,)]
+
+
+def test_write_stores_decimals_as_floats(backend, db_path):
+    backend.write([make_item(lat=Decimal('41.8781'), gs=Decimal('452'))])
+    assert rows(db_path, 'SELECT lat, gs FROM tracker_log') == [(41.8781, 452.0)]
+
+
+def test_write_leaves_missing_fields_null(backend, db_path):
+    backend.write([make_item(hex='abc')])
+    assert rows(db_path, 'SELECT hex, r, lat FROM tracker_log') == [('abc', None, None)]
+
+
+def test_write_prunes_expired_entries(backend, db_path):
+    backend.write([make_item('OLD1', 1000, expires_at=NOW_S - 1), make_item('NEW1', 2000)])
+    assert rows(db_path) == [('NEW1', 2000)]
+
+
+def test_prune_runs_at_most_once_per_interval(backend, db_path):
+    backend.write([make_item('NEW1', 1000)])
+    backend.write([make_item('OLD1', 2000, expires_at=NOW_S - 1)])
+    assert rows(db_path) == [('NEW1', 1000), ('OLD1', 2000)]
+
+
+def test_write_returns_false_on_error(backend):
+    backend.close()
+    with patch.object(backend.logger, 'error') as mock_error:
+        assert backend.write([make_item()]) is False
+    mock_error.assert_called_once()
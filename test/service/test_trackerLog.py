@@ -1,10 +1,15 @@
 import pytest
+import sqlite3
+import time
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
+from models.aircraftModel import AircraftModel
+from services.logBackend import LogBackend
+from services.sqliteLogBackend import SqliteLogBackend
 from services.trackerLog import TrackerLog, _floats_to_decimal
 
 NOW_MS = 1_000_000_000
@@ -25,6 +30,18 @@ def mock_config():
         mc.APP_NAME = 'test_app'
         mc.TRACKER_LOG_TTL_HOURS = TTL_HOURS
         mc.AWS_REGION = 'us-east-2'
+        mc.TRACKER_LOG_BACKEND = 'dynamodb'
+        mc.TRACKER_LOG_QUEUE_SIZE = 100
+        mc.TRACKER_LOG_BATCH_SIZE = 25
+        mc.TRACKER_LOG_FLUSH_SECONDS = 60
+        mc.TRACKER_LOG_MAX_RETRIES = 2
+        mc.TRACKER_LOG_RETRY_BASE_SECONDS = 0
+        mc.TRACKER_LOG_OVERFLOW = 'drop_oldest'
+        mc.TRACKER_LOG_SPILL_FILE = ''
+        mc.TRACKER_LOG_SPILL_MAX_MB = 50
+        mc.TRACKER_LOG_DELTA_MODE = False
+        mc.TRACKER_LOG_FIELDS = ['hex', 'r', 't', 'lat', 'lon', 'alt_baro', 'alt_geom', 'gs', 'track', 'baro_rate']
+        mc.TRACKER_LOG_DECIMALS = {'lat': 4, 'lon': 4, 'gs': 0, 'track': 0}
         yield mc
 
 
@@ -45,7 +62,8 @@ def mock_runtime():
 
 @pytest.fixture
 def mock_boto3():
-    with patch('services.trackerLog.boto3') as mb:
+    mb = MagicMock()
+    with patch.dict('sys.modules', {'boto3': mb}):
         yield mb
 
 
@@ -64,8 +82,15 @@ def test_singleton_returns_same_instance(mock_config, mock_runtime, mock_boto3):
 
 # --- __init__ ---
 
-def test_init_creates_dynamodb_resource_with_credentials(mock_config, mock_runtime, mock_boto3):
+def test_init_does_not_create_dynamodb_resource(mock_config, mock_runtime, mock_boto3):
     TrackerLog()
+    mock_boto3.resource.assert_not_called()
+    mock_runtime.assert_not_called()
+
+
+def test_table_creates_dynamodb_resource_with_credentials_on_first_use(tracker, mock_boto3):
+    tracker._backend.table
+    tracker._backend.table
     mock_boto3.resource.assert_called_once_with(
         'dynamodb',
         aws_access_key_id='fake_key',
@@ -74,69 +99,131 @@ def test_init_creates_dynamodb_resource_with_credentials(mock_config, mock_runti
     )
 
 
-def test_init_table_assigned_from_boto3(tracker, mock_boto3):
-    assert tracker._table is mock_boto3.resource.return_value.Table.return_value
+def test_table_is_assigned_from_boto3(tracker, mock_boto3):
+    assert tracker._backend.table is mock_boto3.resource.return_value.Table.return_value
+
+
+def test_batch_write_fails_cleanly_when_resource_cannot_be_created(tracker, mock_boto3):
+    mock_boto3.resource.side_effect = Exception('no credentials')
+    with patch.object(tracker.logger, 'error') as mock_error:
+        assert tracker._backend._batch_write([{'callsign': 'AAL1'}]) is False
+    mock_error.assert_called_once()
+
+
+def test_init_sqlite_backend_does_not_touch_aws(mock_config, mock_runtime, mock_boto3, tmp_path):
+    mock_config.TRACKER_LOG_BACKEND = 'sqlite'
+    mock_config.TRACKER_LOG_DB_FILE = str(tmp_path / 'log.db')
+    mock_config.TRACKER_LOG_PRUNE_MINUTES = 60
+    tracker = TrackerLog()
+    assert isinstance(tracker._backend, SqliteLogBackend)
+    mock_boto3.resource.assert_not_called()
+    mock_runtime.assert_not_called()
+    tracker._backend.close()
+
+
+
+def test_flush_and_close_write_queued_entries_to_sqlite(mock_config, mock_runtime, mock_boto3, mock_time, tmp_path):
+    mock_config.TRACKER_LOG_BACKEND = 'sqlite'
+    mock_config.TRACKER_LOG_DB_FILE = str(tmp_path / 'log.db')
+    mock_config.TRACKER_LOG_PRUNE_MINUTES = 60
+    # The backend prunes expired rows as it writes, so the entries need a current timestamp
+    mock_time.current_time_milli.return_value = time.time() * 1000
+    tracker = TrackerLog()
+
+    tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'}),
+                        AircraftModel.from_json({'flight': 'UAL2', 'hex': 'b'})])
+    with patch.object(tracker._backend, 'close', wraps=tracker._backend.close) as mock_close:
+        tracker.flush()
+        tracker.close()
+    mock_close.assert_called_once()
+
+    with sqlite3.connect(mock_config.TRACKER_LOG_DB_FILE) as connection:
+        callsigns = [row[0] for row in connection.execute('SELECT callsign FROM tracker_log ORDER BY callsign')]
+    assert callsigns == ['AAL1', 'UAL2']
+    assert tracker.stats['written'] == 2
+
+
+def test_backend_must_implement_write():
+    class NoWrite(LogBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWrite()
+
+def test_init_rejects_unknown_backend(mock_config, mock_runtime, mock_boto3):
+    mock_config.TRACKER_LOG_BACKEND = 'postgres'
+    with pytest.raises(ValueError):
+        TrackerLog()
 
 
 # --- update_log: callsign extraction ---
 
 def test_update_log_uses_flight_field(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'DAL456', 'hex': 'abc'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'DAL456', 'hex': 'abc'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['callsign'] == 'DAL456'
 
 
 def test_update_log_falls_back_to_r_field(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'r': 'N12345', 'hex': 'abc'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'r': 'N12345', 'hex': 'abc'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['callsign'] == 'N12345'
 
 
 def test_update_log_prefers_flight_over_r(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'r': 'N12345', 'hex': 'a'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'r': 'N12345', 'hex': 'a'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['callsign'] == 'AAL1'
 
 
 def test_update_log_strips_whitespace_from_callsign(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': '  UAL789  ', 'hex': 'abc'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': '  UAL789  ', 'hex': 'abc'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['callsign'] == 'UAL789'
 
 
 # --- update_log: timestamp and TTL ---
 
 def test_update_log_stamps_current_timestamp(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'SWA001', 'hex': 'def'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'SWA001', 'hex': 'def'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['timestamp'] == NOW_MS
 
 
 def test_update_log_sets_expires_at_in_epoch_seconds(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'hex': 'a'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['expires_at'] == EXPIRES_AT
 
 
 def test_update_log_expires_at_is_seconds_not_milliseconds(tracker, mock_time):
     # expires_at must be epoch seconds — if it were ms it would be ~1000x larger than NOW_MS/1000
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'hex': 'a'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'})])
+        tracker.flush()
     assert mock_write.call_args[0][0][0]['expires_at'] < NOW_MS
 
 
 def test_update_log_sets_readable_timestamp(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'hex': 'a'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'})])
+        tracker.flush()
     assert 'timestamp_readable' in mock_write.call_args[0][0][0]
 
 
 def test_update_log_same_expires_at_for_all_entries_in_batch(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
         tracker.update_log([
-            {'flight': 'AAL1', 'hex': 'a'},
-            {'flight': 'UAL2', 'hex': 'b'},
+            AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'}),
+            AircraftModel.from_json({'flight': 'UAL2', 'hex': 'b'}),
         ])
+        tracker.flush()
     items = mock_write.call_args[0][0]
     assert items[0]['expires_at'] == items[1]['expires_at']
 
@@ -144,34 +231,39 @@ def test_update_log_same_expires_at_for_all_entries_in_batch(tracker, mock_time)
 # --- update_log: invalid entries ---
 
 def test_update_log_skips_entry_with_no_identifier(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'hex': 'xyz'}])
-    assert mock_write.call_args[0][0] == []
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'hex': 'xyz'})])
+        tracker.flush()
+    mock_write.assert_not_called()
 
 
 def test_update_log_logs_warning_for_missing_identifier(tracker, mock_time):
-    with patch.object(tracker, '_batch_write'):
+    with patch.object(tracker._backend, '_batch_write'):
         with patch.object(tracker.logger, 'warning') as mock_warn:
-            tracker.update_log([{'hex': 'xyz'}])
+            tracker.update_log([AircraftModel.from_json({'hex': 'xyz'})])
+            tracker.flush()
     mock_warn.assert_called_once()
 
 
 def test_update_log_skips_entry_with_none_identifier(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': None, 'r': None, 'hex': 'xyz'}])
-    assert mock_write.call_args[0][0] == []
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': None, 'r': None, 'hex': 'xyz'})])
+        tracker.flush()
+    mock_write.assert_not_called()
 
 
 def test_update_log_logs_warning_for_none_identifier(tracker, mock_time):
-    with patch.object(tracker, '_batch_write'):
+    with patch.object(tracker._backend, '_batch_write'):
         with patch.object(tracker.logger, 'warning') as mock_warn:
-            tracker.update_log([{'flight': None, 'r': None, 'hex': 'xyz'}])
+            tracker.update_log([AircraftModel.from_json({'flight': None, 'r': None, 'hex': 'xyz'})])
+            tracker.flush()
     mock_warn.assert_called_once()
 
 
 def test_update_log_processes_valid_entries_after_invalid(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'hex': 'bad'}, {'flight': 'AAL1', 'hex': 'good'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'hex': 'bad'}), AircraftModel.from_json({'flight': 'AAL1', 'hex': 'good'})])
+        tracker.flush()
     items = mock_write.call_args[0][0]
     assert len(items) == 1
     assert items[0]['callsign'] == 'AAL1'
@@ -180,16 +272,18 @@ def test_update_log_processes_valid_entries_after_invalid(tracker, mock_time):
 # --- update_log: float conversion ---
 
 def test_update_log_converts_float_fields_to_decimal(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'lat': 41.85, 'lon': -87.65}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'lat': 41.85, 'lon': -87.65})])
+        tracker.flush()
     item = mock_write.call_args[0][0][0]
     assert isinstance(item['lat'], Decimal)
     assert isinstance(item['lon'], Decimal)
 
 
 def test_update_log_preserves_int_fields(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'alt_baro': 35000, 'hex': 'abc'}])
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'alt_baro': 35000, 'hex': 'abc'})])
+        tracker.flush()
     item = mock_write.call_args[0][0][0]
     assert item['alt_baro'] == 35000
     assert isinstance(item['alt_baro'], int)
@@ -198,18 +292,20 @@ def test_update_log_preserves_int_fields(tracker, mock_time):
 # --- update_log: batch ---
 
 def test_update_log_passes_all_valid_entries_to_batch_write(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
         tracker.update_log([
-            {'flight': 'AAL1', 'hex': 'a'},
-            {'flight': 'UAL2', 'hex': 'b'},
-            {'flight': 'DAL3', 'hex': 'c'},
+            AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'}),
+            AircraftModel.from_json({'flight': 'UAL2', 'hex': 'b'}),
+            AircraftModel.from_json({'flight': 'DAL3', 'hex': 'c'}),
         ])
+        tracker.flush()
     assert len(mock_write.call_args[0][0]) == 3
 
 
-def test_update_log_calls_batch_write_once_per_invocation(tracker, mock_time):
-    with patch.object(tracker, '_batch_write') as mock_write:
-        tracker.update_log([{'flight': 'AAL1', 'hex': 'a'}, {'flight': 'UAL2', 'hex': 'b'}])
+def test_update_log_batches_entries_into_one_write(tracker, mock_time):
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'}), AircraftModel.from_json({'flight': 'UAL2', 'hex': 'b'})])
+        tracker.flush()
     mock_write.assert_called_once()
 
 
@@ -217,28 +313,28 @@ def test_update_log_calls_batch_write_once_per_invocation(tracker, mock_time):
 
 def test_batch_write_calls_put_item_for_each_entry(tracker):
     items = [{'callsign': 'AAL1', 'timestamp': 1000}, {'callsign': 'UAL2', 'timestamp': 2000}]
-    tracker._batch_write(items)
-    batch = tracker._table.batch_writer.return_value.__enter__.return_value
+    tracker._backend._batch_write(items)
+    batch = tracker._backend.table.batch_writer.return_value.__enter__.return_value
     assert batch.put_item.call_count == 2
 
 
 def test_batch_write_passes_correct_item_to_put_item(tracker):
     item = {'callsign': 'AAL1', 'timestamp': 1000}
-    tracker._batch_write([item])
-    batch = tracker._table.batch_writer.return_value.__enter__.return_value
+    tracker._backend._batch_write([item])
+    batch = tracker._backend.table.batch_writer.return_value.__enter__.return_value
     batch.put_item.assert_called_once_with(Item=item)
 
 
 def test_batch_write_logs_error_on_exception(tracker):
-    tracker._table.batch_writer.side_effect = Exception('connection error')
+    tracker._backend.table.batch_writer.side_effect = Exception('connection error')
     with patch.object(tracker.logger, 'error') as mock_error:
-        tracker._batch_write([{'callsign': 'AAL1'}])
+        tracker._backend._batch_write([{'callsign': 'AAL1'}])
     mock_error.assert_called_once()
 
 
 def test_batch_write_does_not_raise_on_exception(tracker):
-    tracker._table.batch_writer.side_effect = Exception('connection error')
-    tracker._batch_write([{'callsign': 'AAL1'}])  # must not propagate
+    tracker._backend.table.batch_writer.side_effect = Exception('connection error')
+    tracker._backend._batch_write([{'callsign': 'AAL1'}])  # must not propagate
 
 
 # --- _floats_to_decimal ---
@@ -275,3 +371,123 @@ def test_floats_to_decimal_converts_float_in_list():
 def test_floats_to_decimal_handles_nested_dict():
     result = _floats_to_decimal({'outer': {'inner': 3.14}})
     assert isinstance(result['outer']['inner'], Decimal)
+
+
+# --- write-behind queue ---
+
+class ThrottledError(Exception):
+    response = {'Error': {'Code': 'ProvisionedThroughputExceededException'}}
+
+
+def test_update_log_does_not_write_on_calling_thread(tracker, mock_time):
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'})])
+        mock_write.assert_not_called()
+        assert tracker.stats['pending'] == 1
+
+
+def test_write_retries_throttled_batch(tracker):
+    batch = tracker._backend.table.batch_writer.return_value.__enter__.return_value
+    batch.put_item.side_effect = [ThrottledError(), ThrottledError(), None]
+    with patch.object(tracker.logger, 'error') as mock_error:
+        assert tracker._backend.write([{'callsign': 'AAL1'}]) is True
+    assert batch.put_item.call_count == 3
+    mock_error.assert_not_called()
+
+
+def test_write_gives_up_after_max_retries(tracker):
+    tracker._backend.table.batch_writer.side_effect = ThrottledError()
+    assert tracker._backend.write([{'callsign': 'AAL1'}]) is False
+    assert tracker._backend.table.batch_writer.call_count == 3
+
+
+def test_failed_batch_is_spilled_to_file(mock_config, mock_runtime, mock_boto3, mock_time, tmp_path):
+    spill_file = tmp_path / 'tracker_log' / 'spill.jsonl'
+    mock_config.TRACKER_LOG_SPILL_FILE = str(spill_file)
+    tracker = TrackerLog()
+    tracker._backend.table.batch_writer.side_effect = ThrottledError()
+
+    tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a', 'lat': 41.85})])
+    tracker.flush()
+
+    lines = spill_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert '"callsign": "AAL1"' in lines[0]
+    assert '"lat": 41.85' in lines[0]
+    assert tracker.stats['spilled'] == 1
+
+
+
+def test_spilling_stops_once_file_reaches_size_cap(mock_config, mock_runtime, mock_boto3, mock_time, tmp_path):
+    spill_file = tmp_path / 'spill.jsonl'
+    spill_file.write_text('x' * 2048)
+    mock_config.TRACKER_LOG_SPILL_FILE = str(spill_file)
+    mock_config.TRACKER_LOG_SPILL_MAX_MB = 1 / 1024
+    tracker = TrackerLog()
+    tracker._backend.table.batch_writer.side_effect = ThrottledError()
+
+    with patch.object(tracker.logger, 'warning') as mock_warning:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a'})])
+        tracker.flush()
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL2', 'hex': 'b'})])
+        tracker.flush()
+
+    assert spill_file.read_text() == 'x' * 2048
+    assert tracker.stats['spilled'] == 0
+    assert tracker.stats['dropped'] == 2
+    assert len([c for c in mock_warning.call_args_list if 'is full' in c.args[0]]) == 1
+
+
+# --- delta mode ---
+
+def test_delta_mode_suppresses_unchanged_aircraft(mock_config, mock_runtime, mock_boto3, mock_time):
+    mock_config.TRACKER_LOG_DELTA_MODE = True
+    mock_config.TRACKER_LOG_HEARTBEAT_MINUTES = 5
+    mock_config.TRACKER_LOG_POSITION_THRESHOLD = 1
+    mock_config.TRACKER_LOG_ALTITUDE_THRESHOLD = 500
+    mock_config.TRACKER_LOG_SPEED_THRESHOLD = 25
+    tracker = TrackerLog()
+    entry = AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a', 'lat': 41.85, 'lon': -87.65, 'alt_baro': 35000})
+
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([entry])
+        tracker.update_log([entry])
+        tracker.flush()
+
+    assert len(mock_write.call_args[0][0]) == 1
+    assert tracker.stats['suppressed'] == 1
+
+
+# --- field projection ---
+
+def test_update_log_writes_only_projected_fields(tracker, mock_time):
+    entry = AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a', 'r': '', 'lat': 41.878123, 'lon': -87.629812,
+                                     'gs': 452.37, 'track': 271.64, 'geom_rate': 64})
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([entry])
+        tracker.flush()
+    item = mock_write.call_args[0][0][0]
+    assert set(item) == {'hex', 'lat', 'lon', 'gs', 'track', 'callsign', 'timestamp', 'timestamp_readable', 'expires_at'}
+    assert item['lat'] == Decimal('41.8781')
+    assert item['lon'] == Decimal('-87.6298')
+    assert item['gs'] == Decimal('452')
+    assert item['track'] == Decimal('272')
+
+
+def test_update_log_writes_every_field_without_projection(mock_config, mock_runtime, mock_boto3, mock_time):
+    mock_config.TRACKER_LOG_FIELDS = None
+    tracker = TrackerLog()
+    with patch.object(tracker._backend, '_batch_write') as mock_write:
+        tracker.update_log([AircraftModel.from_json({'flight': 'AAL1', 'hex': 'a', 'lat': 41.878123})])
+        tracker.flush()
+    item = mock_write.call_args[0][0][0]
+    assert item['flight'] == 'AAL1'
+    assert item['lat'] == Decimal('41.878123')
+
+
+def test_unknown_projected_fields_are_ignored(mock_config, mock_runtime, mock_boto3, mock_time):
+    mock_config.TRACKER_LOG_FIELDS = ['hex', 'rssi']
+    with patch('services.trackerLog.logging.getLogger') as mock_get_logger:
+        tracker = TrackerLog()
+    mock_get_logger.return_value.warning.assert_called_once()
+    assert tracker._fields == ('hex',)
@@ -0,0 +1,139 @@
+import pytest
+import threading
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from services.writeBehindQueue import WriteBehindQueue
+
+
+@pytest.fixture(autouse=True)
+def mock_config():
+  with patch('services.writeBehindQueue.config') as mock_config:
+    mock_config.APP_NAME = 'test_app'
+    yield mock_config
+
+
+class StubSink:
+  '''Stands in for DynamoDB: records batches and can be told to fail.'''
+  def __init__(self, fail=False):
+    self.batches = []
+    self.fail = fail
+    self.written = threading.Event()
+
+  def write(self, batch):
+    if self.fail:
+      return False
+    self.batches.append(list(batch))
+    self.written.set()
+    return True
+
+
+def make_queue(sink, **kwargs):
+  kwargs.setdefault('max_items', 10)
+  kwargs.setdefault('batch_size', 3)
+  kwargs.setdefault('flush_seconds', 60)
+  return WriteBehindQueue(sink.write, **kwargs)
+
+
+def test_writer_sends_full_batch_without_waiting_for_timer():
+  sink = StubSink()
+  queue = make_queue(sink)
+
+  queue.put([1, 2, 3, 4])
+
+  assert sink.written.wait(timeout=2)
+  assert sink.batches[0] == [1, 2, 3]
+
+
+def test_writer_sends_partial_batch_after_flush_interval():
+  sink = StubSink()
+  queue = make_queue(sink, flush_seconds=0.05)
+
+  queue.put([1])
+
+  assert sink.written.wait(timeout=2)
+  assert sink.batches == [[1]]
+
+
+def test_flush_writes_everything_in_batches():
+  sink = StubSink()
+  queue = make_queue(sink)
+  queue.put([1, 2, 3, 4, 5])
+
+  queue.flush()
+
+  assert sorted(item for batch in sink.batches for item in batch) == [1, 2, 3, 4, 5]
+  assert all(len(batch) <= 3 for batch in sink.batches)
+  assert queue.stats['written'] == 5
+  assert queue.stats['pending'] == 0
+
+
+def test_drop_oldest_keeps_newest_items_when_full():
+  sink = StubSink()
+  queue = make_queue(sink, max_items=3, batch_size=10)
+
+  queue.put([1, 2, 3, 4, 5])
+  queue.flush()
+
+  assert sink.batches == [[3, 4, 5]]
+  assert queue.stats['dropped'] == 2
+
+
+def test_drop_newest_rejects_incoming_items_when_full():
+  sink = StubSink()
+  queue = make_queue(sink, max_items=3, batch_size=10, overflow='drop_newest')
+
+  queue.put([1, 2, 3, 4, 5])
+  queue.flush()
+
+  assert sink.batches == [[1, 2, 3]]
+  assert queue.stats['dropped'] == 2
+
+
+def test_spill_policy_spills_overflow():
+  sink = StubSink()
+  spilled = []
+  queue = make_queue(sink, max_items=3, batch_size=10, overflow='spill', spill=spilled.extend)
+
+  queue.put([1, 2, 3, 4, 5])
+
+  assert spilled == [4, 5]
+  assert queue.stats['spilled'] == 2
+
+
+def test_failed_batch_is_dropped_without_spill():
+  queue = make_queue(StubSink(fail=True))
+
+  queue.put([1, 2])
+  queue.flush()
+
+  assert queue.stats['dropped'] == 2
+  assert queue.stats['written'] == 0
+
+
+def test_items_refused_by_spill_are_dropped():
+  queue = make_queue(StubSink(fail=True), spill=lambda items: False)
+
+  queue.put([1, 2])
+  queue.flush()
+
+  assert queue.stats['dropped'] == 2
+  assert queue.stats['spilled'] == 0
+
+
+def test_exception_from_write_is_contained():
+  def write(batch):
+    raise ConnectionError('endpoint unreachable')
+
+  spilled = []
+  queue = WriteBehindQueue(write, max_items=10, batch_size=3, flush_seconds=60, spill=spilled.extend)
+  queue.put([1])
+  queue.flush()
+
+  assert spilled == [1]
+
+
+def test_spill_policy_requires_spill_function():
+  with pytest.raises(ValueError):
+    make_queue(StubSink(), overflow='spill')
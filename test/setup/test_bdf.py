@@ -0,0 +1,56 @@
+"""
+Tests for the BDF reader and the text measuring built on it.
+"""
+import glob
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from services.matrix_service import graphics
+from setup import fonts
+from setup.bdf import REPLACEMENT_CODEPOINT, load_bdf
+
+FONT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/fonts'))
+LOADED_FONTS = ['4x6', '5x8', '6x13', '6x13B', '7x13', '7x13B', '8x13', '8x13B']
+# The fonts setup/fonts.py loads, plain and in every scaled_Nx variant
+FONT_FILES = [f'{FONT_DIR}/{name}.bdf' for name in LOADED_FONTS] + sorted(
+    path for path in glob.glob(f'{FONT_DIR}/scaled_*x/*.bdf')
+    if os.path.basename(path).rsplit('_', 1)[0] in LOADED_FONTS)
+SAMPLE = [ord(ch) for ch in ' 0123456789.,:?-/ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'] + [0x2708]
+
+
+@pytest.mark.parametrize('path', FONT_FILES, ids=lambda path: os.path.relpath(path, FONT_DIR))
+def test_advances_match_loaded_font(path):
+    font = graphics.Font()
+    font.LoadFont(path)
+    parsed = load_bdf(path)
+
+    assert parsed.height == font.height
+    assert parsed.baseline == font.baseline
+    for codepoint in SAMPLE:
+        expected = font.CharacterWidth(codepoint)
+        if expected < 0:
+            expected = max(font.CharacterWidth(REPLACEMENT_CODEPOINT), 0)
+        assert parsed.advance(codepoint) == expected, chr(codepoint)
+
+
+def test_char_widths_match_draw_text():
+    with patch.object(fonts, '_BDF_FONTS', {}):
+        widths = fonts.char_widths(fonts.extrasmall, '123mi')
+    assert widths == [fonts.extrasmall.CharacterWidth(ord(ch)) for ch in '123mi']
+
+
+def test_text_width_sums_char_widths():
+    assert fonts.text_width(fonts.small, 'UAL1234') == sum(fonts.char_widths(fonts.small, 'UAL1234'))
+    assert fonts.text_width(fonts.small, '') == 0
+
+
+def test_bdf_is_parsed_once_per_font():
+    with patch.object(fonts, '_BDF_FONTS', {}), patch.object(fonts, 'load_bdf', wraps=load_bdf) as mock_load:
+        fonts.text_width(fonts.regular, 'ORD')
+        fonts.text_width(fonts.regular, 'DEN')
+    mock_load.assert_called_once()
@@ -120,14 +120,13 @@ def test_clock_scene_import(mock_matrix_modules):
 
 
 def test_flightdetails_scene_import(mock_matrix_modules):
-    """Test that scenes.flightdetails imports graphics from services.matrix_service correctly"""
+    """Test that scenes.flightdetails can be imported successfully"""
     with patch.dict(os.environ, {'MATRIX_MODE': 'emulator'}):
         with patch('builtins.open', side_effect=FileNotFoundError()):
             from scenes import flightdetails
             
-            # Verify the scene class exists and uses graphics
+            # Verify the scene class exists; it draws through Display.draw_text_sprite, not graphics
             assert hasattr(flightdetails, 'FlightDetailsScene')
-            assert hasattr(flightdetails, 'graphics')
 
 
 def test_date_scene_import(mock_matrix_modules):
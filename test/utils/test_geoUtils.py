@@ -0,0 +1,92 @@
+import math
+import random
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import utils.geoUtils as geoUtils
+from utils.geoUtils import GeoUtils
+
+HOME = [41.8755616, -87.6244212]
+
+
+# Reference implementations: the scalar math formerly inlined in FlightLogic
+def reference_distance_miles(lat1, lon1, home):
+  lat2, lon2 = home
+  phi1 = math.radians(lat1)
+  phi2 = math.radians(lat2)
+  delta_phi = math.radians(lat2 - lat1)
+  delta_lambda = math.radians(lon2 - lon1)
+  a = math.sin(delta_phi / 2.0) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2.0) ** 2
+  c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+  return 6371000 * c * 0.000621371
+
+
+def reference_bearing(lat, lon, home):
+  lat1, long1 = math.radians(home[0]), math.radians(home[1])
+  lat2, long2 = math.radians(lat), math.radians(lon)
+  bearing = math.atan2(
+    math.sin(long2 - long1) * math.cos(lat2),
+    math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(long2 - long1)
+  )
+  return (math.degrees(bearing) + 360) % 360
+
+
+def random_positions(count=1000):
+  rng = random.Random(1)
+  lats = [rng.uniform(-89, 89) for _ in range(count)]
+  lons = [rng.uniform(-180, 180) for _ in range(count)]
+  return lats, lons
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def kernel(request, monkeypatch):
+  if request.param == 'python':
+    monkeypatch.setattr(geoUtils, 'np', None)
+  elif geoUtils.np is None:
+    pytest.skip('NumPy not installed')
+  return request.param
+
+
+def test_distances_match_reference(kernel):
+  lats, lons = random_positions()
+
+  result = GeoUtils.distances_miles(lats, lons, HOME)
+
+  for lat, lon, miles in zip(lats, lons, result):
+    assert miles == pytest.approx(reference_distance_miles(lat, lon, HOME), rel=1e-9, abs=1e-6)
+
+
+def test_bearings_match_reference(kernel):
+  lats, lons = random_positions()
+
+  result = GeoUtils.bearings(lats, lons, HOME)
+
+  for lat, lon, degrees in zip(lats, lons, result):
+    assert 0 <= degrees < 360
+    assert degrees == pytest.approx(reference_bearing(lat, lon, HOME), abs=1e-9)
+
+
+def test_scalar_matches_reference():
+  lats, lons = random_positions(100)
+
+  for lat, lon in zip(lats, lons):
+    assert GeoUtils.distance_miles(lat, lon, HOME) == pytest.approx(reference_distance_miles(lat, lon, HOME))
+    assert GeoUtils.bearing(lat, lon, HOME) == pytest.approx(reference_bearing(lat, lon, HOME))
+
+
+def test_known_distance_chicago_to_new_york():
+  # O'Hare to JFK is roughly 740 statute miles
+  miles = GeoUtils.distance_miles(41.9786, -87.9048, [40.6413, -73.7781])
+
+  assert miles == pytest.approx(740, abs=5)
+
+
+def test_nearest_returns_closest_first_and_keeps_tie_order(kernel):
+  distances = [5.0, 1.0, 3.0, 1.0, 9.0]
+
+  assert list(GeoUtils.nearest(distances, 3)) == [1, 3, 2]
+
+
+def test_nearest_limit_larger_than_input(kernel):
+  assert list(GeoUtils.nearest([2.0, 1.0], 10)) == [1, 0]
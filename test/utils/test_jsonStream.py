@@ -0,0 +1,64 @@
+import io
+import json
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from utils.jsonStream import JsonStream
+
+
+def stream(document, chunk_size=7):
+  body = document if isinstance(document, bytes) else json.dumps(document).encode('utf-8')
+  return JsonStream(io.BytesIO(body).read, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 4096])
+def test_array_items_yields_every_element(chunk_size):
+  aircraft = [{'hex': 'a1', 'alt_baro': 35000, 'lat': 41.123456}, {'hex': 'b2', 'alt_baro': 'ground'}]
+
+  result = list(stream({'ac': aircraft, 'now': 1712345678.123}, chunk_size).array_items('ac'))
+
+  assert result == aircraft
+
+
+def test_array_items_finds_key_after_other_fields():
+  document = {'msg': 'No error', 'now': 1712345678.5, 'nested': {'ac': 'decoy'}, 'ac': [{'hex': 'a1'}]}
+
+  assert list(stream(document, 2).array_items('ac')) == [{'hex': 'a1'}]
+
+
+def test_array_items_does_not_truncate_numbers_split_across_chunks():
+  body = b'{"total": 1234567, "ac": [12345678901234, 5]}'
+
+  assert list(stream(body, 3).array_items('ac')) == [12345678901234, 5]
+
+
+def test_array_items_handles_multibyte_characters_split_across_chunks():
+  document = {'ac': [{'flight': 'КТК123'}]}
+  body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+
+  assert list(stream(body, 1).array_items('ac')) == document['ac']
+
+
+def test_array_items_empty_array():
+  assert list(stream({'ac': []}).array_items('ac')) == []
+
+
+def test_array_items_missing_key_raises_key_error():
+  with pytest.raises(KeyError):
+    list(stream({'msg': 'No error'}).array_items('ac'))
+
+
+def test_array_items_empty_object_raises_key_error():
+  with pytest.raises(KeyError):
+    list(stream({}).array_items('ac'))
+
+
+def test_array_items_invalid_json_raises():
+  with pytest.raises(json.JSONDecodeError):
+    list(stream(b'bad json').array_items('ac'))
+
+
+def test_array_items_truncated_body_raises():
+  with pytest.raises(json.JSONDecodeError):
+    list(stream(b'{"ac": [{"hex": "a1"}, {"hex": ').array_items('ac'))
@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from models.aircraftModel import AircraftModel
+from workers.overhead import Overhead, EMPTY_SNAPSHOT
+
+
+@pytest.fixture
+def overhead():
+  with patch('workers.overhead.AdsbTrackerService'), \
+       patch('workers.overhead.AirlineLookupService'), \
+       patch('workers.overhead.FlightLogic'), \
+       patch('workers.overhead.TrackerLog'), \
+       patch('workers.overhead.LogoCache'), \
+       patch('workers.overhead.GeoService') as mock_geo:
+    mock_geo.return_value.location = [41.8781, -87.6298]
+    yield Overhead()
+
+
+def test_snapshot_starts_empty(overhead):
+  assert overhead.snapshot is EMPTY_SNAPSHOT
+
+
+def test_poll_publishes_read_only_snapshot(overhead):
+  overhead._grab_data = MagicMock(return_value=[{'callsign': 'UAL123'}])
+
+  assert overhead._poll() is True
+
+  snapshot = overhead.snapshot
+  assert snapshot.sequence == 1
+  assert snapshot.data[0]['callsign'] == 'UAL123'
+  with pytest.raises(TypeError):
+    snapshot.data[0]['callsign'] = 'AAL1'
+
+
+def test_failed_fetch_publishes_empty_snapshot_and_reports_failure(overhead):
+  overhead._grab_data = MagicMock(side_effect=[[{'callsign': 'UAL123'}], None])
+  overhead._poll()
+
+  assert overhead._poll() is False
+  assert overhead.snapshot.sequence == 2
+  assert overhead.snapshot.data == ()
+
+
+def test_poll_waits_for_location_before_fetching(overhead):
+  overhead._geo_service.wait_for_location.side_effect = [False, False, True]
+  overhead._grab_data = MagicMock(return_value=[])
+
+  assert overhead._poll() is True
+  assert overhead._geo_service.wait_for_location.call_count == 3
+  overhead._grab_data.assert_called_once()
+  assert overhead._poller.failures == 0
+
+
+
+def test_stop_writes_queued_tracker_log_entries_before_closing(overhead):
+  calls = MagicMock()
+  overhead._poller = calls.poller
+  overhead._tracker_log = calls.tracker_log
+
+  overhead.stop()
+
+  assert [name for name, _, _ in calls.mock_calls] == ['poller.stop', 'tracker_log.flush', 'tracker_log.close']
+
+def test_poll_metrics_include_schedule_and_poller_state(overhead):
+  metrics = overhead.poll_metrics
+
+  assert metrics['interval'] == overhead._schedule.interval()
+  assert metrics['failures'] == 0
+  assert 'last_delay' in metrics
+
+
+
+def test_poll_logs_metrics_periodically(overhead):
+  overhead._grab_data = MagicMock(return_value=[])
+
+  with patch.object(overhead.logger, 'info') as mock_info, patch('workers.overhead.time') as mock_time:
+    for now in (0, 60, 15 * 60):
+      mock_time.monotonic.return_value = now
+      overhead._poll()
+
+  logged = [c.args[0] for c in mock_info.call_args_list if c.args[0].startswith('Poll metrics')]
+  assert len(logged) == 2
+  assert "'interval'" in logged[0] and "'last_delay'" in logged[0] and "'failures'" in logged[0]
+
+def test_grab_data_hands_flights_to_tracker_log(overhead):
+  flights = [AircraftModel(hex='abc', flight='UAL123')]
+  overhead._adsb_api.get_nearby_flights.return_value = flights
+  overhead._flight_logic.choose_flight.return_value = (None, {})
+
+  assert overhead._grab_data() == []
+  overhead._tracker_log.update_log.assert_called_once_with(flights)
+
+
+def test_grab_data_prefetches_logo_for_chosen_flight(overhead):
+  flight = AircraftModel(hex='abc', flight='UAL123', r='N123UA', t='B738', gs=420.0, alt_geom=34000)
+  airports = [{'iata': 'ORD', 'icao': 'KORD', 'lat': 41.97, 'lon': -87.90}, {'iata': 'SFO', 'icao': 'KSFO', 'lat': 37.62, 'lon': -122.38}]
+  route = {'airline_code': 'UAL', '_airports': airports}
+  overhead._adsb_api.get_nearby_flights.return_value = [flight]
+  overhead._flight_logic.choose_flight.return_value = (flight, route)
+  overhead._airline_lookup.lookup.return_value = 'UA'
+
+  with patch('workers.overhead.FlightLogic'):
+    data = overhead._grab_data()
+
+  assert data[0]['owner_icao'] == 'UAL'
+  overhead._logo_cache.prefetch.assert_called_once_with('UAL')
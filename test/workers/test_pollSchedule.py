@@ -0,0 +1,114 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from models.aircraftModel import AircraftModel
+from workers.pollSchedule import PollSchedule, night_mode_active
+
+
+@pytest.fixture(autouse=True)
+def mock_config():
+  with patch('workers.pollSchedule.config') as mock_config:
+    mock_config.APP_NAME = 'test_app'
+    mock_config.NIGHT_BRIGHTNESS = True
+    mock_config.NIGHT_START = '20:30'
+    mock_config.NIGHT_END = '07:00'
+    yield mock_config
+
+
+def make_schedule(night=False):
+  return PollSchedule(base=42, floor=15, ceiling=180, busy_aircraft=60, busy_turnover=0.3, is_night=lambda: night)
+
+
+def aircraft(*hexes):
+  return [AircraftModel(hex=h) for h in hexes]
+
+
+def test_interval_defaults_to_base_before_first_poll():
+  assert make_schedule().interval() == 42
+
+
+def test_interval_stays_at_base_with_normal_traffic():
+  schedule = make_schedule()
+  schedule.observe(aircraft(*[f'{i}' for i in range(20)]))
+  schedule.observe(aircraft(*[f'{i}' for i in range(20)]))
+
+  assert schedule.interval() == 42
+
+
+def test_interval_shortens_with_aircraft_count():
+  schedule = make_schedule()
+  schedule.observe(aircraft(*[f'{i}' for i in range(84)]))
+
+  assert schedule.interval() == pytest.approx(30)
+  assert schedule.metrics['reason'] == 'busy'
+
+
+def test_interval_shortens_with_turnover():
+  schedule = make_schedule()
+  schedule.observe(aircraft('a', 'b', 'c', 'd', 'e'))
+  schedule.observe(aircraft('a', 'f', 'g', 'h', 'i'))
+
+  assert schedule.metrics['turnover'] == 0.8
+  assert schedule.interval() == pytest.approx(15.75)
+
+
+def test_interval_is_clamped_to_floor():
+  schedule = make_schedule()
+  schedule.observe(aircraft(*[f'{i}' for i in range(1000)]))
+
+  assert schedule.interval() == 15
+
+
+def test_interval_uses_ceiling_when_sky_is_empty():
+  schedule = make_schedule()
+  schedule.observe([])
+
+  assert schedule.interval() == 180
+  assert schedule.metrics['reason'] == 'empty'
+
+
+def test_interval_uses_ceiling_at_night_even_when_busy():
+  schedule = make_schedule(night=True)
+  schedule.observe(aircraft(*[f'{i}' for i in range(200)]))
+
+  assert schedule.interval() == 180
+  assert schedule.metrics['night'] is True
+
+
+def test_busy_interval_changes_only_log_info_when_reason_changes():
+  schedule = make_schedule()
+  with patch.object(schedule.logger, 'info') as mock_info, patch.object(schedule.logger, 'debug') as mock_debug:
+    for count in (84, 90, 100, 20):
+      schedule.observe(aircraft(*[f'{i}' for i in range(count)]))
+      schedule.interval()
+
+  assert [c.args[0].split(' (')[1].split(',')[0] for c in mock_info.call_args_list] == ['busy', 'normal']
+  assert mock_debug.call_count == 2
+
+
+def test_metrics_report_chosen_interval():
+  schedule = make_schedule()
+  schedule.observe(aircraft('a', 'b'))
+  schedule.interval()
+
+  assert schedule.metrics == {'interval': 42, 'aircraft': 2, 'turnover': 0.0, 'night': False, 'reason': 'normal'}
+
+
+@pytest.mark.parametrize('now, expected', [
+  (datetime(2024, 1, 1, 23, 0), True),
+  (datetime(2024, 1, 1, 3, 0), True),
+  (datetime(2024, 1, 1, 7, 0), False),
+  (datetime(2024, 1, 1, 20, 29), False),
+  (datetime(2024, 1, 1, 20, 30), True),
+])
+def test_night_mode_active_follows_night_window(now, expected):
+  assert night_mode_active(now) is expected
+
+
+def test_night_mode_inactive_when_night_brightness_disabled(mock_config):
+  mock_config.NIGHT_BRIGHTNESS = False
+
+  assert night_mode_active(datetime(2024, 1, 1, 23, 0)) is False
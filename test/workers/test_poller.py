@@ -0,0 +1,96 @@
+import random
+import threading
+import pytest
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+from workers.poller import Poller
+
+
+@pytest.fixture(autouse=True)
+def mock_config():
+  with patch('workers.poller.config') as mock_config:
+    mock_config.APP_NAME = 'test_app'
+    yield mock_config
+
+
+def make_poller(poll=lambda: True, **kwargs):
+  kwargs.setdefault('interval', 42)
+  return Poller(poll, **kwargs)
+
+
+def test_next_delay_uses_interval_after_success():
+  poller = make_poller()
+
+  assert poller.next_delay(True) == 42
+
+
+def test_next_delay_reads_callable_interval():
+  intervals = iter([10, 20])
+  poller = make_poller(interval=lambda: next(intervals))
+
+  assert poller.next_delay(True) == 10
+  assert poller.next_delay(True) == 20
+
+
+def test_next_delay_backs_off_exponentially_up_to_max():
+  poller = make_poller(backoff_base=5, backoff_max=30)
+
+  assert [poller.next_delay(False) for _ in range(5)] == [5, 10, 20, 30, 30]
+  assert poller.failures == 5
+
+
+def test_success_resets_backoff():
+  poller = make_poller(backoff_base=5)
+  poller.next_delay(False)
+  poller.next_delay(False)
+
+  poller.next_delay(True)
+
+  assert poller.failures == 0
+  assert poller.next_delay(False) == 5
+
+
+def test_jitter_stays_within_fraction_of_delay():
+  poller = make_poller(jitter=0.1, rng=random.Random(7))
+
+  delays = [poller.next_delay(True) for _ in range(200)]
+
+  assert all(37.8 <= delay <= 46.2 for delay in delays)
+  assert len(set(delays)) > 1
+
+
+def test_thread_polls_repeatedly_until_stopped():
+  polled = threading.Semaphore(0)
+
+  def poll():
+    polled.release()
+    return True
+
+  poller = make_poller(poll, interval=0.01)
+  poller.start()
+  for _ in range(3):
+    assert polled.acquire(timeout=2)
+  poller.stop(timeout=2)
+
+  assert not poller._thread.is_alive()
+
+
+def test_exception_in_poll_counts_as_failure_and_keeps_thread_alive():
+  calls = []
+  done = threading.Event()
+
+  def poll():
+    calls.append(1)
+    if len(calls) == 1:
+      raise ConnectionError('no route to host')
+    done.set()
+    return True
+
+  poller = make_poller(poll, interval=0.01, backoff_base=0.01)
+  poller.start()
+
+  assert done.wait(timeout=2)
+  poller.stop(timeout=2)
+  assert len(calls) >= 2